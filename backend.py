@@ -1,119 +1,211 @@
-from flask import Flask, request, jsonify  # importa as classes/funções do Flask usadas no backend (servidor, acesso à requisição e resposta JSON). Se remover, qualquer uso de Flask, request ou jsonify vai dar erro NameError.
+from flask import Flask, Response, g, request, jsonify  # importa as classes/funções do Flask usadas no backend (servidor, acesso à requisição e resposta JSON). Se remover, qualquer uso de Flask, request ou jsonify vai dar erro NameError.
+import os                                  # lê configurações do servidor por variáveis de ambiente (ex: LU_CACHE_BYTES).
+import atexit                              # termina os processos de cálculo quando o servidor para.
+import json                                # serializa os eventos de progresso do fluxo SSE (/jobs/<id>/eventos).
+import math                                # valida limites numéricos (NaN/infinito) pedidos pelo cliente.
+import time                                # duração das requisições (métricas).
+from flask.json.provider import DefaultJSONProvider  # serialização JSON padrão do Flask, medida como etapa "serializacao".
 from flask_cors import CORS               # importa o CORS para liberar o acesso do front (HTML/JS) ao backend. Se remover, a função CORS não existirá e a linha CORS(app) vai quebrar.
-import math                                # importa o módulo math, usado nas funções numéricas (exp, log, cos etc.). Se remover, qualquer chamada math.alguma_coisa dará erro.
 
 # módulos auxiliares que você já tem:      # só comentário explicativo; removê-lo não muda nada no funcionamento.
 # - derivada.py  → função derivada_numerica(f, x)  # comentário; sem efeito no código.
+#                  (passo proporcional a x), derivada_richardson, gradiente e jacobiana_numerica
 # - eliminacao_gauss.py → funcoes eliminacao_gauss(matriz, usar_pivoteamento)  # comentário; sem efeito.
 #                          e verificar_solucao(matriz, solucao)
-from derivada import derivada_numerica     # importa a função derivada_numerica usada no método de Newton. Se remover, newton_raphson não vai funcionar (NameError ao chamar derivada_numerica).
-from eliminacao_gauss import eliminacao_gauss, verificar_solucao  # importa as funções de eliminação de Gauss e verificação de solução; se remover, a rota /gauss quebra ao tentar usá-las.
+# - expressao.py → compilar_funcao(funcao_str) (parse/validação única + cache LRU)
+#                   e compilar_derivada(funcao_str) → (f(x), f'(x)) por números duais
+# - bissecao.py → bissecao, brent, illinois, itp e resolver_intervalo(funcao_str, a, b, tol, max_iter, metodo)
+# - newton.py → newton_raphson(f, x_inicial, tolerancia, max_iteracoes)
+# - newton_sistema.py → newton_sistema(F, x0, ...) para sistemas F(x) = 0 (rota /newton-sistema)
+# - polinomio.py → coeficientes, Horner e todas as raízes de polinômios (rota /polinomio/raizes)
+# - tarefas.py → as chamadas dos métodos que rodam nos processos de cálculo (executor.py)
+from newton import newton_raphson          # método de Newton-Raphson (continua disponível como backend.newton_raphson).
+from bissecao import METODOS_INTERVALO     # nomes dos métodos com intervalo (Brent, Illinois, ITP); a rota /bissecao valida o pedido com eles.
+from fatoracao_lu import CacheLU            # cache das fatorações LU da rota /gauss/lu (a fatoração e as substituições rodam em tarefas.sistema_lu).
+import numpy as np                         # arrays usados nas rotas vetorizadas (lote, LU).
+from sistemas_esparsos import CAMPOS_FORMATO, FORMATOS, ordem_sistema, resolver_sistema_esparso  # sistemas esparsos/em banda (Thomas, banda, esparsa) para a rota /gauss.
+from metodos_iterativos import METODOS_ITERATIVOS, separar_sistema  # Jacobi, Gauss-Seidel, SOR e Gradiente Conjugado para a rota /gauss/iterativo.
+from executor import ExecutorSolvers, ErroExecutor, ServidorOcupado, TempoEsgotado  # processos de cálculo com tempo limite.
+import tarefas                             # funções executadas nos processos de cálculo (uma por rota).
+from trabalhos import FilaTrabalhos        # fila de trabalhos assíncronos das rotas /jobs.
+from cache_resultados import CacheResultados, chave_resultado  # resultados já calculados (mesma entrada → mesma saída).
+from limites import depende_do_relogio    # resultados cortados pelo limite de tempo não vão para o cache.
+from historico import MODOS_HISTORICO, n_padrao  # modos do histórico de iterações (/newton e /bissecao) e o n padrão de cada um.
+import metricas                            # métricas no formato do Prometheus (/metrics) e etapas de cada requisição.
+
+MAX_ITENS_LOTE = 10000                     # limite de problemas por requisição de lote (protege a memória do servidor).
+MAX_PONTOS_VARREDURA = 1_000_000           # limite de pontos da grade na varredura de raízes.
+MAX_PONTOS_HISTORICO = int(os.environ.get("MAX_PONTOS_HISTORICO", 100_000))  # pontos guardados no modo "ultimos" do histórico (buffer alocado de uma vez).
+MAX_INCOGNITAS_ESPARSA = int(os.environ.get("MAX_INCOGNITAS_ESPARSA", 1_000_000))  # n dos sistemas esparsos/em banda da rota /gauss.
+MAX_VARIAVEIS_SISTEMA = int(os.environ.get("MAX_VARIAVEIS_SISTEMA", 200))  # equações/variáveis da rota /newton-sistema.
+LIMITE_AVALIACOES = int(os.environ.get("LIMITE_AVALIACOES", 100_000))      # máximo de avaliações de f(x) por cálculo (o cliente pode pedir menos).
+LIMITE_TEMPO_METODO = float(os.environ.get("LIMITE_TEMPO_METODO", 10))     # segundos de cálculo antes de devolver o resultado parcial (abaixo do tempo limite do executor).
+
+cache_lu = CacheLU(int(os.environ.get("LU_CACHE_BYTES", 256 * 1024 * 1024)))  # fatorações LU já calculadas, por hash de A (orçamento de memória configurável).
+
+executor = ExecutorSolvers(               # os métodos rodam em processos separados: um cálculo pesado não trava as outras requisições.
+    processos=int(os.environ["SOLVER_PROCESSOS"]) if "SOLVER_PROCESSOS" in os.environ else None,  # cálculos simultâneos (padrão: número de núcleos; 0 = na própria thread).
+    tempo_limite=float(os.environ.get("SOLVER_TEMPO_LIMITE", 30)),   # segundos até o cálculo ser cancelado.
+    espera_maxima=float(os.environ.get("SOLVER_ESPERA_MAXIMA", 5)),  # segundos esperando um processo livre antes de responder 503.
+)
+atexit.register(executor.encerrar)
+NUCLEOS_POR_VAGA = max(1, (os.cpu_count() or 1) // max(1, executor.processos))  # núcleos de cada processo de cálculo (limite de threads do motor "blocado").
+
+cache_resultados = CacheResultados(       # resultados das tarefas por chave canônica da entrada (a mesma requisição não é recalculada).
+    limite_bytes=int(os.environ.get("RESULTADOS_CACHE_BYTES", 64 * 1024 * 1024)),  # memória máxima (0 desliga o nível em memória).
+    validade=float(os.environ.get("RESULTADOS_CACHE_TTL", 3600)),                   # segundos até um resultado expirar.
+    arquivo=os.environ.get("RESULTADOS_CACHE_ARQUIVO"),                              # banco SQLite do nível em disco (opcional).
+)
+
+registro = metricas.Registro({             # séries exportadas em /metrics (por processo do servidor).
+    "api_requisicoes_em_andamento": ("gauge", "Requisições sendo atendidas agora.", None),
+    "api_requisicao_segundos": ("histogram", "Duração das requisições por rota e status.", metricas.BALDES_SEGUNDOS),
+    "api_etapa_segundos": ("histogram", "Duração de cada etapa (leitura, compilar, metodo, serializacao...) por rota.",
+                           metricas.BALDES_SEGUNDOS),
+    "api_avaliacoes_funcao_total": ("counter", "Avaliações de f(x) feitas pelos métodos, por rota.", None),
+    "api_iteracoes": ("histogram", "Iterações por requisição, por rota.", metricas.BALDES_CONTAGEM),
+    "api_cache_resultados_total": ("counter", "Consultas ao cache de resultados por rota (acerto/falta).", None),
+})
+
+
+class ProvedorJSONMedido(DefaultJSONProvider):  # o mesmo JSON do Flask, com o tempo de serialização anotado na requisição.
+    def dumps(self, obj, **kwargs):
+        with metricas.etapa("serializacao"):
+            return super().dumps(obj, **kwargs)
+
 
 app = Flask(__name__)                      # cria a aplicação Flask (o servidor). Sem isso, não existe 'app' e nenhuma rota funciona.
-CORS(app)  # libera CORS para o front (index.html aberto no navegador)  # aplica o CORS à aplicação, permitindo que o front (rodando em file:// ou outro host) chame a API; se remover, o navegador pode bloquear as requisições por CORS.
+app.json = ProvedorJSONMedido(app)         # jsonify passa a medir a serialização (historico/etapas podem ser grandes).
+app.config["MAX_CONTENT_LENGTH"] = int(os.environ.get("MAX_TAMANHO_REQUISICAO", 256 * 1024 * 1024))  # tamanho máximo do corpo da requisição (bytes); acima disso responde 413.
+CORS(app, expose_headers=["Server-Timing"])  # libera CORS para o front (index.html aberto no navegador)  # aplica o CORS à aplicação, permitindo que o front (rodando em file:// ou outro host) chame a API; se remover, o navegador pode bloquear as requisições por CORS. Server-Timing: perfil pedido com X-Perfil.
 
-# =========================                # comentários de separação visual; sem impacto.
-# FUNÇÃO BISSEÇÃO (direto no backend)
 # =========================
-def bissecao(funcao_str, a, b, tol=1e-6, max_iter=100):  # define a função de bisseção que recebe a função em texto, intervalo [a,b], tolerância e máximo de iterações. Se remover essa função, a rota /bissecao não conseguirá calcular a raiz.
-    """
-    Método da Bisseção:
-    - funcao_str: string com f(x), ex: "x**3 - x - 1"
-    - a, b: limites do intervalo [a, b]
-    - tol: tolerância
-    - max_iter: número máximo de iterações
-
-    Retorna:
-      - raiz (float) se der certo
-      - None se f(a) e f(b) não tiverem sinais opostos
-    """
-    # docstring explicando a função; se remover, o código continua funcionando normalmente (é só documentação).
-
-    def f(x):                               # define uma função interna f(x) que avalia a expressão que o usuário enviou. Se remover, não tem como calcular f(a), f(b) e f(c).
-        contexto = {                        # cria um dicionário com as variáveis e funções permitidas dentro do eval. Sem isso, a expressão do usuário não teria acesso a math, e, pi, etc.
-            "x": x,                         # disponibiliza a variável x dentro da expressão; sem isso, qualquer expressão que use x não funcionaria.
-            "math": math,                   # permite usar math.alguma_coisa na expressão, se o usuário quiser.
-            "e": math.e,                    # permite usar a constante 'e' diretamente; sem isso, 'e' não seria reconhecido.
-            "pi": math.pi,                  # permite usar pi diretamente.
-            "sin": math.sin,                # atalho para sin(x); sem isso, a expressão que usar sin vai falhar.
-            "cos": math.cos,                # idem para cos(x).
-            "tan": math.tan,                # idem para tan(x).
-            "log": math.log,   # log natural # permite usar log(x) como ln(x).
-            "exp": math.exp,                # permite exp(x) = e**x.
-            "sqrt": math.sqrt,              # permite raiz quadrada.
-            "log10": math.log10,            # permite log10(x).
-        }
-        return eval(funcao_str, {"__builtins__": {}}, contexto)  # avalia a string da função com um ambiente “seguro” (sem builtins) e o contexto definido. Se remover, a função não calcula nada e a bisseção não funciona.
-
-    fa = f(a)                               # calcula f(a) no começo do algoritmo. Se remover, a condição de sinal e o laço não têm o valor de f(a).
-    fb = f(b)                               # calcula f(b). Se remover, mesma coisa: a condição de existência de raiz não funciona.
-
-    # condição de existência de raiz (mudança de sinal)
-    if fa * fb >= 0:                        # verifica se f(a) e f(b) têm sinais opostos (produto < 0). Se remover, o método pode rodar em intervalos sem raiz ou com duas raízes, o que quebra a lógica.
-        return None                         # se não tiver mudança de sinal, retorna None indicando erro. Sem esse return, cairia no laço e poderia dar resultados errados.
-
-    for _ in range(1, max_iter + 1):        # laço que faz até max_iter iterações da bisseção. Se remover, o algoritmo nunca itera.
-        c = (a + b) / 2                     # calcula o ponto médio do intervalo. Sem isso, não teria o novo candidato à raiz.
-        fc = f(c)                           # calcula f(c). Sem isso, não consegue testar critério de parada nem atualizar o intervalo.
-
-        # critério de parada
-        if abs(fc) < tol or (b - a) / 2 < tol:  # verifica se f(c) está próximo de zero ou se o intervalo ficou suficientemente pequeno. Se remover, o método só pararia quando estourar max_iter.
-            return c                        # retorna a raiz aproximada se o critério de parada for atingido. Se remover, o método não retorna quando deveria.
-
-        # atualiza intervalo
-        if fa * fc < 0:                     # se a raiz está entre a e c (mudança de sinal), atualiza o limite superior.
-            b = c                           # novo limite superior passa a ser c.
-            fb = fc                         # f(b) passa a ser f(c); sem isso, os testes seguintes usam valores velhos.
-        else:
-            a = c                           # caso contrário, a raiz está entre c e b, então atualiza o limite inferior.
-            fa = fc                         # f(a) também passa a ser f(c).
-
-    # se estourar o número máximo de iterações,
-    # devolve o meio do último intervalo
-    return (a + b) / 2                      # caso o laço termine sem atingir o critério de parada, retorna o meio do último intervalo como aproximação. Se remover, a função poderia terminar sem retorno (erro).
+# MÉTRICAS E PERFIL DAS REQUISIÇÕES
+# =========================
+@app.before_request
+def iniciar_medicao():                     # abre o coletor de etapas da requisição e lê o JSON (etapa "leitura").
+    g.inicio = time.perf_counter()
+    g.coletor, g.coletor_anterior = metricas.abrir_coletor()
+    registro.ajustar("api_requisicoes_em_andamento", 1)
+    if request.is_json:
+        with metricas.etapa("leitura"):
+            request.get_json(silent=True)  # fica guardado: o request.get_json() da rota não lê de novo.
+
+
+@app.after_request
+def registrar_medicao(resposta):           # duração, etapas e contagens da requisição; com "X-Perfil: 1", devolve o perfil em Server-Timing.
+    coletor = g.get("coletor")
+    if coletor is None:
+        return resposta
+    total = time.perf_counter() - g.inicio
+    rota = request.url_rule.rule if request.url_rule else "desconhecida"  # modelo da rota (sem ids): poucas séries.
+    registro.observar("api_requisicao_segundos", total, rota=rota, status=resposta.status_code)
+    for nome, segundos in coletor["etapas"].items():
+        registro.observar("api_etapa_segundos", segundos, rota=rota, etapa=nome)
+    contadores = coletor["contadores"]
+    if "avaliacoes" in contadores:
+        registro.contar("api_avaliacoes_funcao_total", contadores["avaliacoes"], rota=rota)
+    if "iteracoes" in contadores:
+        registro.observar("api_iteracoes", contadores["iteracoes"], rota=rota)
+    for resultado in ("acerto", "falta"):
+        if f"cache_{resultado}" in contadores:
+            registro.contar("api_cache_resultados_total", contadores[f"cache_{resultado}"], rota=rota, resultado=resultado)
+    if request.headers.get("X-Perfil", "").lower() in ("1", "true", "sim"):
+        resposta.headers["Server-Timing"] = metricas.server_timing(coletor, total)
+    return resposta
+
+
+@app.teardown_request
+def encerrar_medicao(erro):                # sempre roda (inclusive com exceção): fecha o coletor e a contagem em andamento.
+    if "coletor" in g:
+        metricas.fechar_coletor(g.coletor_anterior)
+        registro.ajustar("api_requisicoes_em_andamento", -1)
+
+
+@app.route("/metrics", methods=["GET"])   # métricas no formato texto do Prometheus.
+def api_metricas():
+    lu = cache_lu.estatisticas()
+    resultados = cache_resultados.estatisticas()
+    extras = [                             # lidos na hora dos objetos que já contam.
+        ("cache_resultados_consultas_total", "counter", "Consultas ao cache de resultados por nível e resultado.", [
+            ({"resultado": "acerto", "nivel": "memoria"}, resultados["acertos_memoria"]),
+            ({"resultado": "acerto", "nivel": "disco"}, resultados["acertos_disco"]),
+            ({"resultado": "falta"}, resultados["faltas"]),
+        ]),
+        ("cache_resultados_bytes", "gauge", "Memória usada pelo cache de resultados.", [({}, resultados["bytes_usados"])]),
+        ("cache_lu_consultas_total", "counter", "Consultas ao cache de fatorações LU.", [
+            ({"resultado": "acerto"}, lu["acertos"]),
+            ({"resultado": "falta"}, lu["faltas"]),
+        ]),
+        ("cache_lu_bytes", "gauge", "Memória usada pelo cache de fatorações LU.", [({}, lu["bytes_usados"])]),
+        ("executor_vagas_livres", "gauge", "Processos de cálculo livres.", [({}, executor.livres())]),
+        ("executor_cancelados_total", "counter", "Cálculos cancelados por tempo esgotado.", [({}, executor.canceladas)]),
+    ]
+    return Response(registro.texto(extras), mimetype="text/plain; version=0.0.4")
 
 # =========================
-# MÉTODO DE NEWTON-RAPHSON
+# PROCESSOS DE CÁLCULO
 # =========================
-def newton_raphson(f, x_inicial, tolerancia=0.0001, max_iteracoes=10):  # define a função do método de Newton-Raphson; recebe f(x), chute inicial, tolerância e número máximo de iterações. Se remover, a rota /newton não tem como calcular nada.
-    x = x_inicial                        # inicializa x com o valor inicial dado pelo usuário. Se remover, x não teria valor definido.
-    iteracoes = 0                        # contador de iterações começa em 0. Se remover, o while não controla o número de passos corretamente.
-    historico = [x]                      # guarda o primeiro valor de x no histórico. Se remover, você perde o registro dos valores usados.
-
-    while iteracoes < max_iteracoes:     # laço que repete enquanto não atingir o máximo de iterações. Se remover, Newton não faria iterações.
-        fx = f(x)                        # calcula f(x) no ponto atual. Sem isso, não tem como aplicar a fórmula de Newton.
-        dx = derivada_numerica(f, x)     # calcula a derivada numérica em x. Se remover, não há dx pra dividir e a fórmula não funciona.
-
-        if abs(dx) < 1e-10:              # verifica se a derivada está muito próxima de zero (risco de divisão por zero). Se remover, pode dividir por um número quase zero e explodir numericamente.
-            return {
-                "raiz": x,
-                "iteracoes": iteracoes,
-                "convergiu": False,
-                "historico": historico,
-                "mensagem": "Derivada muito próxima de zero"
-            }                            # retorna um dicionário indicando que não convergiu por causa da derivada quase zero. Se remover esse return, o código continuaria e poderia dar erro.
-
-        x_novo = x - fx / dx             # fórmula de Newton-Raphson para calcular a próxima aproximação. Se remover, x nunca é atualizado.
-        historico.append(x_novo)         # adiciona o novo x no histórico. Se remover, você perde esse valor no registro.
-
-        if abs(x_novo - x) < tolerancia:  # critério de parada: se a diferença entre x_novo e x for menor que a tolerância. Se remover, o método só pararia quando estourar o número de iterações.
-            return {
-                "raiz": x_novo,
-                "iteracoes": iteracoes + 1,
-                "convergiu": True,
-                "historico": historico
-            }                            # retorna o resultado quando converge. Se remover, o laço continuaria mesmo já tendo solução boa.
-
-        x = x_novo                       # atualiza x para o novo valor e segue a próxima iteração. Se remover, x fica preso no mesmo valor e o método entra em loop ou não converge.
-        iteracoes += 1                   # incrementa o contador de iterações. Se remover, o while nunca atinge o limite e pode entrar em loop infinito.
-
-    return {
-        "raiz": x,
-        "iteracoes": iteracoes,
-        "convergiu": False,
-        "historico": historico,
-        "mensagem": "Não convergiu no número máximo de iterações"
-    }                                    # caso o laço termine por atingir o máximo de iterações, retorna o melhor x encontrado e indica que não convergiu totalmente. Se remover, a função pode acabar sem retorno.
+def calcular(data, funcao, *args, usar_cache=True):  # roda funcao(*args) num processo de cálculo; o cliente pode pedir um tempo limite menor em "tempo_limite" (segundos).
+    usar_cache = usar_cache and data.get("cache", True) is not False  # "cache": false força o recálculo.
+    if usar_cache:
+        with metricas.etapa("cache"):
+            chave = chave_resultado(funcao.__name__, args)
+            achou, resultado = cache_resultados.obter(chave)
+        metricas.anotar("cache_acerto" if achou else "cache_falta")
+        if achou:
+            return resultado               # acerto: não ocupa um processo de cálculo.
+
+    tempo_limite = data.get("tempo_limite")
+    resultado = executor.executar(
+        funcao, *args,
+        tempo_limite=None if tempo_limite is None else float(tempo_limite),
+        ao_progredir=g.get("ao_progredir"),  # só definido quando a rota roda como trabalho assíncrono (/jobs).
+    )
+    if usar_cache and not depende_do_relogio(resultado):
+        cache_resultados.guardar(chave, resultado)  # só resultados; erros (exceções) não são guardados.
+    return resultado
+
+
+def ler_limites(data):                     # limites do cálculo pedidos pelo cliente, sem passar dos do servidor; ValueError/TypeError se inválidos.
+    max_avaliacoes = data.get("max_avaliacoes", LIMITE_AVALIACOES)
+    tempo_maximo = float(data.get("tempo_maximo", LIMITE_TEMPO_METODO))
+    if (isinstance(max_avaliacoes, float) and not math.isfinite(max_avaliacoes)) or not math.isfinite(tempo_maximo):
+        raise ValueError("max_avaliacoes e tempo_maximo precisam ser números finitos")  # NaN passaria pelo min() e desligaria o limite.
+    max_avaliacoes = min(int(max_avaliacoes), LIMITE_AVALIACOES)
+    tempo_maximo = min(tempo_maximo, LIMITE_TEMPO_METODO)
+    if max_avaliacoes < 1 or tempo_maximo <= 0:
+        raise ValueError("max_avaliacoes e tempo_maximo precisam ser positivos")
+    return max_avaliacoes, tempo_maximo
+
+
+def ler_historico(data, max_iter, padrao):  # modo do histórico de iterações ("historico") e seu n ("historico_n"); ValueError/TypeError se inválidos.
+    modo = str(data.get("historico", padrao))  # "nenhum", "ultimos" (n últimos), "amostrado" (um a cada n) ou "completo".
+    if modo not in MODOS_HISTORICO:
+        raise ValueError(f"historico deve ser um de: {', '.join(MODOS_HISTORICO)}")
+    if modo not in ("ultimos", "amostrado"):
+        return modo, None
+    n = int(data.get("historico_n", n_padrao(modo, max_iter)))  # padrão: cerca de 32 pontos.
+    if n < 1:
+        raise ValueError("historico_n precisa ser pelo menos 1")
+    if modo == "ultimos":                  # o buffer é alocado inteiro: nunca mais pontos do que as iterações registram, nem que o limite do servidor.
+        n = min(n, max_iter + 1, MAX_PONTOS_HISTORICO)
+    return modo, n
+
+
+@app.errorhandler(ServidorOcupado)        # todos os processos ocupados: o cliente deve tentar de novo.
+def erro_servidor_ocupado(e):
+    return jsonify({"erro": str(e)}), 503
+
+
+@app.errorhandler(TempoEsgotado)          # cálculo cancelado por passar do tempo limite.
+def erro_tempo_esgotado(e):
+    return jsonify({"erro": str(e)}), 504
+
+
+@app.errorhandler(413)                    # corpo maior que MAX_CONTENT_LENGTH.
+def erro_requisicao_grande(e):
+    return jsonify({"erro": f"Requisição maior que o limite de {app.config['MAX_CONTENT_LENGTH']} bytes."}), 413
 
 # =========================
 # ROTA NEWTON
@@ -127,50 +219,113 @@ def api_newton():                       # função que será executada quando o
 
     try:
         funcao_str = data["funcao"]     # pega a string da função f(x) do JSON. Se remover, a função não será definida.
-        x0 = float(data["x0"])          # pega o valor inicial x0 e converte para float. Se remover, x0 não existe pro Newton.
+        metodo = str(data.get("metodo", "newton"))  # "newton" (padrão) ou "hibrido" (Newton protegido por bisseção no intervalo [a, b]).
+        if metodo == "hibrido":
+            a, b = float(data["a"]), float(data["b"])  # intervalo com mudança de sinal, como na rota /bissecao.
+            x0 = float(data["x0"]) if data.get("x0") is not None else None  # opcional: sem x0, começa no ponto médio.
+        else:
+            a = b = None
+            x0 = float(data["x0"])      # pega o valor inicial x0 e converte para float. Se remover, x0 não existe pro Newton.
         tolerancia = float(data.get("tolerancia", 0.0001))  # lê a tolerância ou usa 0.0001 se não vier; se remover, sempre teria que usar um valor fixo ou dar erro.
-        max_iter = int(data.get("max_iter", 10))            # lê max_iter ou usa 10 por padrão. Se remover, não controla o máximo de iterações.
+        max_iter = int(data.get("max_iter", 100 if metodo == "hibrido" else 10))  # lê max_iter ou usa 10 por padrão (100 no híbrido, como na bisseção). Se remover, não controla o máximo de iterações.
+        derivada = str(data.get("derivada", "automatica"))  # "automatica" (números duais, padrão) ou "numerica" (diferença central).
+        max_avaliacoes, tempo_maximo = ler_limites(data)    # limites de avaliações de f e de tempo; ao atingir, devolve o resultado parcial.
+        historico, historico_n = ler_historico(data, max_iter, "completo")  # histórico dos x: completo por padrão (como antes).
     except (KeyError, TypeError, ValueError) as e:          # captura erros caso algum campo falte ou seja inválido.
         return jsonify({
             "erro": "Dados inválidos no corpo da requisição.",
             "detalhe": str(e)
         }), 400                      # retorna erro 400 dizendo que os dados são inválidos. Se remover o try/except, o servidor cai com erro 500 em vez de responder bonito.
 
-    contexto = {                     # dicionário com funções e constantes matemáticas disponíveis para montar a função f(x).
-        "math": math,
-        "e": math.e,
-        "pi": math.pi,
-        "sin": math.sin,
-        "cos": math.cos,
-        "tan": math.tan,
-        "exp": math.exp,
-        "log": math.log,
-        "sqrt": math.sqrt,
-    }                                # se remover esse contexto, a expressão da função não teria acesso a essas funções/constantes.
-
-    # monta a função f(x) a partir do texto
-    try:
-        ambiente = {"__builtins__": {}}  # cria um ambiente sem built-ins por segurança. Se remover, o eval teria acesso a funções perigosas.
-        ambiente.update(contexto)        # adiciona o contexto de funções matemáticas nesse ambiente. Se remover, a expressão não conhece sin, cos, etc.
-        f = eval(f"lambda x: {funcao_str}", ambiente)  # cria dinamicamente uma função lambda x: <expressão do usuário>. Se remover, não há f para passar ao Newton.
-        f(1.0)  # teste rápido              # testa a função com x=1 pra garantir que a sintaxe é válida. Se remover, erros de expressão só vão aparecer dentro do Newton.
-    except Exception as e:                  # captura qualquer erro de sintaxe ou execução da função.
-        return jsonify({"erro": f"Erro ao interpretar a função: {e}"}), 400  # se der erro, responde com JSON de erro. Sem esse try, o servidor cai com 500.
+    if derivada not in ("automatica", "numerica"):
+        return jsonify({"erro": "Use derivada 'automatica' ou 'numerica'."}), 400
+
+    if metodo not in tarefas.METODOS_NEWTON:
+        return jsonify({"erro": f"Método desconhecido: {metodo}. Use um de: {', '.join(tarefas.METODOS_NEWTON)}."}), 400
 
     try:
-        resultado = newton_raphson(f, x0, tolerancia, max_iter)  # chama o método de Newton-Raphson com os parâmetros convertidos. Se remover, a rota não calcula nada.
+        resultado, derivada = calcular(data, tarefas.newton, funcao_str, x0, tolerancia, max_iter, derivada,
+                                        max_avaliacoes, tempo_maximo, historico, historico_n, metodo, a, b)  # compila f(x) (derivada automática, com fallback para a numérica) e roda o Newton num processo de cálculo.
+    except ErroExecutor:
+        raise                               # respondido pelos errorhandlers (503/504).
+    except tarefas.ErroFuncao as e:         # erro de sintaxe ou de avaliação da função.
+        return jsonify({"erro": f"Erro ao interpretar a função: {e}"}), 400  # se der erro, responde com JSON de erro. Sem esse try, o servidor cai com 500.
     except Exception as e:
         return jsonify({"erro": f"Erro ao executar método de Newton-Raphson: {e}"}), 400  # se algo der errado dentro de newton_raphson, retorna erro amigável. Sem isso, o backend cai com 500.
 
+    if resultado["raiz"] is None and "limite" not in resultado:  # híbrido sem mudança de sinal em [a, b]: mesma resposta da rota /bissecao.
+        return jsonify({
+            "erro": "Não foi possível encontrar raiz nesse intervalo. "
+                    "Verifique se f(a) e f(b) têm sinais opostos."
+        }), 400
+
+    intervalo = {"a": a, "b": b} if metodo == "hibrido" else {}  # intervalo usado pelo híbrido.
     return jsonify({
-        "metodo": "newton",          # informa no JSON qual método foi usado.
+        "metodo": metodo,            # informa no JSON qual método foi usado (newton ou hibrido).
         "funcao": funcao_str,        # devolve a função usada.
         "x0": x0,                    # devolve o x inicial.
+        **intervalo,
         "tolerancia": tolerancia,    # devolve a tolerância usada.
         "max_iter": max_iter,        # devolve o máximo de iterações.
-        **resultado                  # espalha o dicionário retornado por newton_raphson (raiz, iteracoes, convergiu, historico, etc.). Se remover o **resultado, a resposta não teria os dados principais.
+        "derivada": derivada,        # informa qual derivada foi usada (automatica ou numerica).
+        **resultado                  # espalha o dicionário retornado por newton_raphson (raiz, iteracoes, convergiu, historico, avaliacoes, e "limite" se parou por um limite). Se remover o **resultado, a resposta não teria os dados principais.
     }), 200                          # status HTTP 200 (sucesso). Se mudar pra outro código, o front pode interpretar como erro.
 
+# =========================
+# ROTA NEWTON PARA SISTEMAS
+# =========================
+@app.route("/newton-sistema", methods=["POST"])  # resolve F(x) = 0 com várias variáveis (x1..xn) numa única requisição.
+def api_newton_sistema():
+    data = request.get_json()
+    if not data:
+        return jsonify({"erro": "Nenhum JSON foi enviado."}), 400
+
+    try:
+        funcoes = data["funcoes"]          # lista de expressões em x1..xn, uma por equação: ["x1**2 + x2**2 - 4", "x1 - x2"]
+        x0 = [float(v) for v in data["x0"]]  # chute inicial, um valor por variável.
+        tolerancia = float(data.get("tolerancia", 0.0001))
+        max_iter = int(data.get("max_iter", 50))
+        jacobiana = str(data.get("jacobiana", "automatica"))  # "automatica" (números duais, padrão) ou "numerica" (diferenças centrais).
+        broyden = bool(data.get("broyden", False))  # True: jacobiana exata só no início; depois, atualizações de Broyden.
+        motor = str(data.get("motor", "python"))     # motor da eliminação de Gauss de cada passo ("python" ou "numpy").
+        max_avaliacoes, tempo_maximo = ler_limites(data)
+        historico, historico_n = ler_historico(data, max_iter, "nenhum")  # pontos x de cada iteração (desligado por padrão).
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({"erro": "Dados inválidos no corpo da requisição.", "detalhe": str(e)}), 400
+
+    if not isinstance(funcoes, list) or not funcoes or not all(isinstance(f, str) for f in funcoes):
+        return jsonify({"erro": "Informe 'funcoes' como uma lista de expressões."}), 400
+    if len(funcoes) > MAX_VARIAVEIS_SISTEMA:
+        return jsonify({"erro": f"No máximo {MAX_VARIAVEIS_SISTEMA} equações por sistema."}), 400
+    if len(x0) != len(funcoes):            # sistema quadrado: n equações em x1..xn.
+        return jsonify({"erro": f"x0 deve ter um valor por equação ({len(funcoes)})."}), 400
+    if jacobiana not in ("automatica", "numerica"):
+        return jsonify({"erro": "Use jacobiana 'automatica' ou 'numerica'."}), 400
+    if motor not in ("python", "numpy"):
+        return jsonify({"erro": "Use motor 'python' ou 'numpy'."}), 400
+
+    try:
+        resultado, jacobiana = calcular(data, tarefas.sistema, funcoes, x0, tolerancia, max_iter, jacobiana, broyden,
+                                        motor, max_avaliacoes, tempo_maximo, historico, historico_n)
+    except ErroExecutor:
+        raise
+    except tarefas.ErroFuncao as e:
+        return jsonify({"erro": f"Erro ao interpretar as funções: {e}"}), 400
+    except Exception as e:
+        return jsonify({"erro": f"Erro ao executar o método de Newton para sistemas: {e}"}), 400
+
+    return jsonify({
+        "metodo": "newton-sistema",
+        "funcoes": funcoes,
+        "variaveis": list(tarefas.variaveis_sistema(len(funcoes))),
+        "x0": x0,
+        "tolerancia": tolerancia,
+        "max_iter": max_iter,
+        "jacobiana": jacobiana,            # jacobiana usada (automatica ou numerica).
+        "broyden": broyden,
+        **resultado,                       # raiz, iteracoes, convergiu, residuo, jacobianas, avaliacoes (e limite/mensagem).
+    }), 200
+
 # =========================
 # ROTA BISSEÇÃO
 # =========================
@@ -187,53 +342,195 @@ def api_bissecao():                        # função que trata as requisições
         b = float(data["b"])               # limite superior do intervalo.
         tolerancia = float(data.get("tolerancia", 1e-6))  # tolerância, com padrão.
         max_iter = int(data.get("max_iter", 100))         # máximo de iterações, com padrão.
+        metodo = str(data.get("metodo", "bissecao"))      # método com intervalo: bissecao (padrão), brent, illinois ou itp.
+        max_avaliacoes, tempo_maximo = ler_limites(data)  # limites de avaliações de f e de tempo.
+        historico, historico_n = ler_historico(data, max_iter, "nenhum")  # intervalos [a, b] de cada iteração (só bisseção).
     except (KeyError, TypeError, ValueError) as e:
         return jsonify({
             "erro": "Dados inválidos no corpo da requisição.",
             "detalhe": str(e)
         }), 400                            # trata erros de entrada. Sem o try/except, o servidor cai em erro 500.
 
-    # teste rápido de sintaxe da função
-    contexto_teste = {                     # contexto mínimo para testar a função (sem montar lambda).
-        "x": 1.0,
-        "math": math,
-        "e": math.e,
-        "pi": math.pi,
-        "sin": math.sin,
-        "cos": math.cos,
-        "tan": math.tan,
-        "exp": math.exp,
-        "log": math.log,
-        "sqrt": math.sqrt,
-    }
-    try:
-        eval(funcao_str, {"__builtins__": {}}, contexto_teste)  # avalia só a expressão em x=1. Se remover, erros de sintaxe só aparecem dentro da bisseção.
-    except Exception as e:
-        return jsonify({"erro": f"Erro ao interpretar a função: {e}"}), 400  # devolve erro amigável se a expressão estiver errada.
+    if metodo not in METODOS_INTERVALO:    # recusa métodos desconhecidos antes de calcular qualquer coisa.
+        return jsonify({"erro": f"Método desconhecido: {metodo}. Use um de: {', '.join(METODOS_INTERVALO)}."}), 400
+
+    if historico != "nenhum" and metodo != "bissecao":  # Brent, Illinois e ITP não mantêm um intervalo por iteração.
+        return jsonify({"erro": "O histórico de intervalos só está disponível para o método 'bissecao'."}), 400
 
     try:
-        raiz = bissecao(funcao_str, a, b, tolerancia, max_iter)  # chama a função de bisseção implementada lá em cima. Se remover, a rota não calcula nada.
+        resultado = calcular(data, tarefas.intervalo, funcao_str, a, b, tolerancia, max_iter, metodo,
+                             max_avaliacoes, tempo_maximo, historico, historico_n)  # testa a função em x=1 e chama o método escolhido (bisseção por padrão) contando as avaliações de f. Se remover, a rota não calcula nada.
+    except ErroExecutor:
+        raise
+    except tarefas.ErroFuncao as e:
+        return jsonify({"erro": f"Erro ao interpretar a função: {e}"}), 400  # devolve erro amigável se a expressão estiver errada.
     except Exception as e:
         return jsonify({"erro": f"Erro ao executar método da bisseção: {e}"}), 400  # captura erros internos e retorna JSON em vez de quebrar o servidor.
 
-    if raiz is None:                       # verifica se a bisseção retornou None (intervalo inválido, sem mudança de sinal).
+    raiz = resultado["raiz"]
+    if raiz is None and "limite" not in resultado:  # verifica se a bisseção retornou None (intervalo inválido, sem mudança de sinal).
         return jsonify({
             "erro": "Não foi possível encontrar raiz nesse intervalo. "
                     "Verifique se f(a) e f(b) têm sinais opostos."
         }), 400                             # responde com erro explicando o problema. Se remover esse if, o front receberia raiz=None sem explicação.
 
     resposta = {
-        "metodo": "bissecao",              # identifica o método usado.
+        "metodo": metodo,                  # identifica o método usado.
         "funcao": funcao_str,              # devolve a função.
         "a": a,                            # devolve limite inferior.
         "b": b,                            # devolve limite superior.
         "tolerancia": tolerancia,          # devolve tolerância.
         "max_iter": max_iter,              # devolve máximo de iterações.
-        "raiz": raiz                       # devolve a raiz encontrada.
+        "raiz": raiz,                      # devolve a raiz encontrada.
+        "avaliacoes": resultado["avaliacoes"]  # quantas vezes f(x) foi calculada (para comparar o custo dos métodos).
     }
+    if "limite" in resultado:              # parou por um limite: raiz é o último ponto avaliado (resultado parcial).
+        resposta.update(convergiu=False, limite=resultado["limite"], mensagem=resultado["mensagem"])
+    for campo in ("historico", "historico_iteracoes"):  # intervalos [a, b] pedidos em "historico" (e a iteração de cada um).
+        if campo in resultado:
+            resposta[campo] = resultado[campo]
 
     return jsonify(resposta), 200          # responde com JSON e status 200. Se remover, a rota não retorna nada.
 
+# =========================
+# ROTAS EM LOTE (BATCH)
+# =========================
+def ler_itens_lote(data, campos):          # lê e valida a lista "itens" de uma requisição de lote; devolve (itens convertidos, erro).
+    itens = data.get("itens")              # lista de problemas: [{"funcao": ..., "a": ..., "b": ...}, ...]
+    if not isinstance(itens, list) or not itens:
+        return None, "Informe 'itens' como uma lista não vazia."
+    if len(itens) > MAX_ITENS_LOTE:
+        return None, f"No máximo {MAX_ITENS_LOTE} itens por requisição."
+    convertidos = []
+    for item in itens:
+        convertidos.append({"funcao": item["funcao"], **{c: float(item[c]) for c in campos}})  # KeyError/TypeError/ValueError tratados por quem chama
+    return convertidos, None
+
+
+@app.route("/bissecao/batch", methods=["POST"])  # resolve vários problemas de bisseção em uma única requisição.
+def api_bissecao_lote():
+    data = request.get_json()
+    if not data:
+        return jsonify({"erro": "Nenhum JSON foi enviado."}), 400
+
+    try:
+        itens, erro = ler_itens_lote(data, ("a", "b"))
+        tolerancia = float(data.get("tolerancia", 1e-6))
+        max_iter = int(data.get("max_iter", 100))
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({"erro": "Dados inválidos no corpo da requisição.", "detalhe": str(e)}), 400
+    if erro:
+        return jsonify({"erro": erro}), 400
+
+    try:
+        resultados = calcular(data, tarefas.bissecao_em_lote, itens, tolerancia, max_iter)  # resposta na mesma ordem dos itens; itens da mesma função numa iteração vetorizada
+    except ErroExecutor:
+        raise
+    except Exception as e:                 # erros da função ficam em cada item; aqui, por exemplo, "tempo_limite" inválido.
+        return jsonify({"erro": f"Erro ao executar bisseção em lote: {e}"}), 400
+
+    return jsonify({
+        "metodo": "bissecao",
+        "tolerancia": tolerancia,
+        "max_iter": max_iter,
+        "resultados": [{**item, **resultado} for item, resultado in zip(itens, resultados)],  # campos do pedido desta requisição (o resultado pode vir do cache).
+    }), 200
+
+
+@app.route("/newton/batch", methods=["POST"])  # resolve vários problemas de Newton-Raphson em uma única requisição.
+def api_newton_lote():
+    data = request.get_json()
+    if not data:
+        return jsonify({"erro": "Nenhum JSON foi enviado."}), 400
+
+    try:
+        itens, erro = ler_itens_lote(data, ("x0",))
+        tolerancia = float(data.get("tolerancia", 0.0001))
+        max_iter = int(data.get("max_iter", 10))
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({"erro": "Dados inválidos no corpo da requisição.", "detalhe": str(e)}), 400
+    if erro:
+        return jsonify({"erro": erro}), 400
+
+    try:
+        resultados = calcular(data, tarefas.newton_em_lote, itens, tolerancia, max_iter)  # passos de Newton da mesma função atualizados como arrays
+    except ErroExecutor:
+        raise
+    except Exception as e:                 # erros da função ficam em cada item; aqui, por exemplo, "tempo_limite" inválido.
+        return jsonify({"erro": f"Erro ao executar Newton-Raphson em lote: {e}"}), 400
+
+    return jsonify({
+        "metodo": "newton",
+        "tolerancia": tolerancia,
+        "max_iter": max_iter,
+        "resultados": [{**item, **resultado} for item, resultado in zip(itens, resultados)],  # campos do pedido desta requisição (o resultado pode vir do cache).
+    }), 200
+
+@app.route("/bissecao/varredura", methods=["POST"])  # encontra todas as raízes numa faixa [a, b] sem precisar adivinhar o intervalo.
+def api_varredura():
+    data = request.get_json()
+    if not data:
+        return jsonify({"erro": "Nenhum JSON foi enviado."}), 400
+
+    try:
+        funcao_str = data["funcao"]
+        a = float(data["a"])               # início da faixa de busca
+        b = float(data["b"])               # fim da faixa de busca
+        pontos = int(data.get("pontos", 1000))  # resolução da grade
+        tolerancia = float(data.get("tolerancia", 1e-6))
+        max_iter = int(data.get("max_iter", 100))
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({"erro": "Dados inválidos no corpo da requisição.", "detalhe": str(e)}), 400
+
+    if not a < b or not 2 <= pontos <= MAX_PONTOS_VARREDURA:
+        return jsonify({"erro": f"Use a < b e entre 2 e {MAX_PONTOS_VARREDURA} pontos."}), 400
+
+    try:
+        raizes, intervalos = calcular(data, tarefas.varredura, funcao_str, a, b, pontos, tolerancia, max_iter)
+    except ErroExecutor:
+        raise
+    except tarefas.ErroFuncao as e:        # a expressão é validada antes de montar a grade
+        return jsonify({"erro": f"Erro ao interpretar a função: {e}"}), 400
+    except Exception as e:
+        return jsonify({"erro": f"Erro ao executar a varredura de raízes: {e}"}), 400
+
+    return jsonify({
+        "metodo": "varredura",
+        "funcao": funcao_str,
+        "a": a,
+        "b": b,
+        "pontos": pontos,
+        "tolerancia": tolerancia,
+        "max_iter": max_iter,
+        "raizes": raizes,                  # todas as raízes encontradas, em ordem crescente
+        "intervalos": intervalos,          # intervalos da grade onde houve mudança de sinal
+    }), 200
+
+@app.route("/polinomio/raizes", methods=["POST"])  # todas as raízes (reais e complexas) de um polinômio, sem intervalo nem chute inicial.
+def api_raizes_polinomio():
+    data = request.get_json()
+    if not data:
+        return jsonify({"erro": "Nenhum JSON foi enviado."}), 400
+
+    funcao_str = data.get("funcao")        # ex: "x**3 - x - 2" ou "(x - 1)**2 * (x + 3)"
+    if funcao_str is None:
+        return jsonify({"erro": "Função não informada."}), 400
+
+    try:
+        resultado = calcular(data, tarefas.raizes_polinomio, funcao_str)  # autovalores da matriz companheira, num processo de cálculo.
+    except ErroExecutor:
+        raise
+    except tarefas.ErroFuncao as e:
+        return jsonify({"erro": f"Erro ao interpretar a função: {e}"}), 400
+    except Exception as e:                 # inclui "não é um polinômio" e o polinômio nulo.
+        return jsonify({"erro": f"Erro ao calcular as raízes do polinômio: {e}"}), 400
+
+    return jsonify({
+        "metodo": "polinomio",
+        "funcao": funcao_str,
+        **resultado,                       # coeficientes, grau, raizes (reais, em ordem crescente) e raizes_complexas ([real, imaginária]).
+    }), 200
+
 # =========================
 # ROTA ELIMINAÇÃO DE GAUSS
 # =========================
@@ -246,27 +543,319 @@ def api_gauss():                           # função para tratar as chamadas de
 
     matriz = data.get("matriz")            # lê a matriz aumentada [A|b] enviada pelo front.
     usar_pivoteamento = bool(data.get("usar_pivoteamento", False))  # flag para decidir se usa pivoteamento; padrão False (ou True, dependendo do front).
+    motor = str(data.get("motor", "python"))  # "python" (padrão), "numpy" (vetorizado) ou "blocado" (LU em blocos, sistemas densos grandes).
+    registrar_etapas = str(data.get("registrar_etapas", "nenhuma" if motor == "blocado" else "completa"))  # "completa" (padrão), "deltas", "pivos" ou "nenhuma" (padrão e único aceito no motor "blocado", que não tem etapas).
+    formato = str(data.get("formato", "densa"))  # "densa" (matriz aumentada, padrão), "coo", "csr", "tridiagonal" ou "banda".
+    fluxo = bool(data.get("fluxo", False))  # True: resposta NDJSON em fluxo, uma etapa por linha (ver responder_gauss_em_fluxo).
+
+    if formato not in FORMATOS:            # formato desconhecido.
+        return jsonify({"erro": f"Formato desconhecido: {formato}. Use um de: {', '.join(FORMATOS)}."}), 400
+
+    if fluxo and formato != "densa":       # os resolvedores esparsos não têm etapas para transmitir.
+        return jsonify({"erro": "A resposta em fluxo só está disponível para o formato 'densa'."}), 400
+
+    if formato != "densa":                 # sistemas esparsos/em banda: a matriz densa nunca é montada.
+        try:
+            dados = {campo: data[campo] for campo in CAMPOS_FORMATO[formato]}  # só os campos do formato: o resto (tempo_limite, cache...) não entra na chave do cache nem vai para o processo.
+            n = ordem_sistema(formato, dados)
+        except (KeyError, TypeError, ValueError) as e:
+            return jsonify({"erro": "Dados inválidos no corpo da requisição.", "detalhe": str(e)}), 400
+        if not 1 <= n <= MAX_INCOGNITAS_ESPARSA:
+            return jsonify({"erro": f"O sistema precisa ter entre 1 e {MAX_INCOGNITAS_ESPARSA} incógnitas."}), 400
+        try:
+            solucao, mensagem, residuos, metodo_esparso = calcular(data, resolver_sistema_esparso, formato, dados)
+        except ErroExecutor:
+            raise
+        except (KeyError, TypeError, ValueError) as e:
+            return jsonify({"erro": "Dados inválidos no corpo da requisição.", "detalhe": str(e)}), 400
+        except Exception as e:
+            return jsonify({"erro": f"Erro ao resolver sistema esparso: {e}"}), 400
+        return jsonify({
+            "metodo": "gauss",
+            "formato": formato,            # formato de entrada usado.
+            "resolvedor": metodo_esparso,  # thomas, banda, esparsa ou densa (escolhido pela estrutura da matriz; densa: sem SciPy, sistema pequeno).
+            "mensagem": mensagem,
+            "solucao": solucao,
+            "residuos": residuos,          # calculados com produto matriz-vetor esparso.
+        }), 200
 
     if matriz is None:                     # se a matriz não foi enviada…
         return jsonify({"erro": "Matriz não informada."}), 400  # retorna erro informando o problema.
 
     try:
-        solucao, etapas, mensagem = eliminacao_gauss(matriz, usar_pivoteamento)  # chama sua função de eliminação de Gauss. Se remover, a rota não resolve o sistema.
-        residuos = verificar_solucao(matriz, solucao) if solucao is not None else None  # se houve solução, calcula os resíduos; se não, deixa None. Se remover, você perde essa verificação.
+        tamanho_bloco = int(data.get("tamanho_bloco", 64))  # colunas por bloco do motor "blocado".
+        threads = max(1, min(int(data.get("threads", 1)), NUCLEOS_POR_VAGA))  # threads do motor "blocado": padrão 1 (o BLAS já é multithread), no máximo os núcleos de uma vaga do executor.
+    except (TypeError, ValueError):
+        return jsonify({"erro": "tamanho_bloco e threads devem ser inteiros."}), 400
+
+    if fluxo:
+        return responder_gauss_em_fluxo(data, matriz, usar_pivoteamento, motor, registrar_etapas, tamanho_bloco, threads)
+
+    try:
+        solucao, etapas, mensagem, residuos = calcular(
+            data, tarefas.gauss, matriz, usar_pivoteamento, motor, registrar_etapas, tamanho_bloco, threads
+        )                                  # eliminação de Gauss e resíduos (None se não houve solução), num processo de cálculo.
+    except ErroExecutor:
+        raise
     except Exception as e:
         return jsonify({"erro": f"Erro ao executar eliminação de Gauss: {e}"}), 400  # trata qualquer erro interno da função de Gauss. Sem isso, o backend cai.
 
     return jsonify({
         "metodo": "gauss",                 # identifica o método usado.
         "usar_pivoteamento": usar_pivoteamento,  # informa se pivoteamento foi usado.
+        "motor": motor,                   # informa qual implementação resolveu o sistema.
         "mensagem": mensagem,             # mensagem da função (sucesso, impossível, indeterminado, etc.).
         "solucao": solucao,               # vetor solução, se existir.
-        "etapas": etapas,                 # lista de etapas textuais da eliminação.
+        "registrar_etapas": registrar_etapas,  # nível de registro das etapas.
+        "etapas": etapas,                 # etapas da eliminação (matrizes ou deltas, conforme registrar_etapas).
         "residuos": residuos              # resíduos A·x - b para cada equação.
     }), 200                               # retorna JSON com status 200.
 
+
+def responder_gauss_em_fluxo(data, matriz, usar_pivoteamento, motor, registrar_etapas, tamanho_bloco, threads):
+    """
+    /gauss com "fluxo": true — NDJSON (application/x-ndjson), uma linha por vez:
+    "inicio" (parâmetros), uma "etapa" por linha, "solucao", "residuos" e "fim"
+    (ver tarefas.gauss_em_fluxo). Com "codificacao": "base64", os vetores e
+    matrizes vão em binário float64. Cada linha é enviada assim que calculada
+    e nada é guardado no cache de resultados: nem o servidor nem o processo de
+    cálculo seguram o histórico de etapas inteiro.
+    Erros depois do início da resposta (status 200 já enviado) viram uma linha {"tipo": "erro"}.
+    """
+    codificacao = str(data.get("codificacao", "json"))  # "json" (padrão) ou "base64".
+    if codificacao not in tarefas.CODIFICACOES_FLUXO:
+        return jsonify({"erro": f"Codificação desconhecida: {codificacao}. "
+                                f"Use uma de: {', '.join(tarefas.CODIFICACOES_FLUXO)}."}), 400
+    tempo_limite = data.get("tempo_limite")  # mesmo campo de calcular().
+    try:
+        tempo_limite = None if tempo_limite is None else float(tempo_limite)
+    except (TypeError, ValueError):
+        return jsonify({"erro": "tempo_limite deve ser um número."}), 400
+
+    linhas = executor.transmitir(
+        tarefas.gauss_em_fluxo, matriz, usar_pivoteamento, motor, registrar_etapas, tamanho_bloco, threads,
+        codificacao, tempo_limite=tempo_limite,
+    )
+    try:
+        primeira = next(linhas)            # erros de validação e ServidorOcupado ainda podem virar status HTTP.
+    except ErroExecutor:
+        raise
+    except Exception as e:
+        return jsonify({"erro": f"Erro ao executar eliminação de Gauss: {e}"}), 400
+
+    def corpo():
+        yield tarefas.linha_ndjson({
+            "tipo": "inicio",
+            "metodo": "gauss",
+            "usar_pivoteamento": usar_pivoteamento,
+            "motor": motor,
+            "registrar_etapas": registrar_etapas,
+            "codificacao": codificacao,
+        })
+        yield primeira
+        try:
+            yield from linhas
+        except Exception as e:             # inclui TempoEsgotado: o status já foi enviado.
+            yield tarefas.linha_ndjson({"tipo": "erro", "erro": f"Erro ao executar eliminação de Gauss: {e}"})
+        finally:
+            linhas.close()                 # cliente desconectou: encerra o processo de cálculo e libera a vaga.
+
+    return Response(corpo(), mimetype="application/x-ndjson")
+
+# =========================
+# ROTA MÉTODOS ITERATIVOS
+# =========================
+@app.route("/gauss/iterativo", methods=["POST"])  # resolve [A|b] com Jacobi, Gauss-Seidel, SOR ou Gradiente Conjugado.
+def api_gauss_iterativo():
+    data = request.get_json()
+    if not data:
+        return jsonify({"erro": "Nenhum JSON foi enviado."}), 400
+
+    try:
+        A, b = separar_sistema(data["matriz"])  # mesma matriz aumentada [A|b] da rota /gauss
+        metodo = str(data.get("metodo", "auto"))  # auto (escolhe pela dominância diagonal/simetria) ou um método específico
+        tolerancia = float(data.get("tolerancia", 1e-8))
+        max_iter = int(data.get("max_iter", 1000))
+        omega = float(data.get("omega", 1.5))   # fator de relaxação do SOR
+        x0 = data.get("x0")                      # chute inicial (warm start), opcional
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({"erro": "Dados inválidos no corpo da requisição.", "detalhe": str(e)}), 400
+
+    if metodo not in METODOS_ITERATIVOS:
+        return jsonify({"erro": f"Método desconhecido: {metodo}. Use um de: {', '.join(METODOS_ITERATIVOS)}."}), 400
+
+    try:
+        metodo_usado, resultado = calcular(data, tarefas.iterativo, A, b, metodo, x0, tolerancia, max_iter, omega)  # no "auto", sem método com convergência garantida (ou se o escolhido não converge), usa a eliminação de Gauss
+    except ErroExecutor:
+        raise
+    except Exception as e:
+        return jsonify({"erro": f"Erro ao executar método iterativo: {e}"}), 400
+
+    return jsonify({
+        "metodo": metodo_usado,            # método efetivamente usado
+        "metodo_pedido": metodo,
+        "tolerancia": tolerancia,
+        "max_iter": max_iter,
+        **resultado,                       # solucao, iteracoes, convergiu, residuo (e mensagem, se houver)
+    }), 200
+
+# =========================
+# ROTA FATORAÇÃO LU (mesma A, vários b)
+# =========================
+@app.route("/gauss/lu", methods=["POST"])  # resolve A·x = b reaproveitando a fatoração LU de A entre requisições.
+def api_gauss_lu():
+    data = request.get_json()
+    if not data:
+        return jsonify({"erro": "Nenhum JSON foi enviado."}), 400
+
+    A = data.get("A")                      # matriz de coeficientes n x n (sem a coluna b)
+    if A is None:
+        return jsonify({"erro": "Matriz de coeficientes 'A' não informada."}), 400
+    if "B" in data:                        # vários lados direitos: lista de vetores, um por sistema
+        lados_direitos = data["B"]
+        varios = True
+    elif "b" in data:                      # um único lado direito
+        lados_direitos = [data["b"]]
+        varios = False
+    else:
+        return jsonify({"erro": "Informe o lado direito 'b' (vetor) ou 'B' (lista de vetores)."}), 400
+    usar_pivoteamento = bool(data.get("usar_pivoteamento", True))
+
+    try:
+        A = np.asarray(A, dtype=float)
+        B = np.array(lados_direitos, dtype=float).T  # colunas = lados direitos
+        chave, fatoracao = cache_lu.consultar(A, usar_pivoteamento)  # fatoração de A já pronta (ou None)
+        do_cache = fatoracao is not None
+        nova, X, residuos = calcular(data, tarefas.sistema_lu, A, fatoracao, B, usar_pivoteamento, usar_cache=False)  # num processo de cálculo: fatoração O(n³) só na primeira vez para cada A, substituições O(n²) e resíduos |A·x - b|.
+        if nova is not None:
+            cache_lu.guardar(chave, nova)  # a fatoração fica no cache_lu para os próximos b
+        if X is None:
+            return jsonify({
+                "metodo": "lu",
+                "mensagem": "Sistema singular - sem solução única",
+                "solucao": None,
+            }), 200
+    except ErroExecutor:
+        raise
+    except Exception as e:
+        return jsonify({"erro": f"Erro ao executar fatoração LU: {e}"}), 400
+
+    resposta = {
+        "metodo": "lu",
+        "usar_pivoteamento": usar_pivoteamento,
+        "mensagem": "Sistema resolvido com sucesso",
+        "cache": "acerto" if do_cache else "falta",  # se a fatoração de A já estava pronta
+    }
+    if varios:
+        resposta["solucoes"] = X           # uma solução por lado direito, na mesma ordem de 'B'
+        resposta["residuos"] = residuos
+    else:
+        resposta["solucao"] = X[0]
+        resposta["residuos"] = residuos[0]
+    return jsonify(resposta), 200
+
+# =========================
+# ESTATÍSTICAS DOS CACHES
+# =========================
+@app.route("/cache", methods=["GET"])     # acertos/faltas e memória usada pelos caches do servidor.
+def api_cache():
+    return jsonify({
+        "resultados": cache_resultados.estatisticas(),  # respostas das rotas de cálculo
+        "lu": cache_lu.estatisticas(),                   # fatorações LU da rota /gauss/lu
+    }), 200
+
+
+@app.route("/cache", methods=["DELETE"])  # esvazia os caches (ex: depois de mudar a implementação de um método).
+def api_cache_limpar():
+    cache_resultados.limpar()
+    cache_lu.limpar()
+    return jsonify({"mensagem": "Caches esvaziados."}), 200
+
+# =========================
+# TRABALHOS ASSÍNCRONOS
+# =========================
+ROTAS_TRABALHO = (                         # rotas que podem rodar como trabalho (mesmo JSON da chamada direta).
+    "/newton", "/newton/batch", "/newton-sistema", "/bissecao", "/bissecao/batch", "/bissecao/varredura", "/polinomio/raizes",
+    "/gauss", "/gauss/iterativo", "/gauss/lu",
+)
+
+
+def executar_trabalho(trabalho):           # roda a rota pedida numa thread da fila, repassando o progresso ao trabalho.
+    with app.test_request_context(trabalho.rota, method="POST", json=trabalho.dados):
+        g.ao_progredir = trabalho.registrar_progresso
+        resposta = app.full_dispatch_request()  # mesma validação, cálculo e resposta da chamada direta.
+    return resposta.get_json(), resposta.status_code
+
+
+fila_trabalhos = FilaTrabalhos(
+    executar_trabalho,
+    threads=int(os.environ.get("TRABALHOS_THREADS", executor.processos or 2)),  # trabalhos simultâneos (cada um ocupa uma vaga do executor).
+    max_na_fila=int(os.environ.get("TRABALHOS_MAX_FILA", 100)),
+    validade=float(os.environ.get("TRABALHOS_VALIDADE", 3600)),                  # segundos que um trabalho terminado fica disponível.
+    limite_bytes=int(os.environ.get("TRABALHOS_MAX_BYTES", 256 * 1024 * 1024)),  # memória máxima dos resultados guardados.
+)
+
+
+@app.route("/jobs", methods=["POST"])      # envia um cálculo para a fila e devolve o id na hora (202).
+def api_jobs_criar():
+    data = request.get_json()
+    if not data:
+        return jsonify({"erro": "Nenhum JSON foi enviado."}), 400
+
+    rota = data.get("rota")                # ex: "/gauss"
+    dados = data.get("dados")              # mesmo JSON que seria enviado à rota
+    if rota not in ROTAS_TRABALHO:
+        return jsonify({"erro": f"Rota inválida: {rota}. Use uma de: {', '.join(ROTAS_TRABALHO)}."}), 400
+    if not isinstance(dados, dict) or not dados:
+        return jsonify({"erro": "Informe 'dados' com o JSON da rota."}), 400
+    if dados.get("fluxo"):                 # o resultado do trabalho é guardado inteiro; o fluxo só existe na rota direta.
+        return jsonify({"erro": "Trabalhos não aceitam 'fluxo'; chame a rota diretamente."}), 400
+
+    trabalho = fila_trabalhos.submeter(rota, dados)  # fila cheia: ServidorOcupado (503).
+    return jsonify({
+        "id": trabalho.id,
+        "estado": trabalho.estado,
+        "status_url": f"/jobs/{trabalho.id}",          # consulta do estado e do resultado
+        "eventos_url": f"/jobs/{trabalho.id}/eventos",  # fluxo de progresso (Server-Sent Events)
+    }), 202
+
+
+@app.route("/jobs/<id_trabalho>", methods=["GET"])  # estado do trabalho; quando terminado, inclui status e resultado da rota.
+def api_jobs_estado(id_trabalho):
+    trabalho = fila_trabalhos.obter(id_trabalho)
+    if trabalho is None:
+        return jsonify({"erro": "Trabalho não encontrado."}), 404
+    return jsonify(trabalho.resumo()), 200
+
+
+@app.route("/jobs/<id_trabalho>/eventos", methods=["GET"])  # progresso em tempo real (text/event-stream).
+def api_jobs_eventos(id_trabalho):
+    trabalho = fila_trabalhos.obter(id_trabalho)
+    if trabalho is None:
+        return jsonify({"erro": "Trabalho não encontrado."}), 404
+    try:
+        indice = int(request.headers.get("Last-Event-ID", -1)) + 1  # reconexão do EventSource: continua de onde parou.
+    except ValueError:
+        indice = 0
+
+    def eventos():
+        nonlocal indice
+        while True:
+            novos, terminado = trabalho.eventos_desde(indice, espera=15)
+            for dados in novos:
+                yield f"id: {indice}\nevent: progresso\ndata: {json.dumps(dados)}\n\n"
+                indice += 1
+            if terminado:
+                yield f"event: fim\ndata: {json.dumps(trabalho.resumo())}\n\n"
+                return
+            if not novos:
+                yield ": aguardando\n\n"  # comentário SSE: mantém a conexão aberta em cálculos longos.
+
+    return Response(eventos(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
+
 # =========================
 # INICIAR SERVIDOR
 # =========================
 if __name__ == "__main__":                # garante que o servidor Flask só vai rodar se o arquivo for executado diretamente (e não importado de outro lugar). Se remover, ainda funciona ao rodar direto, mas é uma boa prática mantê-lo.
+    # em produção, use servidor.py (Gunicorn/Uvicorn com vários workers e threads) em vez do servidor de desenvolvimento.
     app.run(debug=True)                   # inicia o servidor Flask em modo debug (recarrega sozinho e mostra erros detalhados). Se remover, nada sobe: o backend não inicia.
@@ -0,0 +1,428 @@
+"""
+Benchmarks dos métodos numéricos, com resultados em JSON para comparar versões.
+
+Modos:
+  metodos   roda no próprio processo: bisseção (e os outros métodos com
+            intervalo), Newton-Raphson, derivada_numerica e eliminação de Gauss
+            num catálogo de funções e de matrizes (densa, esparsa e mal
+            condicionada, n = 10 a 2000). Mede tempo, avaliações de f, pico de
+            memória e resíduos.
+  http      gerador de carga contra o servidor (iniciado aqui com --iniciar ou já
+            rodando em --url): latências p50/p90/p99 e vazão por rota.
+  comparar  compara dois arquivos de resultado e aponta as regressões de tempo.
+
+Exemplos:
+  python benchmark.py metodos --saida base.json
+  python benchmark.py metodos --rapido --motores numpy,blocado
+  python benchmark.py http --iniciar --requisicoes 500 --concorrencia 8 --saida http.json
+  python benchmark.py comparar base.json novo.json --limiar 1.2
+"""
+# Ferramenta de linha de comando (como teste_api.py); não é importada pelo backend.
+
+import argparse
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import timeit
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from bissecao import METODOS_INTERVALO, resolver_intervalo
+from derivada import derivada_numerica
+from eliminacao_gauss import MOTORES, eliminacao_gauss, verificar_solucao
+from expressao import compilar_derivada, compilar_funcao
+from newton import newton_raphson
+
+# Catálogo de funções: nome -> (f(x), intervalo [a, b] com mudança de sinal, chute do Newton)
+FUNCOES = {
+    "cubica": ("x**3 - x - 2", 1.0, 2.0, 1.5),
+    "cosseno": ("cos(x) - x", 0.0, 1.0, 0.5),
+    "exponencial": ("exp(x) - 3*x", 0.0, 1.0, 0.0),
+    "logaritmo": ("log(x) + x - 2", 1.0, 2.0, 1.0),
+    "raiz_tripla": ("(x - 1)**3", 0.0, 2.5, 2.0),     # Newton converge só linearmente
+    "plana": ("x**10 - 1", 0.0, 1.5, 0.5),             # derivada pequena perto do chute
+}
+
+TIPOS_MATRIZ = ("densa", "esparsa", "mal_condicionada")
+TAMANHOS = (10, 50, 100, 500, 1000, 2000)
+TAMANHOS_RAPIDO = (10, 100, 500)
+MAX_N_PYTHON = 500                                        # Motor "python" (listas) é O(n³) em Python puro: acima disso, minutos por execução
+
+TOLERANCIA = 1e-10
+PONTOS_DERIVADA = 1000
+
+
+# =========================
+# MEDIÇÃO
+# =========================
+def cronometrar(funcao, repeticoes):
+    """
+    Tempo por chamada de funcao(): cada amostra roda funcao() em sequência até
+    somar ~0,2 s (timeit.autorange), o que dilui a resolução do relógio em
+    chamadas de microssegundos. Retorna (tempo mínimo, tempo mediano, chamadas por amostra).
+    """
+    cronometro = timeit.Timer(funcao)
+    chamadas, _ = cronometro.autorange()                  # Também serve de aquecimento (caches, compilação)
+    tempos = [t / chamadas for t in cronometro.repeat(repeat=repeticoes, number=chamadas)]
+    return min(tempos), statistics.median(tempos), chamadas
+
+
+def pico_memoria(funcao):
+    """Pico de memória alocada (bytes, Python e NumPy) numa execução; feita à parte, pois o tracemalloc deixa tudo mais lento."""
+    tracemalloc.start()
+    try:
+        funcao()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class Contador:
+    """f(x) que conta as próprias avaliações."""
+
+    def __init__(self, f):
+        self.f = f
+        self.avaliacoes = 0
+
+    def __call__(self, x):
+        self.avaliacoes += 1
+        return self.f(x)
+
+
+def medir(grupo, nome, executar, repeticoes, **dados):
+    """Tempo e memória de executar(); 'dados' vai junto no resultado (avaliações, resíduo...)."""
+    minimo, mediano, chamadas = cronometrar(executar, repeticoes)
+    resultado = {
+        "grupo": grupo,
+        "nome": nome,
+        "tempo": minimo,                                  # Métrica comparada pelo modo 'comparar' (o mínimo sofre menos com ruído)
+        "tempo_mediano": mediano,
+        "amostras": repeticoes,
+        "chamadas_por_amostra": chamadas,
+        "memoria_pico": pico_memoria(executar),
+        **dados,
+    }
+    print(f"  {nome:<45} {minimo * 1000:10.3f} ms  {resultado['memoria_pico'] / 1024:10.1f} KiB")
+    return resultado
+
+
+# =========================
+# RAÍZES E DERIVADA
+# =========================
+def benchmark_raizes(repeticoes):
+    resultados = []
+    for nome_funcao, (texto, a, b, x0) in FUNCOES.items():
+        f = compilar_funcao(texto)
+        f_e_derivada = compilar_derivada(texto)
+
+        for metodo in METODOS_INTERVALO:
+            saida = resolver_intervalo(f, a, b, TOLERANCIA, 200, metodo)
+            resultados.append(medir(
+                "raizes", f"{metodo}/{nome_funcao}",
+                lambda: resolver_intervalo(f, a, b, TOLERANCIA, 200, metodo), repeticoes,
+                funcao=texto, avaliacoes=saida["avaliacoes"], raiz=saida["raiz"],
+                residuo=abs(f(saida["raiz"])) if saida["raiz"] is not None else None,
+            ))
+
+        for derivada, fd in (("automatica", f_e_derivada), ("numerica", None)):
+            contada = Contador(f)
+            fd_contada = Contador(fd) if fd is not None else None
+            saida = newton_raphson(contada, x0, TOLERANCIA, 100, fd_contada)
+            resultados.append(medir(
+                "raizes", f"newton_{derivada}/{nome_funcao}",
+                lambda: newton_raphson(f, x0, TOLERANCIA, 100, fd), repeticoes,
+                funcao=texto, avaliacoes=contada.avaliacoes + (fd_contada.avaliacoes if fd_contada else 0),
+                iteracoes=saida["iteracoes"], convergiu=saida["convergiu"], raiz=saida["raiz"],
+                residuo=abs(f(saida["raiz"])),
+            ))
+
+        pontos = np.linspace(a + 0.01, b, PONTOS_DERIVADA).tolist()  # Evita x = 0 (log)
+        exatas = [f_e_derivada(x)[1] for x in pontos]
+        contada = Contador(f)
+        erro = max(abs(derivada_numerica(contada, x) - d) / max(1.0, abs(d)) for x, d in zip(pontos, exatas))
+        resultados.append(medir(
+            "derivada", f"derivada_numerica/{nome_funcao}",
+            lambda: [derivada_numerica(f, x) for x in pontos], repeticoes,
+            funcao=texto, pontos=PONTOS_DERIVADA, avaliacoes=contada.avaliacoes, erro_relativo_max=erro,
+        ))
+    return resultados
+
+
+# =========================
+# ELIMINAÇÃO DE GAUSS
+# =========================
+def gerar_sistema(tipo, n, semente=0):
+    """Matriz aumentada [A|b] (lista de listas) com solução exata x = 1, e o número de condição de A."""
+    gerador = np.random.default_rng(semente)
+    if tipo == "densa":
+        A = gerador.uniform(-1, 1, (n, n))
+    elif tipo == "esparsa":                               # ~5 não nulos por linha, diagonal dominante
+        A = np.zeros((n, n))
+        for i in range(n):
+            A[i, gerador.integers(0, n, min(4, n))] = gerador.uniform(-1, 1, min(4, n))
+        A[np.arange(n), np.arange(n)] = 10.0
+    elif tipo == "mal_condicionada":                      # A = Q1·diag(s)·Q2 com cond(A) = 1e10
+        Q1, _ = np.linalg.qr(gerador.standard_normal((n, n)))
+        Q2, _ = np.linalg.qr(gerador.standard_normal((n, n)))
+        A = (Q1 * np.logspace(0, -10, n)) @ Q2
+    else:
+        raise ValueError(f"Tipo de matriz desconhecido: {tipo}")
+    b = A @ np.ones(n)
+    return np.column_stack([A, b]).tolist(), float(np.linalg.cond(A)) if n <= 500 else None
+
+
+def benchmark_gauss(tamanhos, motores, tipos, repeticoes):
+    resultados = []
+    for tipo in tipos:
+        for n in tamanhos:
+            matriz, condicao = gerar_sistema(tipo, n)
+            for motor in motores:
+                if motor == "python" and n > MAX_N_PYTHON:
+                    continue
+                solucao, _, mensagem = eliminacao_gauss(matriz, True, motor, "nenhuma")
+                dados = {"motor": motor, "tipo": tipo, "n": n, "condicao": condicao, "mensagem": mensagem}
+                if solucao is not None:
+                    dados["residuo_max"] = max(verificar_solucao(matriz, solucao, motor))
+                    dados["erro_max"] = float(np.max(np.abs(np.asarray(solucao) - 1.0)))  # Distância da solução exata
+                resultados.append(medir(
+                    "gauss", f"gauss_{motor}/{tipo}/{n}",
+                    lambda: eliminacao_gauss(matriz, True, motor, "nenhuma"), repeticoes, **dados,
+                ))
+    return resultados
+
+
+# =========================
+# CARGA HTTP
+# =========================
+def requisicoes_http(com_cache):
+    """Pedidos usados na carga: rota -> JSON (sem cache, para medir o cálculo)."""
+    matriz, _ = gerar_sistema("densa", 50)
+    extra = {} if com_cache else {"cache": False}
+    return {
+        "/newton": {"funcao": "x**3 - x - 2", "x0": 1.5, "tolerancia": 1e-10, "max_iter": 50, **extra},
+        "/bissecao": {"funcao": "cos(x) - x", "a": 0, "b": 1, "tolerancia": 1e-10, "max_iter": 100, **extra},
+        "/gauss": {"matriz": matriz, "motor": "numpy", "usar_pivoteamento": True,
+                   "registrar_etapas": "nenhuma", **extra},
+    }
+
+
+def importar_requests():
+    try:
+        import requests
+    except ImportError:
+        raise RuntimeError("O modo 'http' precisa do requests instalado (pip install requests)") from None
+    return requests
+
+
+def iniciar_servidor(porta, modo):
+    """Sobe servidor.py num subprocesso e espera responder; devolve o processo."""
+    requests = importar_requests()
+    with socket.socket() as teste:                        # Outro processo na porta responderia no lugar do servidor
+        teste.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)  # Ignora conexões antigas em TIME_WAIT
+        try:
+            teste.bind(("127.0.0.1", porta))
+        except OSError:
+            raise RuntimeError(f"A porta {porta} já está em uso; escolha outra com --porta") from None
+    processo = subprocess.Popen(
+        [sys.executable, "servidor.py", "--modo", modo, "--porta", str(porta), "--host", "127.0.0.1"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    prazo = time.monotonic() + 30
+    while time.monotonic() < prazo:
+        if processo.poll() is not None:
+            raise RuntimeError("O servidor terminou ao iniciar")
+        try:
+            if requests.get(f"http://127.0.0.1:{porta}/cache", timeout=1).status_code == 200:
+                return processo
+        except requests.ConnectionError:
+            time.sleep(0.2)
+    processo.terminate()
+    raise RuntimeError("O servidor não respondeu em 30 s")
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(p / 100 * len(ordenados)))]
+
+
+def benchmark_http(url, requisicoes, concorrencia, com_cache):
+    requests = importar_requests()
+
+    local = threading.local()                             # Uma sessão (conexão keep-alive) por thread
+
+    def enviar(rota, dados):
+        if not hasattr(local, "sessao"):
+            local.sessao = requests.Session()
+        inicio = time.perf_counter()
+        try:
+            status = local.sessao.post(url + rota, json=dados, timeout=60).status_code
+        except requests.RequestException:
+            status = None
+        return rota, status, time.perf_counter() - inicio
+
+    pedidos = requisicoes_http(com_cache)
+    fila = [(rota, pedidos[rota]) for _ in range(requisicoes) for rota in pedidos]
+    for rota, dados in pedidos.items():                   # Aquecimento: processos de cálculo e caches
+        enviar(rota, dados)
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(concorrencia) as threads:
+        respostas = list(threads.map(lambda pedido: enviar(*pedido), fila))
+    duracao = time.perf_counter() - inicio
+
+    resultados = []
+    for rota in pedidos:
+        latencias = [t for r, s, t in respostas if r == rota]
+        erros = sum(1 for r, s, t in respostas if r == rota and s != 200)
+        resultado = {
+            "grupo": "http",
+            "nome": f"http{rota}",
+            "tempo": percentil(latencias, 50),
+            "latencia_p90": percentil(latencias, 90),
+            "latencia_p99": percentil(latencias, 99),
+            "requisicoes": len(latencias),
+            "erros": erros,
+            "vazao": len(latencias) / duracao,            # Requisições por segundo desta rota (todas juntas na carga)
+            "concorrencia": concorrencia,
+        }
+        print(f"  {resultado['nome']:<20} p50 {resultado['tempo'] * 1000:8.2f} ms  "
+              f"p99 {resultado['latencia_p99'] * 1000:8.2f} ms  {resultado['vazao']:8.1f} req/s  {erros} erros")
+        resultados.append(resultado)
+    return resultados
+
+
+# =========================
+# RESULTADOS
+# =========================
+def ambiente():
+    """Versões e máquina, gravadas junto dos resultados."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "nucleos": os.cpu_count(),
+    }
+
+
+def salvar(caminho, modo, resultados):
+    if caminho:
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump({"modo": modo, "ambiente": ambiente(), "resultados": resultados}, arquivo, indent=2,
+                      ensure_ascii=False)
+        print(f"\nResultados gravados em {caminho}")
+
+
+def comparar(caminho_base, caminho_novo, limiar):
+    """Compara 'tempo' de cada benchmark presente nos dois arquivos; retorna o número de regressões."""
+    with open(caminho_base, encoding="utf-8") as arquivo:
+        base = {r["nome"]: r for r in json.load(arquivo)["resultados"]}
+    with open(caminho_novo, encoding="utf-8") as arquivo:
+        novo = {r["nome"]: r for r in json.load(arquivo)["resultados"]}
+
+    regressoes = 0
+    for nome in sorted(base.keys() & novo.keys()):
+        razao = novo[nome]["tempo"] / base[nome]["tempo"] if base[nome]["tempo"] > 0 else float("inf")
+        marca = ""
+        if razao > limiar:
+            marca = "  <-- REGRESSÃO"
+            regressoes += 1
+        elif razao < 1 / limiar:
+            marca = "  (mais rápido)"
+        print(f"{nome:<45} {base[nome]['tempo'] * 1000:10.3f} ms → {novo[nome]['tempo'] * 1000:10.3f} ms"
+              f"  x{razao:5.2f}{marca}")
+    for nome in sorted(base.keys() - novo.keys()):
+        print(f"{nome:<45} só no arquivo base")
+    for nome in sorted(novo.keys() - base.keys()):
+        print(f"{nome:<45} só no arquivo novo")
+    print(f"\n{regressoes} regressão(ões) acima de x{limiar:g}")
+    return regressoes
+
+
+def ler_argumentos(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks dos métodos numéricos")
+    modos = parser.add_subparsers(dest="modo", required=True)
+
+    metodos = modos.add_parser("metodos", help="métodos no próprio processo")
+    metodos.add_argument("--tamanhos", default=",".join(map(str, TAMANHOS)), help="ordens n das matrizes")
+    metodos.add_argument("--rapido", action="store_true", help=f"só n = {TAMANHOS_RAPIDO}")
+    metodos.add_argument("--motores", default=",".join(MOTORES), help="motores da eliminação de Gauss")
+    metodos.add_argument("--tipos", default=",".join(TIPOS_MATRIZ), help="tipos de matriz")
+    metodos.add_argument("--sem-raizes", action="store_true", help="pula raízes e derivada")
+    metodos.add_argument("--sem-gauss", action="store_true", help="pula a eliminação de Gauss")
+    metodos.add_argument("--repeticoes", type=int, default=5, help="amostras de tempo por benchmark")
+    metodos.add_argument("--saida", help="arquivo JSON dos resultados")
+
+    http = modos.add_parser("http", help="carga HTTP contra o servidor")
+    http.add_argument("--url", default="http://127.0.0.1:5000")
+    http.add_argument("--iniciar", action="store_true", help="sobe servidor.py numa porta local antes da carga")
+    http.add_argument("--porta", type=int, default=5055, help="porta do servidor iniciado com --iniciar")
+    http.add_argument("--modo-servidor", default="wsgi", choices=("wsgi", "asgi", "dev"))
+    http.add_argument("--requisicoes", type=int, default=200, help="requisições por rota")
+    http.add_argument("--concorrencia", type=int, default=8, help="requisições simultâneas")
+    http.add_argument("--com-cache", action="store_true", help="permite respostas do cache de resultados")
+    http.add_argument("--saida", help="arquivo JSON dos resultados")
+
+    comparacao = modos.add_parser("comparar", help="compara dois arquivos de resultado")
+    comparacao.add_argument("base")
+    comparacao.add_argument("novo")
+    comparacao.add_argument("--limiar", type=float, default=1.2, help="razão de tempo considerada regressão")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    opcoes = ler_argumentos(argv)
+
+    if opcoes.modo == "comparar":
+        return 1 if comparar(opcoes.base, opcoes.novo, opcoes.limiar) else 0
+
+    if opcoes.modo == "metodos":
+        tamanhos = TAMANHOS_RAPIDO if opcoes.rapido else tuple(int(n) for n in opcoes.tamanhos.split(","))
+        motores = opcoes.motores.split(",")
+        tipos = opcoes.tipos.split(",")
+        for motor in motores:
+            if motor not in MOTORES:
+                raise SystemExit(f"Motor desconhecido: {motor}. Use um de: {', '.join(MOTORES)}")
+        for tipo in tipos:
+            if tipo not in TIPOS_MATRIZ:
+                raise SystemExit(f"Tipo desconhecido: {tipo}. Use um de: {', '.join(TIPOS_MATRIZ)}")
+        resultados = []
+        if not opcoes.sem_raizes:
+            print("Raízes e derivada:")
+            resultados += benchmark_raizes(opcoes.repeticoes)
+        if not opcoes.sem_gauss:
+            print("Eliminação de Gauss:")
+            resultados += benchmark_gauss(tamanhos, motores, tipos, opcoes.repeticoes)
+        salvar(opcoes.saida, "metodos", resultados)
+        return 0
+
+    servidor = iniciar_servidor(opcoes.porta, opcoes.modo_servidor) if opcoes.iniciar else None
+    url = f"http://127.0.0.1:{opcoes.porta}" if opcoes.iniciar else opcoes.url.rstrip("/")
+    try:
+        print(f"Carga HTTP em {url}:")
+        resultados = benchmark_http(url, opcoes.requisicoes, opcoes.concorrencia, opcoes.com_cache)
+    finally:
+        if servidor is not None:
+            servidor.terminate()
+            servidor.wait(10)
+    salvar(opcoes.saida, "http", resultados)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
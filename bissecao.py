@@ -1,18 +1,43 @@
 import math
-# Importa o módulo math, que contém funções matemáticas como sin, cos, exp, log etc.
-# Se remover esta linha: qualquer chamada math.algo vai gerar erro (NameError).
+# Importa o módulo math (log2, ceil, copysign) usado pelos métodos de Brent e ITP.
 
+from expressao import compilar_funcao
+# Importa a camada que valida e compila a função digitada pelo usuário (com cache).
+# Se remover esta linha: compilar_funcao não existe e a bisseção não consegue montar f(x).
 
-def bissecao(funcao_str, a, b, tol=1e-6, max_iter=100):
+from limites import LimiteExcedido, Orcamento
+# Limites de avaliações e de tempo por requisição (resolver_intervalo).
+
+
+def obter_funcao(funcao):
+    """
+    Aceita a função como texto (compila com cache) ou como função Python já pronta.
+    """
+    if callable(funcao):
+        return funcao
+    return compilar_funcao(funcao)
+
+
+def mudanca_de_sinal(fa, fb):
+    """
+    True se f(a) e f(b) têm sinais opostos (existe raiz em [a, b]).
+    Um extremo com f exatamente zero não conta: mesma convenção de todos os métodos com intervalo.
+    """
+    return fa * fb < 0
+
+
+def bissecao(funcao_str, a, b, tol=1e-6, max_iter=100, progresso=None, historico=None):
     # Define a função principal do método da bisseção, usada pelo backend.
     # Se remover a função inteira, o backend não conseguirá calcular bisseção.
 
     """
     Método da Bisseção para a API:
-    - funcao_str: string com f(x), ex: "x**3 - x - 1"
+    - funcao_str: string com f(x), ex: "x**3 - x - 1" (ou uma função Python f(x))
     - a, b: limites do intervalo [a, b]
     - tol: tolerância
     - max_iter: número máximo de iterações
+    - progresso: callback opcional chamado a cada iteração com o intervalo atual
+    - historico: Historico opcional (campos=2) que recebe o intervalo [a, b] de cada iteração
 
     Retorna:
       - raiz (float) se deu certo
@@ -21,31 +46,11 @@ def bissecao(funcao_str, a, b, tol=1e-6, max_iter=100):
     # Este bloco é apenas documentação; removê-lo não afeta o funcionamento.
 
 
-    def f(x):
-        # Define uma função interna f(x) que avalia a expressão digitada pelo usuário.
-        # Se remover essa função, você não teria como calcular f(a), f(b) nem f(c),
-        # então o método de bisseção quebra completamente.
-
-        contexto = {
-            "x": x,         # variável usada na expressão; sem isso, 'x' seria indefinida.
-            "math": math,   # permite usar math.sin, math.exp etc.
-            "e": math.e,    # permite usar 'e' diretamente na expressão.
-            "pi": math.pi,  # permite usar 'pi' diretamente.
-            "sin": math.sin,  # permite usar sin(x); se remover, daria erro ao usar sin().
-            "cos": math.cos,  # idem para cos(x).
-            "tan": math.tan,  # idem para tan(x).
-            "log": math.log,  # log natural.
-            "exp": math.exp,  # exponencial e^x.
-            "sqrt": math.sqrt, # raiz quadrada.
-            "log10": math.log10, # log base 10.
-        }
-        # O contexto controla o que o usuário pode usar.
-        # Sem isso, o usuário teria acesso a funções perigosas via eval.
-
-        return eval(funcao_str, {"__builtins__": {}}, contexto)
-        # Avalia a função digitada com segurança.
-        # Se remover o segundo argumento {"__builtins__": {}}, o usuário pode rodar código malicioso.
-        # Se remover o contexto, funções como sin, exp etc. não funcionariam.
+    f = obter_funcao(funcao_str)
+    # Compila a expressão digitada pelo usuário uma única vez (parse + validação),
+    # reaproveitando o cache quando a mesma função já foi usada antes.
+    # Se remover, você não teria como calcular f(a), f(b) nem f(c),
+    # então o método de bisseção quebra completamente.
 
 
     fa = f(a)
@@ -58,7 +63,7 @@ def bissecao(funcao_str, a, b, tol=1e-6, max_iter=100):
 
 
     # condição de existência de raiz (mudança de sinal)
-    if fa * fb >= 0:
+    if not mudanca_de_sinal(fa, fb):
         # Testa se f(a) e f(b) têm sinais opostos.
         # O método de bisseção só funciona se houver mudança de sinal.
         # Se remover essa verificação, o método pode entrar em intervalo sem raiz ou divergir.
@@ -68,10 +73,18 @@ def bissecao(funcao_str, a, b, tol=1e-6, max_iter=100):
         # Retorna None para indicar erro ao backend.
 
 
-    for _ in range(1, max_iter + 1):
+    for iteracao in range(1, max_iter + 1):
         # Loop principal da bisseção, repetindo até atingir max_iter.
         # Se remover o for, o algoritmo nunca calculará os passos da bisseção.
 
+        if progresso is not None:
+            progresso(iteracao=iteracao, a=a, b=b, largura=abs(b - a))
+            # Informa o intervalo atual a quem acompanha o cálculo (trabalhos assíncronos).
+
+        if historico is not None:
+            historico.registrar(a, b)
+            # Guarda o intervalo atual (conforme o modo do histórico).
+
         c = (a + b) / 2
         # Calcula o ponto médio do intervalo [a, b].
         # Se remover, você não teria novo candidato à raiz.
@@ -109,3 +122,228 @@ def bissecao(funcao_str, a, b, tol=1e-6, max_iter=100):
     return (a + b) / 2
     # Valor aproximado caso não tenha atingido o critério de parada antes.
     # Se remover, o método terminaria sem retorno (erro).
+
+
+
+def brent(funcao_str, a, b, tol=1e-6, max_iter=100):
+    """
+    Método de Brent: combina interpolação quadrática inversa, secante e bisseção.
+    Mantém sempre a raiz dentro de um intervalo com mudança de sinal (como a
+    bisseção), mas converge de forma superlinear quando f é bem comportada.
+
+    Mesmos parâmetros e retorno de bissecao().
+    """
+    f = obter_funcao(funcao_str)
+    fa = f(a)
+    fb = f(b)
+    if not mudanca_de_sinal(fa, fb):
+        # Sem mudança de sinal: mesma convenção da bisseção.
+        return None
+
+    c, fc = b, fb
+    d = e = b - a
+    for _ in range(max_iter):
+        if fb * fc > 0:
+            # b e c do mesmo lado: c volta a ser o outro extremo do intervalo.
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            # b deve ser sempre a melhor aproximação.
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2 * 2.2e-16 * abs(b) + 0.5 * tol
+        xm = 0.5 * (c - b)
+        # critério de parada (mesmo espírito da bisseção: |f| ou intervalo pequenos)
+        if abs(fb) < tol or abs(xm) <= tol1:
+            return b
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            # Tenta interpolação (secante se a == c, quadrática inversa caso contrário).
+            s = fb / fa
+            if a == c:
+                p = 2 * xm * s
+                q = 1 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * xm * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q     # Interpolação aceita.
+            else:
+                d = e = xm          # Interpolação ruim: passo de bisseção.
+        else:
+            d = e = xm              # Convergência lenta: passo de bisseção.
+
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else math.copysign(tol1, xm)
+        fb = f(b)
+
+    return b
+
+
+def illinois(funcao_str, a, b, tol=1e-6, max_iter=100):
+    """
+    Regula falsi modificada (Illinois): o ponto é a interseção da secante com o
+    eixo x; quando o mesmo extremo fica parado duas vezes, o valor de f nele é
+    dividido por 2, o que evita a convergência lenta da regula falsi clássica.
+
+    Mesmos parâmetros e retorno de bissecao().
+    """
+    f = obter_funcao(funcao_str)
+    fa = f(a)
+    fb = f(b)
+    if not mudanca_de_sinal(fa, fb):
+        return None
+
+    for _ in range(max_iter):
+        c = (a * fb - b * fa) / (fb - fa)
+        # Raiz da secante que passa por (a, f(a)) e (b, f(b)).
+        fc = f(c)
+
+        # critério de parada
+        if abs(fc) < tol or abs(b - a) / 2 < tol:
+            return c
+
+        if fc * fb < 0:
+            # Mudança de sinal entre b e c: b passa a ser o extremo oposto.
+            a, fa = b, fb
+        else:
+            # O extremo a ficou parado: reduz seu peso (passo de Illinois).
+            fa /= 2
+        b, fb = c, fc
+
+    return b
+
+
+def itp(funcao_str, a, b, tol=1e-6, max_iter=100):
+    """
+    Método ITP (Interpolate, Truncate, Project – Oliveira e Takahashi, 2020).
+    Usa a regula falsi truncada e projetada numa vizinhança do ponto médio:
+    nunca precisa de mais iterações que a bisseção e, em funções suaves,
+    converge de forma superlinear.
+
+    Mesmos parâmetros e retorno de bissecao().
+    """
+    if not (tol > 0 and math.isfinite(tol)):
+        raise ValueError("A tolerância do ITP precisa ser positiva e finita")
+    if not math.isfinite(b - a):
+        raise ValueError("O intervalo do ITP precisa ser finito (b - a estoura o maior float)")
+    f = obter_funcao(funcao_str)
+    fa = f(a)
+    fb = f(b)
+    if not mudanca_de_sinal(fa, fb):
+        return None
+
+    if a > b:
+        # O método supõe a < b.
+        a, b, fa, fb = b, a, fb, fa
+    sinal = 1 if fa < 0 else -1
+    # O método supõe f(a) < 0 < f(b); se for o contrário, trabalha com -f.
+    ya, yb = sinal * fa, sinal * fb
+
+    k1 = 0.2 / (b - a)
+    k2 = 2
+    n0 = 1
+    n_max = max(0, math.ceil(math.log2(b - a) - math.log2(tol) - 1)) + n0
+    # Máximo de iterações que a bisseção levaria (+ folga n0).
+
+    for j in range(max_iter):
+        if b - a <= 2 * tol:
+            break
+        x_meio = (a + b) / 2
+        try:
+            raio = math.ldexp(tol, n_max - j)             # tol * 2^(n_max - j) sem o inteiro 2**n gigante
+        except OverflowError:
+            raio = math.inf
+        r = min(raio, b - a) - (b - a) / 2
+        # Limitar em b - a não muda nada: com r >= (b - a) / 2 a projeção nunca atua.
+        delta = k1 * (b - a) * (b - a) ** (k2 - 1)        # k1·(b - a) <= 0.2 primeiro: (b - a)**2 pode estourar
+
+        # Interpolação (regula falsi)
+        x_f = (yb * a - ya * b) / (yb - ya)
+        # Truncamento: afasta x_f no máximo delta na direção do ponto médio
+        sigma = math.copysign(1, x_meio - x_f)
+        x_t = x_f + sigma * delta if delta <= abs(x_meio - x_f) else x_meio
+        # Projeção: mantém o ponto a no máximo r do ponto médio
+        x_itp = x_t if abs(x_t - x_meio) <= r else x_meio - sigma * r
+
+        y_itp = sinal * f(x_itp)
+        if abs(y_itp) < tol:
+            return x_itp
+        if y_itp > 0:
+            b, yb = x_itp, y_itp
+        else:
+            a, ya = x_itp, y_itp
+
+    return (a + b) / 2
+
+
+METODOS_INTERVALO = {
+    "bissecao": bissecao,
+    "brent": brent,
+    "illinois": illinois,
+    "itp": itp,
+}
+# Métodos com intervalo (bracketing) disponíveis na rota /bissecao (parâmetro "metodo").
+
+
+def resolver_intervalo(funcao_str, a, b, tol=1e-6, max_iter=100, metodo="bissecao", progresso=None,
+                       max_avaliacoes=None, tempo_maximo=None, historico=None):
+    """
+    Resolve f(x) = 0 em [a, b] com o método escolhido e conta as avaliações de f.
+
+    Retorna um dicionário:
+      - raiz: float, ou None se f(a) e f(b) não tiverem sinais opostos
+      - avaliacoes: quantas vezes f(x) foi calculada
+    Lança ValueError se o método não existir.
+
+    progresso: callback opcional; a bisseção informa o intervalo a cada iteração,
+    os outros métodos informam cada ponto avaliado (x e número de avaliações).
+
+    max_avaliacoes, tempo_maximo: limites do cálculo (ver limites.Orcamento). Ao
+    atingir um deles, raiz é o último ponto avaliado e o dicionário ganha
+    "convergiu": False, "limite" ("avaliacoes" ou "tempo") e "mensagem".
+
+    historico: Historico opcional (campos=2) com os intervalos [a, b] da
+    bisseção; o dicionário ganha "historico" (ver Historico.resposta).
+    Só a bisseção tem histórico (ValueError nos outros métodos).
+    """
+    if metodo not in METODOS_INTERVALO:
+        raise ValueError(
+            f"Método desconhecido: {metodo}. Use um de: {', '.join(METODOS_INTERVALO)}"
+        )
+    if historico is not None and historico.modo != "nenhum" and metodo != "bissecao":
+        raise ValueError("O histórico de intervalos só está disponível para o método 'bissecao'")
+    campos_historico = historico.resposta if historico is not None else dict
+    f = obter_funcao(funcao_str)
+    orcamento = Orcamento(max_avaliacoes, tempo_maximo)
+    ultimo_x = None
+
+    def f_contada(x):
+        nonlocal ultimo_x
+        orcamento.cobrar()
+        ultimo_x = x
+        if progresso is not None and metodo != "bissecao":
+            progresso(avaliacoes=orcamento.avaliacoes, x=x)
+        return f(x)
+
+    try:
+        if metodo == "bissecao":
+            raiz = bissecao(f_contada, a, b, tol, max_iter, progresso, historico)
+        else:
+            raiz = METODOS_INTERVALO[metodo](f_contada, a, b, tol, max_iter)
+    except LimiteExcedido as e:
+        return {
+            "raiz": ultimo_x,
+            "avaliacoes": orcamento.avaliacoes,
+            "convergiu": False,
+            "limite": e.motivo,
+            "mensagem": str(e),
+            **campos_historico(),
+        }
+    return {"raiz": raiz, "avaliacoes": orcamento.avaliacoes, **campos_historico()}
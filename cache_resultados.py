@@ -0,0 +1,224 @@
+"""
+Cache de resultados das rotas de cálculo. Os métodos são determinísticos: a
+mesma entrada (função, limites, tolerância, max_iter, matriz...) sempre dá
+o mesmo resultado, então ele é guardado por uma chave canônica da entrada.
+
+Dois níveis:
+  memória  LRU com limite de bytes e validade (TTL), por processo
+  disco    opcional, SQLite: sobrevive a reinícios e é compartilhado pelos workers
+
+Os resultados são guardados em JSON (nunca pickle: o arquivo em disco não
+pode executar código ao ser lido), e a chave inclui a versão do formato e
+do código dos métodos, para que uma mudança no código não devolva resultados antigos.
+"""
+# Usado pelo backend (função calcular) para não refazer cálculos já feitos.
+
+import hashlib                                            # Chave: hash da forma canônica da entrada
+import json                                               # Chave e resultados guardados (memória e disco)
+import os
+import sqlite3                                            # Nível em disco (opcional)
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from expressao import forma_canonica
+
+
+VERSAO_ESQUEMA = 2                                        # Formato da chave e do valor guardado (2: JSON)
+
+
+def _versao_codigo():
+    """Hash dos módulos .py do projeto: qualquer mudança no código invalida os resultados guardados."""
+    pasta = os.path.dirname(os.path.abspath(__file__))
+    h = hashlib.sha256()
+    for nome in sorted(os.listdir(pasta)):
+        if nome.endswith(".py"):
+            h.update(nome.encode())
+            with open(os.path.join(pasta, nome), "rb") as arquivo:
+                h.update(arquivo.read())
+    return h.hexdigest()[:16]
+
+
+VERSAO = f"{VERSAO_ESQUEMA}:{_versao_codigo()}"          # Entra em todas as chaves
+
+
+ARGUMENTOS_EXPRESSAO = {                                  # Tarefa -> posições dos argumentos que são expressões (texto ou lista de textos)
+    "newton": (0,),
+    "sistema": (0,),
+    "intervalo": (0,),
+    "varredura": (0,),
+    "raizes_polinomio": (0,),
+}
+CAMPOS_EXPRESSAO = ("funcao",)                            # Chaves de dicionário com expressões (itens de lote)
+
+
+def _expressao(valor):
+    """Forma canônica de uma expressão (ou lista de expressões); outros valores seguem _canonico."""
+    if isinstance(valor, str):
+        return ["expressao", forma_canonica(valor)]       # Funções escritas de jeitos diferentes
+    if isinstance(valor, (list, tuple)):
+        return [_expressao(v) for v in valor]
+    return _canonico(valor)
+
+
+def _canonico(valor):
+    """Forma canônica (serializável em JSON) de um argumento da tarefa."""
+    if isinstance(valor, bool) or valor is None:
+        return valor
+    if isinstance(valor, (float, np.floating)):
+        return float(valor)
+    if isinstance(valor, (int, np.integer)):
+        valor = int(valor)
+        try:
+            como_float = float(valor)
+        except OverflowError:                             # Acima de ~1e308: fica inteiro
+            return valor
+        return como_float if int(como_float) == valor else valor  # 1 e 1.0 juntos só se o float for exato (sem colisões acima de 2**53)
+    if isinstance(valor, str):
+        return valor                                      # Textos comuns (metodo, motor...) como vieram
+    if isinstance(valor, np.ndarray):
+        dados = np.ascontiguousarray(valor, dtype=float)
+        return ["ndarray", list(dados.shape), hashlib.sha256(dados.tobytes()).hexdigest()]
+    if isinstance(valor, (list, tuple)):
+        if len(valor) > 16:                               # Vetores e matrizes grandes: hash dos dados, sem percorrer em Python
+            try:
+                dados = np.asarray(valor)
+            except (TypeError, ValueError, OverflowError):  # Listas irregulares
+                dados = None
+            if dados is not None and (dados.dtype.kind == "f" or (   # Só números: "1" (texto) não vira 1.0
+                    dados.dtype.kind in "iu" and np.all(np.abs(dados) <= 2 ** 53))):  # inteiros exatos em float, como nos escalares
+                return _canonico(dados)
+        return [_canonico(v) for v in valor]
+    if isinstance(valor, dict):
+        return {str(k): _expressao(v) if k in CAMPOS_EXPRESSAO else _canonico(v) for k, v in valor.items()}
+    raise TypeError(f"Argumento sem forma canônica: {type(valor).__name__}")
+
+
+def _serializar(resultado):
+    """JSON do resultado; as tuplas do nível de cima (rotas que desempacotam) voltam como tuplas."""
+    return json.dumps([isinstance(resultado, tuple), resultado], separators=(",", ":")).encode()
+
+
+def _desserializar(serializado):
+    tupla, resultado = json.loads(serializado)
+    return tuple(resultado) if tupla else resultado
+
+
+def chave_resultado(nome, args):
+    """
+    Chave do cache: hash do nome da tarefa e da forma canônica dos argumentos.
+    Só os argumentos de ARGUMENTOS_EXPRESSAO (e os campos CAMPOS_EXPRESSAO) são
+    reescritos como expressão; os demais textos entram como vieram.
+    """
+    expressoes = ARGUMENTOS_EXPRESSAO.get(nome, ())
+    canonicos = [_expressao(v) if i in expressoes else _canonico(v) for i, v in enumerate(args)]
+    texto = json.dumps([VERSAO, nome, canonicos], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(texto.encode()).hexdigest()
+
+
+class CacheResultados:
+    """
+    Parâmetros:
+    limite_bytes: memória máxima dos resultados guardados (LRU descarta os menos usados)
+    validade: segundos que um resultado vale (None = não expira)
+    arquivo: caminho do banco SQLite do nível em disco (None = só memória)
+    """
+
+    def __init__(self, limite_bytes=64 * 1024 * 1024, validade=3600, arquivo=None):
+        self.limite_bytes = limite_bytes
+        self.validade = validade
+        self.bytes_usados = 0
+        self.acertos_memoria = 0
+        self.acertos_disco = 0
+        self.faltas = 0
+        self._itens = OrderedDict()                       # chave -> (instante em que foi guardado, resultado serializado)
+        self._trava = threading.Lock()
+        self._banco = None
+        if arquivo:
+            self._banco = sqlite3.connect(arquivo, timeout=10, check_same_thread=False)
+            self._banco.execute(
+                "CREATE TABLE IF NOT EXISTS resultados (chave TEXT PRIMARY KEY, guardado_em REAL, valor BLOB)"
+            )
+            self._banco.commit()
+
+    def _valido(self, guardado_em, agora):
+        return self.validade is None or agora - guardado_em < self.validade
+
+    def obter(self, chave):
+        """Devolve (True, resultado) se a chave está no cache e ainda vale, senão (False, None)."""
+        agora = time.time()
+        with self._trava:
+            item = self._itens.get(chave)
+            if item is not None:
+                if self._valido(item[0], agora):
+                    self._itens.move_to_end(chave)
+                    self.acertos_memoria += 1
+                    return True, _desserializar(item[1])  # Cópia nova: quem recebe pode alterar à vontade
+                self._remover(chave)
+
+            if self._banco is not None:
+                linha = self._banco.execute(
+                    "SELECT guardado_em, valor FROM resultados WHERE chave = ?", (chave,)
+                ).fetchone()
+                if linha is not None and self._valido(linha[0], agora):
+                    self._guardar_memoria(chave, linha[0], linha[1])  # Sobe para a memória
+                    self.acertos_disco += 1
+                    return True, _desserializar(linha[1])
+
+            self.faltas += 1
+            return False, None
+
+    def guardar(self, chave, resultado):
+        try:
+            serializado = _serializar(resultado)
+        except (TypeError, ValueError):                   # Não cabe em JSON: simplesmente não vai para o cache
+            return
+        agora = time.time()
+        with self._trava:
+            self._guardar_memoria(chave, agora, serializado)
+            if self._banco is not None:
+                self._banco.execute(
+                    "INSERT OR REPLACE INTO resultados (chave, guardado_em, valor) VALUES (?, ?, ?)",
+                    (chave, agora, serializado),
+                )
+                if self.validade is not None:             # Aproveita a escrita para apagar os vencidos
+                    self._banco.execute("DELETE FROM resultados WHERE guardado_em < ?", (agora - self.validade,))
+                self._banco.commit()
+
+    def _guardar_memoria(self, chave, guardado_em, serializado):
+        if len(serializado) > self.limite_bytes:          # Maior que o orçamento inteiro: não guarda na memória
+            return
+        self._remover(chave)
+        self._itens[chave] = (guardado_em, serializado)
+        self.bytes_usados += len(serializado)
+        while self.bytes_usados > self.limite_bytes:      # Descarta os menos usados até caber
+            _, (_, antigo) = self._itens.popitem(last=False)
+            self.bytes_usados -= len(antigo)
+
+    def _remover(self, chave):
+        item = self._itens.pop(chave, None)
+        if item is not None:
+            self.bytes_usados -= len(item[1])
+
+    def limpar(self):
+        with self._trava:
+            self._itens.clear()
+            self.bytes_usados = 0
+            if self._banco is not None:
+                self._banco.execute("DELETE FROM resultados")
+                self._banco.commit()
+
+    def estatisticas(self):
+        with self._trava:
+            return {
+                "itens": len(self._itens),
+                "bytes_usados": self.bytes_usados,
+                "limite_bytes": self.limite_bytes,
+                "validade": self.validade,
+                "disco": self._banco is not None,
+                "acertos_memoria": self.acertos_memoria,
+                "acertos_disco": self.acertos_disco,
+                "faltas": self.faltas,
+            }
@@ -1,3 +1,12 @@
+import math
+# Importa o módulo math, usado pela derivada automática (regras de derivação de sin, exp, log...).
+try:
+    import numpy as np
+    # Opcional: só a derivada_richardson com x em array usa (escolha ponto a ponto).
+except ImportError:
+    np = None
+
+
 def derivada_numerica(f, x, h=1e-6):
     # Define a função derivada_numerica, que calcula a derivada aproximada de f(x).
     # - f: é a função original (ex: lambda x: x**2)
@@ -19,6 +28,11 @@ def derivada_numerica(f, x, h=1e-6):
     # Se você remover, nada muda no funcionamento.
     # Serve apenas para explicar a função.
 
+    h = passo(x, h)
+    # Ajusta o passo ao tamanho de x (ver passo()).
+    # Se remover, para |x| grande o h fixo some no arredondamento de x + h
+    # (ex: x = 1e12 → x + 1e-6 == x) e a derivada sai zero ou lixo.
+
     return (f(x + h) - f(x - h)) / (2 * h)
     # Retorna a fórmula da derivada numérica pela diferença central.
     #
@@ -34,3 +48,258 @@ def derivada_numerica(f, x, h=1e-6):
 # MÉTODO DA DERIVADA
 # Apenas um comentário explicando o tema.
 # Pode remover que nada muda no funcionamento.
+
+
+def passo(x, h):
+    """
+    Passo da diferença finita proporcional a x: h·(1 + |x|), arredondado para
+    que x + passo seja exatamente representável (o passo usado na conta é o
+    passo real entre os pontos avaliados). Funciona com floats e arrays do NumPy.
+    """
+    h = h * (1 + abs(x))
+    return (x + h) - x
+
+
+def derivada_richardson(f, x, h=1e-2, niveis=4, fator=2.0):
+    """
+    Derivada por extrapolação de Richardson: diferenças centrais com passos
+    h, h/fator, h/fator², ... combinadas para cancelar os termos h², h⁴, ...
+    do erro. Em cada nível, a diferença entre as duas melhores estimativas é a
+    estimativa do erro; devolve a estimativa de menor erro (o erro volta a
+    crescer quando o arredondamento passa a dominar).
+
+    - f: função de x (com x array, f precisa aceitar arrays: cada ponto é tratado separadamente)
+    - h: passo inicial (relativo, ver passo())
+    - niveis: quantas diferenças centrais (2·niveis avaliações de f)
+
+    Retorna:
+    (derivada, erro estimado)
+    """
+    h = passo(x, h)
+    anterior = None
+    melhor = erro = None
+    for i in range(niveis):
+        linha = [(f(x + h) - f(x - h)) / (2 * h)]
+        for k in range(1, i + 1):                         # Tabela de Richardson: elimina o termo h^(2k)
+            potencia = fator ** (2 * k)
+            linha.append(linha[k - 1] + (linha[k - 1] - anterior[k - 1]) / (potencia - 1))
+        if anterior is not None:
+            estimativa = abs(linha[i] - anterior[i - 1])
+            melhor, erro = _menor_erro(linha[i], estimativa, melhor, erro)
+        anterior = linha
+        h = h / fator
+    if melhor is None:                                    # niveis=1: diferença central simples, sem estimativa
+        return anterior[0], math.inf
+    return melhor, erro
+
+
+def _menor_erro(valor, estimativa, melhor, erro):
+    if melhor is None:
+        return valor, estimativa
+    if hasattr(estimativa, "shape"):                      # Arrays: escolhe ponto a ponto
+        menor = estimativa < erro
+        return np.where(menor, valor, melhor), np.where(menor, estimativa, erro)  # Sem inf*0: o candidato rejeitado não vira nan
+    if estimativa < erro:
+        return valor, estimativa
+    return melhor, erro
+
+
+def jacobiana_numerica(F, x, h=1e-6):
+    """
+    Jacobiana de F: R^n → R^m por diferença central, com o passo de cada
+    variável ajustado ao seu tamanho (ver passo()). 2n avaliações de F.
+
+    - F: função que recebe x (lista) e devolve a lista F(x)
+
+    Retorna:
+    J como lista de m linhas com n elementos (J[i][j] = ∂F_i/∂x_j)
+    """
+    x = [float(v) for v in x]
+    colunas = []
+    for j, xj in enumerate(x):
+        hj = passo(xj, h)
+        mais, menos = list(x), list(x)
+        mais[j] = xj + hj
+        menos[j] = xj - hj
+        colunas.append([(a - b) / (2 * hj) for a, b in zip(F(mais), F(menos))])
+    return [list(linha) for linha in zip(*colunas)]
+
+
+def gradiente(f, x, h=1e-6):
+    """
+    Gradiente de f: R^n → R (lista com ∂f/∂x_j), pela mesma diferença central de jacobiana_numerica.
+    """
+    return jacobiana_numerica(lambda ponto: [f(ponto)], x, h)[0]
+
+
+# DERIVADA AUTOMÁTICA (modo direto, números duais)
+# Um número dual guarda o valor f(x) e a derivada f'(x) juntos.
+# Avaliando a expressão com x = Dual(x, 1), cada operação aplica a regra
+# de derivação correspondente e, no final, temos f(x) e f'(x) em UMA passada,
+# sem o erro de truncamento da diferença central.
+
+
+class Dual:
+    """
+    Número dual: valor + derivada.
+    Suporta +, -, *, /, **, %, // e as funções de FUNCOES_DUAIS.
+    """
+    __slots__ = ("valor", "derivada")
+
+    def __init__(self, valor, derivada=0.0):
+        self.valor = valor
+        self.derivada = derivada
+
+    def __repr__(self):
+        return f"Dual({self.valor!r}, {self.derivada!r})"
+
+    def __add__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor + outro.valor, self.derivada + outro.derivada)
+        return Dual(self.valor + outro, self.derivada)
+
+    __radd__ = __add__
+
+    def __sub__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor - outro.valor, self.derivada - outro.derivada)
+        return Dual(self.valor - outro, self.derivada)
+
+    def __rsub__(self, outro):
+        return Dual(outro - self.valor, -self.derivada)
+
+    def __mul__(self, outro):
+        if isinstance(outro, Dual):
+            # regra do produto: (uv)' = u'v + uv'
+            return Dual(self.valor * outro.valor,
+                        self.derivada * outro.valor + self.valor * outro.derivada)
+        return Dual(self.valor * outro, self.derivada * outro)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, outro):
+        if isinstance(outro, Dual):
+            # regra do quociente: (u/v)' = (u'v - uv') / v²
+            return Dual(self.valor / outro.valor,
+                        (self.derivada * outro.valor - self.valor * outro.derivada) / outro.valor ** 2)
+        return Dual(self.valor / outro, self.derivada / outro)
+
+    def __rtruediv__(self, outro):
+        return Dual(outro / self.valor, -outro * self.derivada / self.valor ** 2)
+
+    def __pow__(self, outro):
+        if isinstance(outro, Dual) and outro.derivada != 0:
+            # expoente variável: (u^v)' = u^v · (v' ln u + v u'/u)
+            valor = self.valor ** outro.valor
+            return Dual(valor, valor * (outro.derivada * math.log(self.valor)
+                                        + outro.valor * self.derivada / self.valor))
+        n = outro.valor if isinstance(outro, Dual) else outro
+        if self.derivada == 0:
+            return Dual(self.valor ** n, 0.0)
+        try:
+            # expoente constante: (u^n)' = n u^(n-1) u'
+            return Dual(self.valor ** n, n * self.valor ** (n - 1) * self.derivada)
+        except ZeroDivisionError:
+            # ex: sqrt em 0 (x**0.5): valor finito, derivada infinita
+            return Dual(self.valor ** n, math.copysign(math.inf, n * self.derivada))
+
+    def __rpow__(self, base):
+        # base constante: (c^u)' = c^u · ln c · u'
+        valor = base ** self.valor
+        if self.derivada == 0 or valor == 0:
+            return Dual(valor, 0.0)
+        return Dual(valor, valor * math.log(base) * self.derivada)
+
+    def __mod__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor % outro.valor,
+                        self.derivada - (self.valor // outro.valor) * outro.derivada)
+        return Dual(self.valor % outro, self.derivada)
+
+    def __rmod__(self, outro):
+        return Dual(outro % self.valor, -(outro // self.valor) * self.derivada)
+
+    def __floordiv__(self, outro):
+        n = outro.valor if isinstance(outro, Dual) else outro
+        return Dual(self.valor // n, 0.0)                 # constante por partes: derivada 0
+
+    def __rfloordiv__(self, outro):
+        return Dual(outro // self.valor, 0.0)
+
+    def __neg__(self):
+        return Dual(-self.valor, -self.derivada)
+
+    def __pos__(self):
+        return self
+
+
+def _unaria(funcao, derivada):
+    """
+    Monta a versão dual de uma função de uma variável: aplica a regra da cadeia
+    (f(u))' = f'(u) · u'. Para números comuns, chama a função original.
+    """
+    def aplicar(u):
+        if isinstance(u, Dual):
+            return Dual(funcao(u.valor), derivada(u.valor) * u.derivada)
+        return funcao(u)
+    return aplicar
+
+
+def _log_dual(u, base=None):
+    """
+    log(u) ou log(u, base) aceitando números duais.
+    """
+    if base is None:
+        return _log_natural(u)
+    return _log_natural(u) / _log_natural(base)
+
+
+_log_natural = _unaria(math.log, lambda v: 1 / v)
+
+
+def _pow_dual(u, v):
+    """
+    math.pow aceitando números duais.
+    """
+    if isinstance(u, Dual) or isinstance(v, Dual):
+        return (u if isinstance(u, Dual) else Dual(u)) ** v
+    return math.pow(u, v)
+
+
+def _atan2_dual(y, x):
+    """
+    math.atan2 aceitando números duais.
+    """
+    if not isinstance(y, Dual) and not isinstance(x, Dual):
+        return math.atan2(y, x)
+    y = y if isinstance(y, Dual) else Dual(y)
+    x = x if isinstance(x, Dual) else Dual(x)
+    r2 = x.valor ** 2 + y.valor ** 2
+    return Dual(math.atan2(y.valor, x.valor), (x.valor * y.derivada - y.valor * x.derivada) / r2)
+
+
+# Versões duais das funções matemáticas (mesmos nomes de math)
+FUNCOES_DUAIS = {
+    "sin": _unaria(math.sin, math.cos),
+    "cos": _unaria(math.cos, lambda v: -math.sin(v)),
+    "tan": _unaria(math.tan, lambda v: 1 / math.cos(v) ** 2),
+    "asin": _unaria(math.asin, lambda v: 1 / math.sqrt(1 - v * v)),
+    "acos": _unaria(math.acos, lambda v: -1 / math.sqrt(1 - v * v)),
+    "atan": _unaria(math.atan, lambda v: 1 / (1 + v * v)),
+    "sinh": _unaria(math.sinh, math.cosh),
+    "cosh": _unaria(math.cosh, math.sinh),
+    "tanh": _unaria(math.tanh, lambda v: 1 - math.tanh(v) ** 2),
+    "asinh": _unaria(math.asinh, lambda v: 1 / math.sqrt(v * v + 1)),
+    "acosh": _unaria(math.acosh, lambda v: 1 / math.sqrt(v * v - 1)),
+    "atanh": _unaria(math.atanh, lambda v: 1 / (1 - v * v)),
+    "exp": _unaria(math.exp, math.exp),
+    "expm1": _unaria(math.expm1, math.exp),
+    "log": _log_dual,
+    "log10": _unaria(math.log10, lambda v: 1 / (v * math.log(10))),
+    "log2": _unaria(math.log2, lambda v: 1 / (v * math.log(2))),
+    "log1p": _unaria(math.log1p, lambda v: 1 / (1 + v)),
+    "sqrt": _unaria(math.sqrt, lambda v: 0.5 / math.sqrt(v) if v else math.inf),
+    "fabs": _unaria(math.fabs, lambda v: math.copysign(1.0, v)),
+    "pow": _pow_dual,
+    "atan2": _atan2_dual,
+}
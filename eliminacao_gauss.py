@@ -4,6 +4,15 @@ Inclui as versões com e sem pivoteamento parcial.
 """
 # Comentário simples explicando o propósito do arquivo. Não afeta a execução.
 
+try:
+    import numpy as np                                    # Opcional: usado pelos motores "numpy" e "blocado"
+    from fatoracao_lu import fatorar_lu_blocado, resolver_lu  # Fatoração em blocos do motor "blocado"
+except ImportError:
+    np = None
+
+MOTORES = ("python", "numpy", "blocado")                  # Implementações disponíveis da eliminação
+NIVEIS_ETAPAS = ("completa", "deltas", "pivos", "nenhuma") # Níveis aceitos em registrar_etapas
+
 
 def criar_matriz(n):                                      # Define a função que cria uma matriz n x (n+1)
     """
@@ -55,55 +64,288 @@ def encontrar_pivo_maximo(matriz, i, n):                  # Localiza o maior ele
             max_i = k                                     # Atualiza a linha onde está esse maior pivô
 
     return max_i                                          # Retorna o índice da linha com o maior pivô
-def eliminacao_gauss(matriz, usar_pivoteamento=False):                       # Função principal que resolve o sistema pelo método de Gauss
+def passos_eliminacao(matriz_atual, usar_pivoteamento=False):             # Eliminação progressiva, passo a passo (listas)
     """
-    Resolve um sistema de equações lineares usando o método de eliminação de Gauss.
-    
-    Parâmetros:
-    matriz: matriz aumentada do sistema [A|b]
-    usar_pivoteamento: se True, usa pivoteamento parcial
-    
-    Retorna:
-    solucao: lista com as soluções do sistema
-    etapas: lista com as etapas da eliminação
-    status: mensagem indicando o status da resolução
+    Faz a eliminação progressiva sobre matriz_atual (alterada no lugar) e
+    devolve, um a um, os passos realizados:
+      ("troca", i, k)            troca das linhas i e k
+      ("pivo", i, valor)         pivô escolhido para a coluna i
+      ("eliminacao", j, i, fator) L_j = L_j - fator * L_i
+      ("singular", i)            pivô quase zero: a eliminação para aqui
     """
-    n = len(matriz)                                                          # Número de equações (n linhas da matriz)
-    etapas = []                                                              # Lista onde serão salvas as matrizes de cada etapa do processo
-    matriz_atual = copiar_matriz(matriz)                                    # Cria uma cópia da matriz original para não alterá-la diretamente
-    etapas.append(copiar_matriz(matriz_atual))                              # Armazena a matriz inicial como primeira etapa
-    
-    # Eliminação progressiva
+    n = len(matriz_atual)                                                    # Número de equações
     for i in range(n):                                                      # Loop sobre as colunas/linhas pivotais (da linha 0 até n-1)
         if usar_pivoteamento:                                               # Se o pivoteamento parcial estiver ativado...
-            # Encontra o maior elemento na coluna atual
             max_i = encontrar_pivo_maximo(matriz_atual, i, n)               # Procura a linha com o maior valor absoluto na coluna i
             if max_i != i:                                                  # Se essa linha não for a própria linha i...
                 trocar_linhas(matriz_atual, i, max_i)                       # Troca a linha atual pela linha de maior pivô
-                etapas.append(copiar_matriz(matriz_atual))                  # Registra essa troca como uma nova etapa
-        
+                yield ("troca", i, max_i)
+
         pivo = matriz_atual[i][i]                                           # Pega o elemento da diagonal (pivô) na posição (i,i)
         if abs(pivo) < 1e-10:                                               # Se o pivô é praticamente zero...
-            return None, etapas, "Sistema singular - sem solução única"     # Considera o sistema singular, sem solução única, e devolve as etapas feitas
-        
+            yield ("singular", i)                                           # Sistema singular, sem solução única
+            return
+        yield ("pivo", i, pivo)
+
         # Eliminação dos elementos abaixo do pivô
         for j in range(i + 1, n):                                           # Para cada linha abaixo da linha do pivô (i+1 até n-1)
             fator = matriz_atual[j][i] / pivo                               # Calcula o fator multiplicador para zerar o elemento da coluna i na linha j
             for k in range(i, n + 1):                                       # Percorre da coluna i até a última coluna (incluindo o termo independente)
                 matriz_atual[j][k] -= fator * matriz_atual[i][k]            # Faz L_j = L_j - fator * L_i (operação típica de eliminação de Gauss)
-            
-            if any(abs(matriz_atual[j][k]) > 1e-10 for k in range(n)):      # Se ainda há algum elemento relevante na linha j (não virou tudo "quase zero")
-                etapas.append(copiar_matriz(matriz_atual))                  # Registra a matriz após a eliminação dessa linha
-    
-    # Retrosubstituição
+            yield ("eliminacao", j, i, fator)
+
+
+def passos_eliminacao_numpy(matriz_atual, usar_pivoteamento=False):       # Mesma eliminação progressiva, com NumPy
+    """
+    Versão vetorizada de passos_eliminacao: cada coluna é eliminada de uma vez
+    com operações sobre fatias do array. Em vez de um passo "eliminacao" por
+    linha, devolve ("coluna", i, fatores) com os fatores de todas as linhas.
+    """
+    n = matriz_atual.shape[0]                                                # Número de equações
+    for i in range(n):                                                       # Coluna pivotal i
+        if usar_pivoteamento:
+            max_i = i + int(np.argmax(np.abs(matriz_atual[i:, i])))          # Mesmo critério de encontrar_pivo_maximo (primeiro maior)
+            if max_i != i:
+                matriz_atual[[i, max_i]] = matriz_atual[[max_i, i]]          # Troca as linhas i e max_i
+                yield ("troca", i, max_i)
+
+        pivo = matriz_atual[i, i]
+        if abs(pivo) < 1e-10:                                                # Pivô praticamente zero
+            yield ("singular", i)
+            return
+        yield ("pivo", i, float(pivo))
+
+        if i + 1 < n:
+            fatores = matriz_atual[i + 1:, i] / pivo                         # Fatores de todas as linhas abaixo do pivô
+            matriz_atual[i + 1:, i:] -= np.outer(fatores, matriz_atual[i, i:])  # L_j = L_j - fator_j * L_i para todas as linhas j
+            yield ("coluna", i, fatores)
+
+
+def retrosubstituicao(matriz_atual):                                        # Resolve o sistema triangular superior
+    """
+    Retrosubstituição sobre a matriz já escalonada.
+    Retorna a lista solução, ou None se algum elemento da diagonal for quase zero.
+    """
+    n = len(matriz_atual)
+    if np is not None and isinstance(matriz_atual, np.ndarray):             # Versão vetorizada
+        solucao = np.zeros(n)
+        for i in range(n - 1, -1, -1):                                       # De baixo para cima
+            if abs(matriz_atual[i, i]) < 1e-10:
+                return None
+            soma = matriz_atual[i, i + 1:n] @ solucao[i + 1:]                # Produto escalar com os x_j já conhecidos
+            solucao[i] = (matriz_atual[i, n] - soma) / matriz_atual[i, i]
+        return solucao.tolist()
+
     solucao = [0.0] * n                                                     # Cria a lista que vai guardar a solução (x1, x2, ..., xn)
     for i in range(n - 1, -1, -1):                                          # Faz o loop de baixo para cima (da última linha até a primeira)
         soma = sum(matriz_atual[i][j] * solucao[j] for j in range(i + 1, n))# Calcula a soma dos termos já conhecidos na linha i (a_i,j * x_j para j > i)
         if abs(matriz_atual[i][i]) < 1e-10:                                 # Se o elemento da diagonal é quase zero nessa fase...
-            return None, etapas, "Sistema singular - sem solução única"     # De novo considera sistema singular
+            return None                                                     # Sistema singular
         solucao[i] = (matriz_atual[i][n] - soma) / matriz_atual[i][i]       # Aplica a fórmula: x_i = (b_i - soma dos outros termos) / a_i,i
+    return solucao
+
+
+class RegistroEtapas:                                                       # Guarda as etapas conforme o nível escolhido
+    """
+    Registro das etapas da eliminação.
+
+    Níveis (registrar_etapas):
+    "completa": cópia da matriz a cada etapa (comportamento original)
+    "deltas":   só o que mudou em cada passo (troca, pivô, linha eliminada e fator);
+                as matrizes completas podem ser refeitas com reconstruir_etapas
+    "pivos":    só as trocas de linha e os pivôs escolhidos
+    "nenhuma":  nada é guardado (não custa nada além da própria eliminação)
+
+    guardar: se False, as etapas não ficam em self.etapas; quem chama usa o
+             retorno de registrar() (saída em fluxo, uma etapa por vez)
+    """
+
+    def __init__(self, nivel, matriz_inicial, guardar=True):
+        if nivel not in NIVEIS_ETAPAS:
+            raise ValueError(f"Nível de etapas desconhecido: {nivel}. Use um de: {', '.join(NIVEIS_ETAPAS)}")
+        self.nivel = nivel
+        self.guardar = guardar
+        self.etapas = []
+        self.inicial = _copiar(matriz_inicial) if nivel == "completa" else None  # Matriz inicial como primeira etapa
+        if self.inicial is not None and guardar:
+            self.etapas.append(self.inicial)
+
+    def registrar(self, matriz_atual, passo):
+        """Registra o passo; devolve a etapa criada, ou None se o nível não registra esse passo."""
+        etapa = self._etapa(matriz_atual, passo)
+        if etapa is not None and self.guardar:
+            self.etapas.append(etapa)
+        return etapa
+
+    def _etapa(self, matriz_atual, passo):
+        tipo = passo[0]
+        if self.nivel == "nenhuma" or tipo == "singular":
+            return None
+        if self.nivel == "completa":
+            if tipo in ("troca", "coluna"):
+                return _copiar(matriz_atual)
+            if tipo == "eliminacao" and linha_relevante(matriz_atual, passo[1]):
+                return _copiar(matriz_atual)                                 # Só registra se a linha não virou toda "quase zero"
+            return None
+        if self.nivel == "pivos" and tipo not in ("troca", "pivo"):
+            return None
+        return delta_do_passo(passo)
+
+
+def _copiar(matriz):
+    """
+    Cópia de uma matriz em listas (aceita listas ou array NumPy).
+    """
+    if np is not None and isinstance(matriz, np.ndarray):
+        return matriz.tolist()
+    return copiar_matriz(matriz)
+
+
+def linha_relevante(matriz, j):
+    """
+    True se a linha j ainda tem algum coeficiente de A maior que 1e-10.
+    """
+    n = len(matriz)
+    return any(abs(matriz[j][k]) > 1e-10 for k in range(n))
+
+
+def delta_do_passo(passo):
+    """
+    Representação compacta (dicionário pronto para JSON) de um passo da eliminação.
+    """
+    tipo = passo[0]
+    if tipo == "troca":
+        return {"tipo": "troca", "linhas": [passo[1], passo[2]]}
+    if tipo == "pivo":
+        return {"tipo": "pivo", "linha": passo[1], "valor": passo[2]}
+    if tipo == "eliminacao":
+        return {"tipo": "eliminacao", "linha": passo[1], "pivo": passo[2], "fator": passo[3]}
+    return {"tipo": "coluna", "pivo": passo[1], "fatores": passo[2].tolist()}
+
+
+def reconstruir_etapas(matriz, deltas):                                     # Refaz as matrizes completas a partir dos deltas
+    """
+    Reconstrói a lista de matrizes (nível "completa") a partir da matriz
+    original e das etapas registradas no nível "deltas".
+    As operações são repetidas na mesma ordem, então os valores são idênticos.
+    """
+    matriz_atual = copiar_matriz(matriz)
+    n = len(matriz_atual)
+    etapas = [copiar_matriz(matriz_atual)]
+    for delta in deltas:
+        tipo = delta["tipo"]
+        if tipo == "troca":
+            trocar_linhas(matriz_atual, *delta["linhas"])
+            etapas.append(copiar_matriz(matriz_atual))
+        elif tipo == "eliminacao":
+            j, i, fator = delta["linha"], delta["pivo"], delta["fator"]
+            for k in range(i, n + 1):
+                matriz_atual[j][k] -= fator * matriz_atual[i][k]
+            if linha_relevante(matriz_atual, j):
+                etapas.append(copiar_matriz(matriz_atual))
+        elif tipo == "coluna":
+            i = delta["pivo"]
+            for j, fator in enumerate(delta["fatores"], start=i + 1):
+                for k in range(i, n + 1):
+                    matriz_atual[j][k] -= fator * matriz_atual[i][k]
+            etapas.append(copiar_matriz(matriz_atual))
+    return etapas
+
+
+def eliminacao_gauss(matriz, usar_pivoteamento=False, motor="python", registrar_etapas="completa",
+                     tamanho_bloco=64, threads=None, progresso=None):                       # Função principal que resolve o sistema pelo método de Gauss
+    """
+    Resolve um sistema de equações lineares usando o método de eliminação de Gauss.
+    
+    Parâmetros:
+    matriz: matriz aumentada do sistema [A|b]
+    usar_pivoteamento: se True, usa pivoteamento parcial
+    motor: "python" (listas, padrão) ou "numpy" (operações de linha vetorizadas,
+           para sistemas grandes; registra uma etapa por coluna eliminada)
+           ou "blocado" (LU em blocos com produtos matriz-matriz, para sistemas
+           densos com milhares de equações; não registra etapas)
+    registrar_etapas: "completa" (padrão), "deltas", "pivos" ou "nenhuma"
+                      (ver RegistroEtapas); o motor "blocado" só aceita "nenhuma"
+    tamanho_bloco: colunas por bloco do motor "blocado"
+    threads: threads da atualização do motor "blocado" (None = 1; o BLAS já usa vários núcleos)
+    progresso: callback opcional chamado com a coluna em eliminação (coluna, n)
     
-    return solucao, etapas, "Sistema resolvido com sucesso"                 # Retorna a solução, a lista de etapas e a mensagem de sucesso
+    Retorna:
+    solucao: lista com as soluções do sistema
+    etapas: lista com as etapas da eliminação
+    status: mensagem indicando o status da resolução
+    """
+    etapas = []                                                              # Junta as etapas entregues pela versão passo a passo
+    for item in eliminacao_gauss_em_etapas(matriz, usar_pivoteamento, motor, registrar_etapas,
+                                           tamanho_bloco, threads, progresso):
+        if item[0] == "etapa":
+            etapas.append(item[1])
+        else:
+            _, solucao, mensagem = item
+    return solucao, etapas, mensagem                                         # Retorna a solução, a lista de etapas e a mensagem
+
+
+def eliminacao_gauss_em_etapas(matriz, usar_pivoteamento=False, motor="python", registrar_etapas="completa",
+                               tamanho_bloco=64, threads=None, progresso=None):
+    """
+    Mesma eliminação de eliminacao_gauss (mesmos parâmetros), mas entrega as
+    etapas uma a uma em vez de guardar a lista: só a matriz em eliminação fica
+    na memória. Usada pela saída em fluxo da rota /gauss.
+
+    Gera ("etapa", etapa) para cada etapa registrada e, por último,
+    ("resultado", solucao, mensagem).
+    """
+    if motor not in MOTORES:                                                 # Motor desconhecido
+        raise ValueError(f"Motor desconhecido: {motor}. Use um de: {', '.join(MOTORES)}")
+
+    if motor != "python" and np is None:                                     # NumPy não instalado
+        raise RuntimeError(f"O motor '{motor}' precisa do NumPy instalado (pip install numpy)")
+
+    if motor == "blocado":                                                   # Versão em blocos (sem etapas intermediárias)
+        if registrar_etapas != "nenhuma":                                    # Não há etapas a registrar: avisa em vez de devolver a lista vazia
+            raise ValueError("O motor 'blocado' não registra etapas; use registrar_etapas='nenhuma' "
+                             "ou o motor 'python' ou 'numpy'")
+        aumentada = np.asarray(matriz, dtype=float)
+        n = aumentada.shape[0]
+        fatoracao = fatorar_lu_blocado(aumentada[:, :n], usar_pivoteamento, tamanho_bloco, threads, progresso)
+        if fatoracao is None:
+            yield ("resultado", None, "Sistema singular - sem solução única")
+            return
+        solucao = resolver_lu(fatoracao, aumentada[:, n])
+        yield ("resultado", solucao.tolist(), "Sistema resolvido com sucesso")
+        return
+
+    if motor == "numpy":                                                     # Versão vetorizada
+        matriz_atual = np.array(matriz, dtype=float)                         # Cópia da matriz aumentada como array
+        passos = passos_eliminacao_numpy(matriz_atual, usar_pivoteamento)
+    else:
+        matriz_atual = copiar_matriz(matriz)                                # Cria uma cópia da matriz original para não alterá-la diretamente
+        passos = passos_eliminacao(matriz_atual, usar_pivoteamento)
+
+    registro = RegistroEtapas(registrar_etapas, matriz_atual, guardar=False)  # Etapas no nível pedido, entregues na hora
+    if registro.inicial is not None:
+        yield ("etapa", registro.inicial)
+        registro.inicial = None                                              # Não segura a cópia inicial até o fim
+    n = len(matriz_atual)
+
+    # Eliminação progressiva
+    for passo in passos:
+        if passo[0] == "singular":                                          # Pivô praticamente zero
+            yield ("resultado", None, "Sistema singular - sem solução única")  # As etapas feitas já foram entregues
+            return
+        etapa = registro.registrar(matriz_atual, passo)
+        if etapa is not None:
+            yield ("etapa", etapa)
+        if progresso is not None and passo[0] == "pivo":                    # Nova coluna pivotal
+            progresso(coluna=passo[1], n=n)
+
+    # Retrosubstituição
+    solucao = retrosubstituicao(matriz_atual)
+    if solucao is None:
+        yield ("resultado", None, "Sistema singular - sem solução única")
+        return
+
+    yield ("resultado", solucao, "Sistema resolvido com sucesso")
 
 
 def analisar_matriz(matriz):                                                # Função que analisa a matriz e sugere se é bom usar pivoteamento
@@ -131,10 +373,15 @@ def analisar_matriz(matriz):                                                # Fu
     return min_diagonal < 1e-10 or min_diagonal < 0.01 * max_elemento       # Retorna True se a diagonal for "fraca" em relação ao resto (pivoteamento recomendado)
 
 
-def verificar_solucao(matriz_original, solucao):                            # Função que verifica quão boa é a solução calculando os resíduos
+def verificar_solucao(matriz_original, solucao, motor="python"):            # Função que verifica quão boa é a solução calculando os resíduos
     """
     Verifica a solução calculada, computando os resíduos.
+    Com motor="numpy" ou "blocado", calcula |A·x - b| com um único produto matriz-vetor.
     """
+    if motor in ("numpy", "blocado") and np is not None:                    # Versão vetorizada
+        aumentada = np.asarray(matriz_original, dtype=float)
+        return np.abs(aumentada[:, :-1] @ np.asarray(solucao, dtype=float) - aumentada[:, -1]).tolist()
+
     n = len(matriz_original)                                                # Número de equações
     residuos = []                                                           # Lista para guardar o resíduo de cada equação
     
@@ -0,0 +1,185 @@
+"""
+Execução dos métodos numéricos em processos separados do servidor.
+Cada vaga do executor é um processo de cálculo (multiprocessing.Pool com 1
+processo) com seu canal de progresso. A thread da requisição só espera o resultado: um cálculo longo
+não segura o GIL do servidor, e um cálculo que passa do tempo limite é
+cancelado matando o processo da vaga (que é recriado na próxima tarefa).
+"""
+# Usado pelo backend para rodar as tarefas de tarefas.py.
+
+import multiprocessing                                    # Processos de cálculo (fora do GIL do servidor)
+import os                                                 # Número de núcleos (quantidade padrão de processos)
+import queue                                              # Fila de vagas livres, compartilhada entre as threads do servidor
+import time
+
+import metricas                                           # Etapas medidas no processo de cálculo voltam para a requisição
+import progresso                                          # Fila de progresso de cada processo de cálculo
+
+
+class ErroExecutor(Exception):
+    """Erro do executor (não do cálculo em si)."""
+
+
+class ServidorOcupado(ErroExecutor):
+    """Nenhuma vaga ficou livre dentro do tempo de espera."""
+
+
+class TempoEsgotado(ErroExecutor):
+    """O cálculo passou do tempo limite e foi cancelado."""
+
+
+class ExecutorSolvers:
+    """
+    Conjunto limitado de processos de cálculo.
+
+    Parâmetros:
+    processos: número de vagas (cálculos simultâneos); None = número de núcleos,
+               0 = executa na própria thread da requisição (sem tempo limite)
+    tempo_limite: tempo máximo de cada cálculo, em segundos
+    espera_maxima: tempo máximo esperando uma vaga livre, em segundos
+    """
+
+    def __init__(self, processos=None, tempo_limite=30.0, espera_maxima=5.0):
+        self.processos = (os.cpu_count() or 1) if processos is None else processos
+        self.tempo_limite = tempo_limite
+        self.espera_maxima = espera_maxima
+        self.canceladas = 0                               # Tarefas interrompidas por tempo esgotado
+        self._contexto = multiprocessing.get_context("spawn")  # Sem fork: o servidor tem várias threads
+        self._livres = queue.LifoQueue()                  # LIFO: reaproveita primeiro os processos já iniciados
+        for _ in range(self.processos):
+            self._livres.put(None)                        # Vaga sem processo: criado na primeira tarefa
+
+    def _nova_vaga(self):
+        leitor, escritor = self._contexto.Pipe(duplex=False)  # Sem thread de envio: o que a tarefa envia chega antes do resultado
+        pool = self._contexto.Pool(1, initializer=progresso.iniciar_processo, initargs=(escritor,))
+        return pool, leitor
+
+    def _limite(self, tempo_limite):
+        if tempo_limite is None or tempo_limite > self.tempo_limite:
+            return self.tempo_limite
+        return tempo_limite
+
+    def _pegar_vaga(self):
+        try:
+            with metricas.etapa("espera_vaga"):
+                vaga = self._livres.get(timeout=self.espera_maxima)
+        except queue.Empty:
+            raise ServidorOcupado("Todos os processos de cálculo estão ocupados. Tente novamente.") from None
+        return vaga
+
+    def _cancelar(self, pool, tempo_limite):
+        pool.terminate()                                  # Cancela: mata o processo que ainda está calculando
+        self.canceladas += 1
+        return TempoEsgotado(f"O cálculo passou do tempo limite de {tempo_limite:g} s e foi cancelado.")
+
+    def executar(self, funcao, *args, tempo_limite=None, ao_progredir=None):
+        """
+        Executa funcao(*args) num processo de cálculo e devolve o resultado.
+        funcao precisa estar definida no nível de um módulo (é enviada ao processo pelo nome),
+        e as exceções lançadas por ela chegam aqui como no caso direto.
+
+        tempo_limite: tempo máximo desta tarefa (limitado ao tempo_limite do executor)
+        ao_progredir: callback chamado (nesta thread) com cada dicionário de progresso
+                      emitido pela tarefa (ver progresso.emitir)
+
+        Lança ServidorOcupado se nenhuma vaga ficar livre a tempo,
+        e TempoEsgotado se o cálculo não terminar no tempo limite.
+        """
+        if self.processos == 0:
+            with progresso.redirecionar(ao_progredir):
+                return funcao(*args)
+        tempo_limite = self._limite(tempo_limite)
+        vaga = self._pegar_vaga()
+
+        try:
+            if vaga is None:
+                vaga = self._nova_vaga()
+            pool, leitor = vaga
+            tarefa = (funcao, *args)                      # metricas.medir(funcao, *args): devolve também as etapas medidas lá
+            try:
+                with metricas.etapa("processo"):
+                    if ao_progredir is None:
+                        resultado, medidas = pool.apply_async(metricas.medir, tarefa).get(tempo_limite)
+                    else:
+                        pedido = pool.apply_async(progresso.executar_com_progresso, (metricas.medir, tarefa))
+                        resultado, medidas = self._esperar_com_progresso(pedido, leitor, tempo_limite, ao_progredir)
+                metricas.incorporar(medidas)
+                return resultado
+            except multiprocessing.TimeoutError:
+                vaga = None
+                raise self._cancelar(pool, tempo_limite) from None
+        finally:
+            self._livres.put(vaga)                        # Devolve a vaga (sem processo, se foi cancelada)
+
+    @staticmethod
+    def _esperar_com_progresso(pedido, leitor, tempo_limite, ao_progredir):
+        prazo = time.monotonic() + tempo_limite
+        while True:
+            if leitor.poll(max(0.0, min(progresso.INTERVALO_MINIMO, prazo - time.monotonic()))):
+                ao_progredir(leitor.recv())               # Repassa o progresso assim que chega
+                continue
+            if pedido.ready():
+                while leitor.poll():
+                    ao_progredir(leitor.recv())
+                return pedido.get()
+            if time.monotonic() >= prazo:
+                raise multiprocessing.TimeoutError
+
+    def transmitir(self, funcao, *args, tempo_limite=None):
+        """
+        Gerador: roda o gerador funcao(*args) num processo de cálculo e devolve
+        cada item assim que é produzido (ver progresso.transmitir). A vaga fica
+        ocupada até o fim da leitura; se quem lê parar antes, o processo é encerrado.
+
+        Lança ServidorOcupado e TempoEsgotado como executar(), e as exceções da tarefa
+        depois dos itens já produzidos.
+        """
+        if self.processos == 0:
+            yield from funcao(*args)
+            return
+        tempo_limite = self._limite(tempo_limite)
+        vaga = self._pegar_vaga()
+        terminou = False
+
+        try:
+            if vaga is None:
+                vaga = self._nova_vaga()
+            pool, leitor = vaga
+            pedido = pool.apply_async(progresso.transmitir, (funcao, args))
+            prazo = time.monotonic() + tempo_limite
+            while True:
+                if time.monotonic() >= prazo and not pedido.ready():  # Também com itens chegando sem parar
+                    vaga = None
+                    raise self._cancelar(pool, tempo_limite)
+                if leitor.poll(max(0.0, min(progresso.INTERVALO_MINIMO, prazo - time.monotonic()))):
+                    yield leitor.recv()
+                    continue
+                if pedido.ready():
+                    while leitor.poll():
+                        yield leitor.recv()
+                    terminou = True                       # Processo livre (mesmo se a tarefa lançou exceção)
+                    pedido.get()
+                    return
+        finally:
+            if not terminou and vaga is not None:
+                vaga[0].terminate()                       # Tempo esgotado ou leitura interrompida: o processo pode estar no meio do envio
+                vaga = None
+            self._livres.put(vaga)
+
+    def livres(self):
+        """Vagas livres agora (aproximado: outras threads podem pegar ou devolver vagas)."""
+        return self._livres.qsize()
+
+    def encerrar(self):
+        """Termina os processos ociosos (as vagas continuam disponíveis)."""
+        retiradas = 0
+        while True:
+            try:
+                vaga = self._livres.get_nowait()
+            except queue.Empty:
+                break
+            retiradas += 1
+            if vaga is not None:
+                vaga[0].terminate()
+        for _ in range(retiradas):
+            self._livres.put(None)
@@ -0,0 +1,457 @@
+"""
+Camada de compilação das funções digitadas pelo usuário (ex: "x**3 - x - 2").
+A expressão é analisada e validada uma única vez (lista branca de nós da AST),
+compilada para uma função Python e guardada em um cache LRU.
+Na derivada automática (f e f' juntos, usada pelo Newton), polinômios já
+expandidos são avaliados pelo esquema de Horner (ver polinomio.py); f(x)
+sozinha, escalar ou vetorizada, é sempre a expressão como foi escrita.
+"""
+# Usado por backend.py (rotas /newton e /bissecao) e por bissecao.py.
+
+import ast                                                # Analisador sintático do próprio Python (árvore da expressão)
+import math                                               # Funções matemáticas disponíveis para o usuário
+from functools import lru_cache                           # Cache LRU das expressões já compiladas
+from types import SimpleNamespace                         # Namespace 'math' das versões vetorizada e dual
+
+from derivada import Dual, FUNCOES_DUAIS                  # Números duais (derivada automática)
+from polinomio import avaliacao_rapida, corpo_horner_com_derivada, extrair_coeficientes  # Caminho rápido dos polinômios
+
+try:
+    import numpy as np                                    # Opcional: só é necessário no modo vetorizado
+except ImportError:
+    np = None
+
+
+TAMANHO_CACHE = 256                                       # Quantas expressões diferentes ficam compiladas na memória
+
+# Limites de complexidade: o custo de cada avaliação de f fica limitado
+MAX_NOS_EXPRESSAO = 500                                   # Nós da árvore (operações, nomes, constantes)
+MAX_PROFUNDIDADE = 100                                    # Aninhamento, ex: exp(exp(exp(...)))
+MAX_BITS_CONSTANTE = 4096                                 # Inteiros calculados só com constantes (10**10**10 travaria o processo)
+MAX_ARGUMENTO_COMBINATORIO = 1000                         # math.factorial/comb/perm crescem sem limite com o argumento
+
+# Nomes que o usuário pode usar diretamente na expressão
+CONTEXTO = {
+    "math": math,                                         # permite math.alguma_coisa
+    "e": math.e,                                          # constante e
+    "pi": math.pi,                                        # constante pi
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "log": math.log,                                      # log natural
+    "exp": math.exp,
+    "sqrt": math.sqrt,
+    "log10": math.log10,
+}
+
+# Equivalentes NumPy das funções de CONTEXTO (modo vetorizado)
+NOMES_NUMPY = {
+    "sin": "sin", "cos": "cos", "tan": "tan", "log": "log", "exp": "exp",
+    "sqrt": "sqrt", "log10": "log10",
+}
+
+# Atributos de math com equivalente direto em NumPy (math.asin → np.arcsin etc.)
+MATH_PARA_NUMPY = {
+    "sin": "sin", "cos": "cos", "tan": "tan", "asin": "arcsin", "acos": "arccos",
+    "atan": "arctan", "atan2": "arctan2", "sinh": "sinh", "cosh": "cosh", "tanh": "tanh",
+    "asinh": "arcsinh", "acosh": "arccosh", "atanh": "arctanh", "exp": "exp",
+    "expm1": "expm1", "log": "log", "log10": "log10", "log2": "log2", "log1p": "log1p",
+    "sqrt": "sqrt", "fabs": "fabs", "floor": "floor", "ceil": "ceil", "trunc": "trunc",
+    "pow": "power", "hypot": "hypot", "degrees": "degrees", "radians": "radians",
+    "copysign": "copysign", "fmod": "fmod", "cbrt": "cbrt", "exp2": "exp2",
+}
+
+# Tipos de nó aceitos na árvore da expressão; qualquer outro é recusado
+NOS_PERMITIDOS = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load,
+    ast.Constant, ast.Attribute,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.FloorDiv,
+    ast.UAdd, ast.USub,
+)
+
+
+def normalizar_expressao(funcao_str):
+    """
+    Normaliza o texto da expressão (remove espaços extras) para usar como chave do cache.
+    """
+    if not isinstance(funcao_str, str):                   # A função precisa chegar como texto
+        raise ValueError("A função deve ser uma string")
+    return " ".join(funcao_str.split())                   # Junta os pedaços com um único espaço
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def forma_canonica(texto):
+    """
+    Texto canônico da expressão, reescrito a partir da árvore: "x**2-2" e
+    "x ** 2 - 2" dão o mesmo resultado. Textos que não são expressões válidas
+    voltam só normalizados. Usado nas chaves do cache de resultados.
+    """
+    texto = normalizar_expressao(texto)
+    try:
+        return ast.unparse(ast.parse(texto, mode="eval"))
+    except (SyntaxError, ValueError):
+        return texto
+
+
+def validar_arvore(arvore, variaveis=("x",)):
+    """
+    Percorre a árvore da expressão e garante que só há operações aritméticas,
+    constantes numéricas, as variáveis informadas e as funções de CONTEXTO.
+    Lança ValueError se encontrar qualquer outra coisa.
+    """
+    for no in ast.walk(arvore):                           # Visita todos os nós da árvore
+        if not isinstance(no, NOS_PERMITIDOS):            # Nó fora da lista branca (lambda, comprehension, subscript...)
+            raise ValueError(f"Construção não permitida na função: {type(no).__name__}")
+        if isinstance(no, ast.Constant) and (
+                isinstance(no.value, bool) or not isinstance(no.value, (int, float))):
+            raise ValueError(f"Constante não permitida na função: {no.value!r}")
+        if isinstance(no, ast.Name) and no.id not in variaveis and no.id not in CONTEXTO:
+            raise ValueError(f"Nome desconhecido na função: {no.id}")
+        if isinstance(no, ast.Attribute):                 # Só aceita math.<nome público>
+            if not (isinstance(no.value, ast.Name) and no.value.id == "math"):
+                raise ValueError("Só é permitido acessar atributos de 'math'")
+            if no.attr.startswith("_") or not hasattr(math, no.attr):
+                raise ValueError(f"Atributo desconhecido em math: {no.attr}")
+        if isinstance(no, ast.Call) and (no.keywords or not isinstance(no.func, (ast.Name, ast.Attribute))):
+            raise ValueError("Chamada de função não permitida na expressão")
+    verificar_complexidade(arvore)
+
+
+def verificar_complexidade(arvore):
+    """
+    Recusa expressões caras demais para avaliar: muitos nós, aninhamento
+    profundo ou inteiros gigantes feitos só de constantes (ex: 10**10**10,
+    que o Python calcularia exatamente, sem estourar, por minutos).
+    Lança ValueError.
+    """
+    nos = 0
+    pendentes = [(arvore, 1)]                             # Pilha (nó, profundidade): sem recursão em árvores fundas
+    while pendentes:
+        no, profundidade = pendentes.pop()
+        nos += 1
+        if nos > MAX_NOS_EXPRESSAO:
+            raise ValueError(f"Função muito grande: mais de {MAX_NOS_EXPRESSAO} elementos")
+        if profundidade > MAX_PROFUNDIDADE:
+            raise ValueError(f"Função aninhada demais: mais de {MAX_PROFUNDIDADE} níveis")
+        pendentes.extend((filho, profundidade + 1) for filho in ast.iter_child_nodes(no))
+    _inteiro_constante(arvore.body if isinstance(arvore, ast.Expression) else arvore)
+
+
+def _inteiro_constante(no):
+    """
+    Valor de uma subárvore feita só de constantes inteiras, ou None se ela
+    depende de x, de funções ou de floats (floats estouram na hora, não travam).
+    Lança ValueError se o inteiro passaria de MAX_BITS_CONSTANTE bits.
+    """
+    if isinstance(no, ast.Constant):
+        return no.value if isinstance(no.value, int) else None
+    if isinstance(no, ast.UnaryOp):
+        valor = _inteiro_constante(no.operand)
+        if valor is None:
+            return None
+        return -valor if isinstance(no.op, ast.USub) else valor
+    if isinstance(no, ast.Call):
+        nome = no.func.attr if isinstance(no.func, ast.Attribute) else no.func.id
+        for argumento in no.args:
+            valor = _inteiro_constante(argumento)         # Verifica as constantes dentro da chamada
+            if (nome in ("factorial", "comb", "perm") and valor is not None
+                    and abs(valor) > MAX_ARGUMENTO_COMBINATORIO):
+                raise ValueError(f"Argumento grande demais para math.{nome} (máximo {MAX_ARGUMENTO_COMBINATORIO})")
+        return None
+    if not isinstance(no, ast.BinOp):
+        return None
+
+    a = _inteiro_constante(no.left)
+    b = _inteiro_constante(no.right)
+    if a is None or b is None:
+        return None
+    if isinstance(no.op, ast.Pow):
+        if b < 0:
+            return None                                   # Expoente negativo: resultado float
+        bits = abs(a).bit_length()
+        if abs(a) > 1 and (b > MAX_BITS_CONSTANTE or (bits - 1) * b > MAX_BITS_CONSTANTE):
+            raise ValueError("Constante grande demais na função (potência de inteiros)")
+        return a ** b
+    if isinstance(no.op, ast.Mult):
+        if abs(a).bit_length() + abs(b).bit_length() > MAX_BITS_CONSTANTE:
+            raise ValueError("Constante grande demais na função (produto de inteiros)")
+        return a * b
+    if isinstance(no.op, ast.Add):
+        return a + b
+    if isinstance(no.op, ast.Sub):
+        return a - b
+    if isinstance(no.op, (ast.FloorDiv, ast.Mod)) and b != 0:
+        return a // b if isinstance(no.op, ast.FloorDiv) else a % b
+    return None                                           # Divisão: resultado float
+
+
+def analisar_expressao(funcao_str, variaveis=("x",)):
+    """
+    Faz o parse da expressão e valida a árvore.
+    Retorna a árvore (ast.Expression) pronta para compilar.
+    """
+    try:
+        arvore = ast.parse(funcao_str, mode="eval")       # Converte o texto em árvore sintática
+    except SyntaxError as e:
+        raise ValueError(f"Sintaxe inválida na função: {e.msg}") from None
+    validar_arvore(arvore, variaveis)                     # Recusa qualquer coisa fora da lista branca
+    return arvore
+
+
+def _montar_funcao(corpo, variaveis, contexto):
+    """
+    Transforma o corpo da expressão em 'lambda <variaveis>: <corpo>' e compila.
+    """
+    argumentos = ast.arguments(
+        posonlyargs=[], args=[ast.arg(arg=nome) for nome in variaveis],
+        kwonlyargs=[], kw_defaults=[], defaults=[],
+    )
+    arvore = ast.Expression(body=ast.Lambda(args=argumentos, body=corpo))  # lambda x: <expressão>
+    ast.fix_missing_locations(arvore)                     # Preenche números de linha exigidos pelo compile
+    codigo = compile(arvore, "<funcao>", "eval")          # Gera o code object uma única vez
+    ambiente = {"__builtins__": {}}                       # Ambiente sem builtins por segurança
+    ambiente.update(contexto)                             # Disponibiliza as funções matemáticas
+    return eval(codigo, ambiente)                         # Devolve a função Python pronta
+
+
+def _sem_erro_de_dominio(funcao):
+    """
+    Adapta uma função de math para devolver nan fora do domínio,
+    como fazem as ufuncs do NumPy (em vez de lançar ValueError).
+    """
+    def aplicar(*args):
+        try:
+            return funcao(*args)
+        except (ValueError, OverflowError):
+            return math.nan
+    return aplicar
+
+
+def contexto_numpy():
+    """
+    Monta o contexto do modo vetorizado: as mesmas funções de CONTEXTO,
+    mas usando as ufuncs do NumPy (aceitam arrays).
+    """
+    if np is None:
+        raise RuntimeError("O modo vetorizado precisa do NumPy instalado (pip install numpy)")
+
+    atributos_math = {}
+    for nome in dir(math):                                # Percorre os atributos públicos de math
+        if nome.startswith("_"):
+            continue
+        valor = getattr(math, nome)
+        if nome in MATH_PARA_NUMPY and hasattr(np, MATH_PARA_NUMPY[nome]):
+            atributos_math[nome] = getattr(np, MATH_PARA_NUMPY[nome])  # Ufunc equivalente
+        elif callable(valor):
+            atributos_math[nome] = np.vectorize(_sem_erro_de_dominio(valor), otypes=[float])  # Sem equivalente: ponto a ponto
+        else:
+            atributos_math[nome] = valor                  # Constantes (pi, e, inf, nan, tau)
+
+    contexto = {nome: getattr(np, nome_np) for nome, nome_np in NOMES_NUMPY.items()}
+    contexto.update({"math": SimpleNamespace(**atributos_math), "e": math.e, "pi": math.pi})
+    return contexto
+
+
+def _vetorizar(g):
+    """
+    Envolve a função compilada para aceitar escalares ou arrays e sempre
+    devolver um array de floats do mesmo formato da entrada.
+    """
+    def f(x):
+        x = np.asarray(x, dtype=float)                    # Converte listas/escalares para array de float
+        with np.errstate(all="ignore"):                   # Pontos fora do domínio viram nan/inf sem avisos
+            y = np.asarray(g(x), dtype=float)
+        if y.shape != x.shape:                            # Expressão constante (ex: "2") devolve um escalar
+            y = np.broadcast_to(y, x.shape).copy()
+        return y
+    return f
+
+
+def contexto_dual():
+    """
+    Monta o contexto da derivada automática: as funções de CONTEXTO trocadas
+    pelas versões que aceitam números duais. Funções de math sem versão dual
+    continuam as originais e lançam TypeError ao receber um Dual.
+    """
+    atributos_math = {nome: getattr(math, nome) for nome in dir(math) if not nome.startswith("_")}
+    atributos_math.update(FUNCOES_DUAIS)
+    contexto = {nome: FUNCOES_DUAIS[nome] for nome in CONTEXTO if nome in FUNCOES_DUAIS}
+    contexto.update({"math": SimpleNamespace(**atributos_math), "e": math.e, "pi": math.pi})
+    return contexto
+
+
+def _derivar(g):
+    """
+    Envolve a função compilada com o contexto dual: recebe x (float) e
+    devolve a tupla (f(x), f'(x)) calculada em uma única avaliação.
+    """
+    def f_e_derivada(x):
+        y = g(Dual(x, 1.0))                               # Semente: dx/dx = 1
+        if isinstance(y, Dual):
+            return y.valor, y.derivada
+        return y, 0.0                                     # Expressão que não depende de x
+    return f_e_derivada
+
+
+def _horner_com_derivada(coeficientes):
+    """
+    (p(x), p'(x)) por Horner. Pode diferir da expressão original no último
+    bit (outra ordem das operações); um estouro vira OverflowError, como o
+    x**n da expressão e dos números duais, em vez de devolver inf.
+    """
+    g = _montar_funcao(corpo_horner_com_derivada(coeficientes), ("x",), {})
+
+    def f_e_derivada(x):
+        valor, derivada = g(x)
+        if not (math.isfinite(valor) and math.isfinite(derivada)) and math.isfinite(x):
+            raise OverflowError("Resultado grande demais ao avaliar o polinômio")
+        return valor, derivada
+    return f_e_derivada
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def _compilar(expressao_normalizada):
+    arvore = analisar_expressao(expressao_normalizada)    # Parse + validação acontecem só na primeira vez
+    return _montar_funcao(arvore.body, ("x",), CONTEXTO)
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def _compilar_vetorizada(expressao_normalizada):
+    arvore = analisar_expressao(expressao_normalizada)
+    return _vetorizar(_montar_funcao(arvore.body, ("x",), contexto_numpy()))
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def _compilar_derivada(expressao_normalizada):
+    arvore = analisar_expressao(expressao_normalizada)
+    coeficientes = avaliacao_rapida(arvore.body)
+    if coeficientes is not None:                          # Polinômio: (p(x), p'(x)) por Horner, sem números duais
+        return _horner_com_derivada(coeficientes)
+    return _derivar(_montar_funcao(arvore.body, ("x",), contexto_dual()))
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def _coeficientes_polinomio(expressao_normalizada):
+    resultado = extrair_coeficientes(analisar_expressao(expressao_normalizada).body)
+    return None if resultado is None else resultado[0]
+
+
+def coeficientes_polinomio(funcao_str):
+    """
+    Coeficientes de f(x) (grau mais alto primeiro) se a expressão é um
+    polinômio em x, em qualquer forma (ex: "(x - 1)**2 * (x + 3)"); senão None.
+    Lança ValueError se a expressão for inválida.
+    """
+    return _coeficientes_polinomio(normalizar_expressao(funcao_str))
+
+
+def compilar_derivada(funcao_str):
+    """
+    Compila a expressão para a derivada automática (números duais).
+
+    Retorna:
+    f_e_derivada: função que recebe x e devolve (f(x), f'(x)) numa só passada
+
+    Lança ValueError se a expressão for inválida. Se a expressão usar uma
+    função de math sem versão dual, a chamada lança TypeError; nesse caso
+    use a derivada numérica (derivada.derivada_numerica).
+    """
+    return _compilar_derivada(normalizar_expressao(funcao_str))
+
+
+def compilar_funcao(funcao_str, vetorizada=False):
+    """
+    Compila a expressão do usuário em uma função f(x).
+
+    Parâmetros:
+    funcao_str: string com f(x), ex: "x**3 - x - 1"
+    vetorizada: se True, usa as funções do NumPy e f aceita arrays
+                (uma chamada avalia f em milhares de pontos)
+
+    Retorna:
+    f: função Python que recebe x e devolve f(x)
+
+    Expressões repetidas são devolvidas direto do cache (sem novo parse).
+    Lança ValueError se a expressão for inválida ou usar algo não permitido.
+    """
+    expressao = normalizar_expressao(funcao_str)
+    if vetorizada:
+        return _compilar_vetorizada(expressao)
+    return _compilar(expressao)
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def _compilar_varias(expressao_normalizada, variaveis):
+    arvore = analisar_expressao(expressao_normalizada, variaveis)
+    return _montar_funcao(arvore.body, variaveis, CONTEXTO)
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def _compilar_varias_dual(expressao_normalizada, variaveis):
+    arvore = analisar_expressao(expressao_normalizada, variaveis)
+    return _montar_funcao(arvore.body, variaveis, contexto_dual())
+
+
+def compilar_sistema(funcoes, variaveis):
+    """
+    Compila as expressões de um sistema F(x) = 0 nas variáveis dadas (ex: x1, x2, x3).
+
+    Retorna:
+    F: função que recebe x (sequência na ordem de variaveis) e devolve a lista [f_1(x), ..., f_m(x)]
+
+    Lança ValueError se alguma expressão for inválida ou usar outro nome.
+    """
+    variaveis = tuple(variaveis)
+    fs = [_compilar_varias(normalizar_expressao(f), variaveis) for f in funcoes]
+
+    def F(x):
+        return [f(*x) for f in fs]
+    return F
+
+
+def compilar_jacobiana(funcoes, variaveis):
+    """
+    Compila o sistema para a jacobiana automática (números duais): uma passada
+    por variável, com a semente 1 nela e 0 nas outras.
+
+    Retorna:
+    F_e_jacobiana: função que recebe x e devolve (F(x), J(x)), J como lista de linhas
+
+    Como em compilar_derivada, funções de math sem versão dual lançam TypeError na chamada.
+    """
+    variaveis = tuple(variaveis)
+    gs = [_compilar_varias_dual(normalizar_expressao(f), variaveis) for f in funcoes]
+    n = len(variaveis)
+
+    def F_e_jacobiana(x):
+        valores = [0.0] * len(gs)
+        jacobiana = [[0.0] * n for _ in gs]
+        for j in range(n):
+            argumentos = [Dual(v, 1.0 if k == j else 0.0) for k, v in enumerate(x)]
+            for i, g in enumerate(gs):
+                y = g(*argumentos)
+                if isinstance(y, Dual):
+                    valores[i], jacobiana[i][j] = y.valor, y.derivada
+                else:
+                    valores[i] = y                        # Expressão que não depende de x
+        return valores, jacobiana
+    return F_e_jacobiana
+
+
+def limpar_cache():
+    """
+    Esvazia o cache de expressões compiladas.
+    """
+    _compilar.cache_clear()
+    _compilar_vetorizada.cache_clear()
+    _compilar_derivada.cache_clear()
+    _coeficientes_polinomio.cache_clear()
+    _compilar_varias.cache_clear()
+    _compilar_varias_dual.cache_clear()
+
+
+def info_cache():
+    """
+    Retorna as estatísticas do cache escalar (acertos, faltas, tamanho atual).
+    """
+    return _compilar.cache_info()
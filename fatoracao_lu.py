@@ -0,0 +1,272 @@
+"""
+Fatoração LU com pivoteamento parcial (P·A = L·U) e cache de fatorações.
+A eliminação O(n³) é feita uma única vez para cada matriz A; os sistemas
+seguintes com a mesma A (outros lados direitos b) custam só as
+substituições progressiva e regressiva, O(n²).
+"""
+# Usado pela rota /gauss/lu do backend.
+
+import hashlib                                            # Hash da matriz A (chave do cache)
+import threading                                          # O cache é compartilhado entre as threads do servidor
+from collections import OrderedDict                       # Ordem de uso para descartar a fatoração menos recente
+from concurrent.futures import ThreadPoolExecutor         # Divide a atualização do bloco restante entre threads
+
+import numpy as np
+
+try:
+    from scipy.linalg import solve_triangular              # Opcional: substituições em LAPACK (sem laço Python)
+except ImportError:
+    solve_triangular = None
+
+
+class FatoracaoLU:
+    """
+    Resultado da fatoração: L (abaixo da diagonal, diagonal unitária implícita)
+    e U (diagonal e acima) guardados juntos em 'lu', e a permutação das linhas.
+    """
+    __slots__ = ("lu", "permutacao")
+
+    def __init__(self, lu, permutacao):
+        self.lu = lu                                      # Matriz n x n com L e U compactados
+        self.permutacao = permutacao                      # permutacao[i] = linha original que ficou na posição i
+
+    @property
+    def n(self):
+        return self.lu.shape[0]
+
+    @property
+    def bytes(self):
+        return self.lu.nbytes + self.permutacao.nbytes    # Memória ocupada (usada no orçamento do cache)
+
+
+def fatorar_lu(A, usar_pivoteamento=True):
+    """
+    Fatora a matriz quadrada A em P·A = L·U.
+
+    Parâmetros:
+    A: matriz de coeficientes n x n (listas ou array)
+    usar_pivoteamento: se True, usa pivoteamento parcial com o mesmo critério
+                       de encontrar_pivo_maximo (primeiro maior valor absoluto)
+
+    Retorna:
+    FatoracaoLU, ou None se o sistema for singular (pivô quase zero)
+    """
+    lu = np.array(A, dtype=float)                         # Cópia: a fatoração é feita no lugar
+    n = lu.shape[0]
+    if lu.ndim != 2 or lu.shape[1] != n:
+        raise ValueError("A matriz de coeficientes precisa ser quadrada")
+    permutacao = np.arange(n)
+
+    for i in range(n):
+        if usar_pivoteamento:
+            max_i = i + int(np.argmax(np.abs(lu[i:, i])))  # Linha com o maior pivô da coluna i
+            if max_i != i:
+                lu[[i, max_i]] = lu[[max_i, i]]            # Troca as linhas (inclusive os fatores já guardados de L)
+                permutacao[[i, max_i]] = permutacao[[max_i, i]]
+
+        pivo = lu[i, i]
+        if abs(pivo) < 1e-10:                             # Mesmo critério de singularidade da eliminação de Gauss
+            return None
+
+        lu[i + 1:, i] /= pivo                             # Fatores da coluna i (parte L)
+        lu[i + 1:, i + 1:] -= np.outer(lu[i + 1:, i], lu[i, i + 1:])  # Atualiza o restante (parte U)
+
+    return FatoracaoLU(lu, permutacao)
+
+
+def fatorar_lu_blocado(A, usar_pivoteamento=True, tamanho_bloco=64, threads=None, progresso=None):
+    """
+    Fatoração LU em blocos (painel + atualização do restante), mesma saída de fatorar_lu.
+
+    A cada bloco de 'tamanho_bloco' colunas:
+      1. fatora o painel (colunas do bloco, todas as linhas abaixo) com pivoteamento;
+      2. resolve L11·U12 = A12 para a faixa de U à direita do bloco;
+      3. atualiza o restante A22 -= L21·U12 com um produto matriz-matriz,
+         dividido por colunas entre 'threads' threads (o NumPy libera o GIL
+         durante o produto, então as threads rodam em paralelo).
+
+    threads: padrão 1, porque o BLAS já é multithread; mais threads só ajudam
+             com um BLAS de uma thread, e somam com os processos do executor
+             (ver NUCLEOS_POR_VAGA no backend).
+
+    Os produtos matriz-matriz aproveitam a cache e o BLAS, enquanto a versão
+    coluna a coluna fica limitada pela largura de banda da memória.
+
+    progresso: callback opcional chamado no início de cada bloco (coluna, n)
+
+    Retorna:
+    FatoracaoLU, ou None se o sistema for singular (pivô quase zero)
+    """
+    lu = np.array(A, dtype=float)
+    n = lu.shape[0]
+    if lu.ndim != 2 or lu.shape[1] != n:
+        raise ValueError("A matriz de coeficientes precisa ser quadrada")
+    if tamanho_bloco < 1:
+        raise ValueError("O tamanho do bloco precisa ser positivo")
+    threads = max(1, threads or 1)                        # Padrão 1: o produto do BLAS já usa vários núcleos
+    permutacao = np.arange(n)
+
+    executor = ThreadPoolExecutor(threads) if threads > 1 else None
+    try:
+        for k0 in range(0, n, tamanho_bloco):
+            k1 = min(k0 + tamanho_bloco, n)
+            if progresso is not None:
+                progresso(coluna=k0, n=n)
+
+            # 1. Painel: eliminação coluna a coluna, restrita às colunas do bloco
+            for i in range(k0, k1):
+                if usar_pivoteamento:
+                    max_i = i + int(np.argmax(np.abs(lu[i:, i])))  # Mesmo critério de encontrar_pivo_maximo
+                    if max_i != i:
+                        lu[[i, max_i]] = lu[[max_i, i]]    # Troca a linha inteira (L já calculado, painel e restante)
+                        permutacao[[i, max_i]] = permutacao[[max_i, i]]
+                pivo = lu[i, i]
+                if abs(pivo) < 1e-10:
+                    return None
+                lu[i + 1:, i] /= pivo
+                lu[i + 1:, i + 1:k1] -= np.outer(lu[i + 1:, i], lu[i, i + 1:k1])
+
+            if k1 == n:
+                break
+
+            # 2. U12 = L11⁻¹ · A12 (L11 triangular inferior com diagonal 1)
+            for i in range(k0 + 1, k1):
+                lu[i, k1:] -= lu[i, k0:i] @ lu[k0:i, k1:]
+
+            # 3. A22 -= L21 · U12, em faixas de colunas
+            L21 = lu[k1:, k0:k1]
+            U12 = lu[k0:k1, k1:]
+            if executor is None:
+                lu[k1:, k1:] -= L21 @ U12
+            else:
+                faixas = np.array_split(np.arange(k1, n), threads)
+
+                def atualizar(colunas):
+                    if colunas.size:
+                        c0, c1 = colunas[0], colunas[-1] + 1
+                        lu[k1:, c0:c1] -= L21 @ U12[:, c0 - k1:c1 - k1]
+
+                list(executor.map(atualizar, faixas))     # Espera todas as faixas (e propaga erros)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return FatoracaoLU(lu, permutacao)
+
+
+def resolver_lu(fatoracao, b):
+    """
+    Resolve A·x = b usando uma fatoração já pronta.
+
+    Parâmetros:
+    fatoracao: FatoracaoLU devolvida por fatorar_lu
+    b: vetor de tamanho n, ou matriz n x k (k lados direitos resolvidos juntos)
+
+    Retorna:
+    x com o mesmo formato de b (array)
+    """
+    lu, n = fatoracao.lu, fatoracao.n
+    b = np.asarray(b, dtype=float)
+    if b.ndim not in (1, 2) or b.shape[0] != n:           # Antes de permutar: a indexação cortaria um b maior
+        raise ValueError(f"O lado direito precisa ter {n} linhas")
+    y = b[fatoracao.permutacao]                           # Aplica a permutação: P·b (cópia)
+
+    if solve_triangular is not None:
+        y = solve_triangular(lu, y, lower=True, unit_diagonal=True, check_finite=False)  # L·y = P·b
+        return solve_triangular(lu, y, lower=False, check_finite=False)                  # U·x = y
+
+    # Sem SciPy: as mesmas substituições, uma linha por vez
+    # Substituição progressiva: L·y = P·b (diagonal de L igual a 1)
+    for i in range(1, n):
+        y[i] -= lu[i, :i] @ y[:i]
+
+    # Substituição regressiva: U·x = y
+    for i in range(n - 1, -1, -1):
+        y[i] = (y[i] - lu[i, i + 1:] @ y[i + 1:]) / lu[i, i]
+
+    return y
+
+
+def chave_matriz(A, usar_pivoteamento=True):
+    """
+    Chave do cache: hash do conteúdo de A (em float64), do formato e do pivoteamento.
+    """
+    A = np.ascontiguousarray(A, dtype=float)
+    h = hashlib.sha256(A.tobytes())
+    h.update(repr((A.shape, bool(usar_pivoteamento))).encode())
+    return h.hexdigest()
+
+
+class CacheLU:
+    """
+    Cache de fatorações LU com limite de memória.
+    Quando o total passa de limite_bytes, as fatorações usadas há mais
+    tempo são descartadas (LRU).
+    """
+
+    def __init__(self, limite_bytes=256 * 1024 * 1024):
+        self.limite_bytes = limite_bytes
+        self.bytes_usados = 0
+        self.acertos = 0
+        self.faltas = 0
+        self._itens = OrderedDict()                       # chave -> FatoracaoLU, do menos para o mais recente
+        self._trava = threading.Lock()
+
+    def obter_ou_fatorar(self, A, usar_pivoteamento=True, fatorar=fatorar_lu):
+        """
+        Devolve (fatoracao, veio_do_cache). Fatora e guarda se ainda não estiver no cache.
+        fatoracao é None se A for singular (esse resultado não é guardado).
+        fatorar: função chamada como fatorar(A, usar_pivoteamento) quando não está no cache
+                 (ex: para fatorar num processo de cálculo)
+        """
+        A = np.asarray(A, dtype=float)
+        chave, fatoracao = self.consultar(A, usar_pivoteamento)
+        if fatoracao is not None:
+            return fatoracao, True
+
+        fatoracao = fatorar(A, usar_pivoteamento)         # Fora da trava: outras requisições não esperam
+        if fatoracao is not None:
+            self.guardar(chave, fatoracao)
+        return fatoracao, False
+
+    def consultar(self, A, usar_pivoteamento=True):
+        """
+        Devolve (chave, fatoracao), com fatoracao None se A ainda não está no cache
+        (quem chama fatora e guarda com guardar(chave, fatoracao)).
+        """
+        chave = chave_matriz(A, usar_pivoteamento)
+        with self._trava:
+            fatoracao = self._itens.get(chave)
+            if fatoracao is not None:
+                self._itens.move_to_end(chave)            # Marca como usada recentemente
+                self.acertos += 1
+                return chave, fatoracao
+            self.faltas += 1
+        return chave, None
+
+    def guardar(self, chave, fatoracao):
+        if fatoracao.bytes > self.limite_bytes:           # Maior que o orçamento inteiro: não guarda
+            return
+        with self._trava:
+            if chave in self._itens:
+                return
+            self._itens[chave] = fatoracao
+            self.bytes_usados += fatoracao.bytes
+            while self.bytes_usados > self.limite_bytes:  # Descarta as menos usadas até caber no orçamento
+                _, antiga = self._itens.popitem(last=False)
+                self.bytes_usados -= antiga.bytes
+
+    def limpar(self):
+        with self._trava:
+            self._itens.clear()
+            self.bytes_usados = 0
+
+    def estatisticas(self):
+        with self._trava:
+            return {
+                "itens": len(self._itens),
+                "bytes_usados": self.bytes_usados,
+                "limite_bytes": self.limite_bytes,
+                "acertos": self.acertos,
+                "faltas": self.faltas,
+            }
@@ -0,0 +1,111 @@
+"""
+Histórico das iterações dos métodos de raízes (x do Newton, intervalo [a, b]
+da bisseção), guardado num array de floats (array.array) em vez de uma
+lista de objetos Python, e limitado conforme o modo:
+
+  nenhum     não guarda nada
+  ultimos    só os n últimos pontos (buffer circular de tamanho fixo)
+  amostrado  um ponto a cada n iterações, mais o último
+  completo   todos os pontos
+
+Para desenhar a convergência bastam algumas dezenas de pontos; os modos
+limitados mantêm a memória e o JSON da resposta constantes com max_iter grande.
+"""
+# Usado por newton.py e bissecao.py (criado em tarefas.py com o modo pedido na rota).
+
+import math
+from array import array
+
+MODOS_HISTORICO = ("nenhum", "ultimos", "amostrado", "completo")
+PONTOS_PADRAO = 32                                        # Pontos devolvidos quando o cliente não informa n
+
+
+def n_padrao(modo, max_iter):
+    """n dos modos limitados quando o cliente não informa: cerca de PONTOS_PADRAO pontos."""
+    if modo == "amostrado":
+        return max(1, math.ceil((max_iter + 1) / PONTOS_PADRAO))
+    return PONTOS_PADRAO
+
+
+class Historico:
+    """
+    Parâmetros:
+    modo: um de MODOS_HISTORICO
+    n: pontos guardados ("ultimos") ou intervalo entre amostras ("amostrado")
+    campos: números por ponto (1 para x, 2 para o intervalo [a, b])
+    """
+
+    def __init__(self, modo="completo", n=None, campos=1):
+        if modo not in MODOS_HISTORICO:
+            raise ValueError(f"Modo de histórico desconhecido: {modo}. Use um de: {', '.join(MODOS_HISTORICO)}")
+        if modo in ("ultimos", "amostrado") and (n is None or n < 1):
+            raise ValueError(f"O modo de histórico '{modo}' precisa de n >= 1")
+        self.modo = modo
+        self.n = n
+        self.campos = campos
+        self.total = 0                                    # Pontos registrados (guardados ou não)
+        self._valores = array("d")
+        self._iteracoes = array("q")                      # Iteração de cada ponto guardado (modo "amostrado")
+        self._ultimo = None                               # Último ponto (modo "amostrado": sempre devolvido)
+        if modo == "ultimos":
+            try:
+                self._valores = array("d", bytes(8 * n * campos))  # Buffer circular já alocado
+            except (MemoryError, OverflowError):
+                raise ValueError(f"historico_n={n} é grande demais para o modo 'ultimos'") from None
+
+    def registrar(self, *valores):
+        """Registra o ponto da iteração atual (campos números)."""
+        indice = self.total
+        self.total += 1
+        if self.modo == "nenhum":
+            return
+        if self.modo == "completo":
+            self._valores.extend(valores)
+        elif self.modo == "ultimos":
+            inicio = (indice % self.n) * self.campos
+            self._valores[inicio:inicio + self.campos] = array("d", valores)
+        else:
+            self._ultimo = valores
+            if indice % self.n == 0:
+                self._valores.extend(valores)
+                self._iteracoes.append(indice)
+
+    def iteracoes(self):
+        """Iteração (índice do registro) de cada ponto devolvido por pontos()."""
+        if self.modo == "nenhum":
+            return []
+        if self.modo == "completo":
+            return list(range(self.total))
+        if self.modo == "ultimos":
+            return list(range(max(0, self.total - self.n), self.total))
+        indices = self._iteracoes.tolist()
+        if self.total and indices[-1] != self.total - 1:
+            indices.append(self.total - 1)
+        return indices
+
+    def pontos(self):
+        """Pontos guardados em ordem: floats (campos=1) ou listas de floats."""
+        if self.modo == "ultimos" and self.total > self.n:   # Buffer já deu a volta: o mais antigo está na posição atual
+            corte = (self.total % self.n) * self.campos
+            valores = (self._valores[corte:] + self._valores[:corte]).tolist()
+        elif self.modo == "ultimos":
+            valores = self._valores[:self.total * self.campos].tolist()
+        else:
+            valores = self._valores.tolist()
+            if self.modo == "amostrado" and self.total and self._iteracoes[-1] != self.total - 1:
+                valores.extend(self._ultimo)
+        if self.campos == 1:
+            return valores
+        return [valores[i:i + self.campos] for i in range(0, len(valores), self.campos)]
+
+    def resposta(self):
+        """
+        Campos do histórico para o dicionário de resultado: "historico" (nada no
+        modo "nenhum") e, nos modos limitados, "historico_iteracoes" com a
+        iteração de cada ponto.
+        """
+        if self.modo == "nenhum":
+            return {}
+        if self.modo == "completo":
+            return {"historico": self.pontos()}
+        return {"historico": self.pontos(), "historico_iteracoes": self.iteracoes()}
@@ -0,0 +1,58 @@
+"""
+Limites de custo dos métodos de raízes, por requisição: número de avaliações
+de f(x) e tempo de relógio. O tempo limite do executor (executor.py) mata o
+processo e não devolve nada; estes limites são verificados a cada avaliação,
+e o método para devolvendo a melhor aproximação que já tem.
+"""
+# Usado por newton.py, bissecao.py (resolver_intervalo) e tarefas.py.
+
+import time
+
+
+class LimiteExcedido(Exception):
+    """
+    Um limite do Orcamento foi atingido.
+    motivo: "avaliacoes" ou "tempo" (vai para o campo "limite" da resposta)
+    """
+
+    def __init__(self, motivo, mensagem):
+        super().__init__(mensagem)
+        self.motivo = motivo
+
+
+class Orcamento:
+    """
+    Parâmetros:
+    max_avaliacoes: quantas vezes f(x) pode ser calculada (None = sem limite)
+    tempo_maximo: segundos de relógio desde a criação (None = sem limite)
+    """
+
+    def __init__(self, max_avaliacoes=None, tempo_maximo=None):
+        self.max_avaliacoes = max_avaliacoes
+        self.tempo_maximo = tempo_maximo
+        self.avaliacoes = 0
+        self._prazo = None if tempo_maximo is None else time.monotonic() + tempo_maximo
+
+    def cobrar(self):
+        """Registra uma avaliação; lança LimiteExcedido se ela passaria de um limite."""
+        if self.max_avaliacoes is not None and self.avaliacoes >= self.max_avaliacoes:
+            raise LimiteExcedido("avaliacoes", f"Limite de {self.max_avaliacoes} avaliações de f(x) atingido")
+        if self._prazo is not None and time.monotonic() > self._prazo:
+            raise LimiteExcedido("tempo", f"Limite de tempo de {self.tempo_maximo:g} s atingido")
+        self.avaliacoes += 1
+
+    def limitar(self, f):
+        """f com o orçamento: cada chamada é cobrada antes de avaliar."""
+        def f_limitada(x):
+            self.cobrar()
+            return f(x)
+        return f_limitada
+
+
+def depende_do_relogio(resultado):
+    """
+    True se o resultado (ou uma das partes de uma tupla) foi cortado pelo
+    limite de tempo: ele depende da carga da máquina e não deve ir para o cache.
+    """
+    partes = resultado if isinstance(resultado, tuple) else (resultado,)
+    return any(isinstance(parte, dict) and parte.get("limite") == "tempo" for parte in partes)
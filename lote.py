@@ -0,0 +1,165 @@
+"""
+Versões vetorizadas (em lote) da bisseção e do método de Newton-Raphson.
+Vários problemas com a MESMA função são resolvidos juntos: todos os pontos
+médios / passos de Newton são atualizados como arrays, com uma máscara
+indicando quais problemas ainda não convergiram.
+"""
+# Usado pelas rotas /bissecao/batch, /newton/batch e /bissecao/varredura do backend.
+
+import numpy as np                                        # Operações vetorizadas sobre todos os problemas do lote
+
+from derivada import derivada_numerica                    # Diferença central; funciona igual com arrays
+from expressao import compilar_funcao                     # Compila a função no modo vetorizado (NumPy)
+
+
+def bissecao_lote(funcao_str, a, b, tol=1e-6, max_iter=100, progresso=None):
+    """
+    Método da Bisseção aplicado a vários intervalos de uma só vez.
+
+    Parâmetros:
+    funcao_str: string com f(x), ex: "x**3 - x - 1"
+    a, b: sequências com os limites de cada intervalo [a_i, b_i]
+    tol: tolerância
+    max_iter: número máximo de iterações
+    progresso: callback opcional chamado a cada iteração (iteracao, ativos, maior_largura)
+
+    Retorna:
+    raizes: array com a raiz de cada intervalo (nan onde f(a) e f(b) não têm sinais opostos)
+    valido: array booleano indicando quais intervalos tinham mudança de sinal
+    iteracoes: array com o número de iterações usadas em cada intervalo
+    """
+    f = compilar_funcao(funcao_str, vetorizada=True)      # Uma chamada avalia f em todos os pontos
+    a = np.array(a, dtype=float)                          # Cópias: os limites são alterados durante o laço
+    b = np.array(b, dtype=float)
+    fa = f(a)
+    fb = f(b)
+
+    valido = fa * fb < 0                                  # Condição de existência de raiz (mudança de sinal)
+    raizes = np.full(a.shape, np.nan)                     # nan para os intervalos sem mudança de sinal
+    iteracoes = np.zeros(a.shape, dtype=int)
+    ativos = np.flatnonzero(valido)                       # Índices que ainda estão iterando
+
+    for it in range(1, max_iter + 1):
+        if ativos.size == 0:                              # Todos já convergiram
+            break
+        aa, bb = a[ativos], b[ativos]
+        if progresso is not None:
+            progresso(iteracao=it, ativos=int(ativos.size), maior_largura=float(np.max(np.abs(bb - aa))))
+        c = (aa + bb) / 2                                 # Pontos médios de todos os intervalos ativos
+        fc = f(c)
+        iteracoes[ativos] = it
+
+        # critério de parada (por problema)
+        parou = (np.abs(fc) < tol) | ((bb - aa) / 2 < tol)
+        raizes[ativos[parou]] = c[parou]
+
+        # atualiza intervalo dos que continuam
+        continua = ~parou
+        esquerda = continua & (fa[ativos] * fc < 0)       # A raiz está em [a, c]
+        direita = continua & ~esquerda                    # A raiz está em [c, b]
+        b[ativos[esquerda]] = c[esquerda]
+        fb[ativos[esquerda]] = fc[esquerda]
+        a[ativos[direita]] = c[direita]
+        fa[ativos[direita]] = fc[direita]
+        ativos = ativos[continua]
+
+    # quem estourou o número máximo de iterações recebe o meio do último intervalo
+    raizes[ativos] = (a[ativos] + b[ativos]) / 2
+    return raizes, valido, iteracoes
+
+
+def newton_lote(funcao_str, x0, tolerancia=0.0001, max_iteracoes=10, progresso=None):
+    """
+    Método de Newton-Raphson aplicado a vários chutes iniciais de uma só vez.
+
+    Parâmetros:
+    funcao_str: string com f(x)
+    x0: sequência com os chutes iniciais
+    tolerancia: tolerância do critério |x_novo - x|
+    max_iteracoes: número máximo de iterações
+    progresso: callback opcional chamado a cada iteração (iteracao, ativos)
+
+    Retorna:
+    raizes: array com a última aproximação de cada problema
+    iteracoes: array com o número de iterações de cada problema
+    convergiu: array booleano
+    derivada_nula: array booleano indicando os que pararam por derivada quase zero
+    nao_finito: array booleano indicando os que pararam com f(x) ou f'(x) não finito
+                (x fora do domínio da função, ex: log de negativo)
+    """
+    f = compilar_funcao(funcao_str, vetorizada=True)
+    x = np.array(x0, dtype=float)
+    iteracoes = np.zeros(x.shape, dtype=int)
+    convergiu = np.zeros(x.shape, dtype=bool)
+    derivada_nula = np.zeros(x.shape, dtype=bool)
+    nao_finito = np.zeros(x.shape, dtype=bool)
+    ativos = np.arange(x.size)                            # Índices que ainda estão iterando
+
+    for it in range(max_iteracoes):
+        if ativos.size == 0:
+            break
+        if progresso is not None:
+            progresso(iteracao=it, ativos=int(ativos.size))
+        xa = x[ativos]
+        fx = f(xa)
+        dx = derivada_numerica(f, xa)                     # Derivada de todos os pontos ativos em uma chamada
+
+        invalido = ~(np.isfinite(fx) & np.isfinite(dx))   # Fora do domínio (nan/inf): para sem convergir
+        nao_finito[ativos[invalido]] = True
+        nula = ~invalido & (np.abs(dx) < 1e-10)           # Derivada muito próxima de zero: para sem convergir
+        derivada_nula[ativos[nula]] = True
+
+        with np.errstate(all="ignore"):
+            x_novo = xa - fx / dx                         # Passo de Newton de todos os problemas
+        parou = ~nula & ~invalido & (np.abs(x_novo - xa) < tolerancia)
+        convergiu[ativos[parou]] = True
+        iteracoes[ativos[parou]] = it + 1
+
+        segue = ~nula & ~invalido
+        x[ativos[segue]] = x_novo[segue]                  # Atualiza x (inclusive dos que acabaram de convergir)
+        segue &= ~parou
+        iteracoes[ativos[segue]] = it + 1
+        ativos = ativos[segue]
+
+    return x, iteracoes, convergiu, derivada_nula, nao_finito
+
+
+def varrer_raizes(funcao_str, a, b, pontos=1000, tol=1e-6, max_iter=100, progresso=None):
+    """
+    Procura TODAS as raízes de f em [a, b]: avalia f numa grade de pontos,
+    detecta as mudanças de sinal e refina todos os intervalos encontrados
+    de uma vez com a bisseção em lote.
+
+    Parâmetros:
+    funcao_str: string com f(x)
+    a, b: limites da faixa de busca
+    pontos: número de pontos da grade (resolução da busca)
+    tol: tolerância da bisseção
+    max_iter: número máximo de iterações da bisseção
+    progresso: callback opcional repassado à bisseção em lote
+
+    Retorna:
+    raizes: lista ordenada com as raízes encontradas
+    intervalos: lista com os intervalos [x_i, x_i+1] onde houve mudança de sinal
+
+    Raízes mais próximas entre si que o espaçamento da grade podem não ser detectadas.
+    """
+    if pontos < 2:
+        raise ValueError("A grade precisa de pelo menos 2 pontos")
+    f = compilar_funcao(funcao_str, vetorizada=True)
+    x = np.linspace(a, b, int(pontos))                    # Grade uniforme em [a, b]
+    y = f(x)                                              # Uma única chamada avalia todos os pontos
+
+    finitos = np.isfinite(y[:-1]) & np.isfinite(y[1:])    # Ignora trechos com nan/inf (fora do domínio)
+    troca = finitos & (y[:-1] * y[1:] < 0)                # Mudança de sinal entre pontos vizinhos
+    esquerda = np.flatnonzero(troca)
+
+    raizes = list(x[y == 0])                              # Pontos da grade que já são raízes exatas
+    if esquerda.size:
+        refinadas, _, _ = bissecao_lote(funcao_str, x[esquerda], x[esquerda + 1], tol, max_iter, progresso)
+        # Descarta polos (ex: tan(x) em pi/2): neles o sinal troca, mas |f| cresce em vez de ir a zero
+        limite = np.maximum(np.abs(y[esquerda]), np.abs(y[esquerda + 1]))
+        raizes.extend(refinadas[np.abs(f(refinadas)) <= limite])
+
+    intervalos = [[float(x[i]), float(x[i + 1])] for i in esquerda]
+    return sorted(float(r) for r in raizes), intervalos
@@ -0,0 +1,221 @@
+"""
+Métodos iterativos para sistemas lineares A·x = b: Jacobi, Gauss-Seidel,
+SOR e Gradiente Conjugado. Para sistemas grandes diagonalmente dominantes
+ou simétricos positivos definidos, costumam ser muito mais baratos que a
+eliminação de Gauss, e aceitam um chute inicial x0 (warm start): quando o
+sistema muda pouco de uma requisição para a outra, poucas iterações bastam.
+"""
+# Usado pela rota /gauss/iterativo do backend.
+
+import numpy as np
+
+METODOS_ITERATIVOS = ("auto", "jacobi", "gauss_seidel", "sor", "gradiente_conjugado")
+
+
+def separar_sistema(matriz):
+    """
+    Separa a matriz aumentada [A|b] em A (n x n) e b (n) como arrays.
+    """
+    aumentada = np.asarray(matriz, dtype=float)
+    n = aumentada.shape[0]
+    if aumentada.ndim != 2 or aumentada.shape[1] != n + 1:
+        raise ValueError("A matriz aumentada precisa ter n linhas e n+1 colunas")
+    return aumentada[:, :n], aumentada[:, n]
+
+
+def diagonal_dominante(A):
+    """
+    Verifica se A é estritamente diagonalmente dominante por linhas
+    (|a_ii| > soma dos |a_ij| da linha, j != i). Nesse caso Jacobi e
+    Gauss-Seidel convergem para qualquer x0.
+    """
+    A = np.asarray(A, dtype=float)
+    diagonal = np.abs(np.diag(A))
+    fora_da_diagonal = np.abs(A).sum(axis=1) - diagonal
+    return bool(np.all(diagonal > fora_da_diagonal))
+
+
+def simetrica_positiva(A):
+    """
+    Teste barato de candidata a SPD: simétrica e com diagonal positiva.
+    (Não garante que seja positiva definida, mas é o caso típico do Gradiente Conjugado.)
+    """
+    A = np.asarray(A, dtype=float)
+    return bool(np.allclose(A, A.T) and np.all(np.diag(A) > 0))
+
+
+def escolher_metodo(A):
+    """
+    Escolhe o método iterativo pela estrutura de A, no espírito de analisar_matriz:
+    "gradiente_conjugado" para simétrica positiva, "gauss_seidel" para
+    diagonalmente dominante, ou None se nenhum método iterativo tem
+    convergência garantida (melhor usar a eliminação de Gauss).
+    """
+    if simetrica_positiva(A):
+        return "gradiente_conjugado"
+    if diagonal_dominante(A):
+        return "gauss_seidel"
+    return None
+
+
+def _divergiu(iteracoes):
+    return {
+        "solucao": None,                                  # Sem NaN/Inf na resposta (JSON inválido)
+        "iteracoes": iteracoes,
+        "convergiu": False,
+        "residuo": None,
+        "mensagem": "O método divergiu (resíduo não finito): a matriz não é adequada a este método",
+    }
+
+
+def _resultado(x, iteracoes, convergiu, A, b):
+    with np.errstate(over="ignore", invalid="ignore"):
+        residuo = float(np.linalg.norm(A @ x - b))        # ||A·x - b|| da aproximação final
+    if not np.isfinite(residuo) or not np.all(np.isfinite(x)):
+        return _divergiu(iteracoes)
+    resultado = {
+        "solucao": x.tolist(),
+        "iteracoes": iteracoes,
+        "convergiu": convergiu,
+        "residuo": residuo,
+    }
+    if not convergiu:
+        resultado["mensagem"] = "Não convergiu no número máximo de iterações"
+    return resultado
+
+
+def _chute_inicial(x0, n):
+    if x0 is None:
+        return np.zeros(n)
+    x = np.array(x0, dtype=float)                         # Cópia: o vetor é atualizado no lugar
+    if x.shape != (n,):
+        raise ValueError(f"x0 precisa ter {n} elementos")
+    return x
+
+
+def _verificar_diagonal(A):
+    if np.any(np.abs(np.diag(A)) < 1e-10):
+        raise ValueError("Elemento da diagonal quase zero: o método não se aplica (reordene as equações)")
+
+
+def jacobi(A, b, x0=None, tolerancia=1e-8, max_iter=1000):
+    """
+    Método de Jacobi: x_novo = D⁻¹ (b - (A - D)·x), todas as componentes ao mesmo tempo.
+    Para quando max|x_novo - x| < tolerancia.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    _verificar_diagonal(A)
+    x = _chute_inicial(x0, len(b))
+    diagonal = np.diag(A)
+
+    with np.errstate(over="ignore", invalid="ignore"):   # Divergência é detectada pelo resíduo, sem avisos de overflow
+        for it in range(1, max_iter + 1):
+            r = b - A @ x                                 # Um produto matriz-vetor por iteração
+            if not np.all(np.isfinite(r)):
+                return _divergiu(it - 1)
+            x_novo = x + r / diagonal                     # = D⁻¹ (b - (A - D)·x)
+            if np.max(np.abs(x_novo - x)) < tolerancia:
+                return _resultado(x_novo, it, True, A, b)
+            x = x_novo
+    return _resultado(x, max_iter, False, A, b)
+
+
+def sor(A, b, x0=None, tolerancia=1e-8, max_iter=1000, omega=1.5):
+    """
+    Sobre-relaxação sucessiva (SOR): como Gauss-Seidel, mas cada componente
+    avança omega vezes a correção (0 < omega < 2; omega = 1 é Gauss-Seidel).
+    """
+    if not 0 < omega < 2:
+        raise ValueError("omega precisa estar entre 0 e 2")
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    _verificar_diagonal(A)
+    x = _chute_inicial(x0, len(b))
+    n = len(b)
+
+    with np.errstate(over="ignore", invalid="ignore"):   # Divergência é detectada pelo resíduo, sem avisos de overflow
+        for it in range(1, max_iter + 1):
+            maior_passo = 0.0
+            for i in range(n):                            # Usa as componentes já atualizadas nesta iteração
+                gauss_seidel_i = (b[i] - A[i] @ x + A[i, i] * x[i]) / A[i, i]
+                passo = omega * (gauss_seidel_i - x[i])
+                x[i] += passo
+                maior_passo = max(maior_passo, abs(passo))
+            if not np.all(np.isfinite(b - A @ x)):
+                return _divergiu(it)
+            if maior_passo < tolerancia:
+                return _resultado(x, it, True, A, b)
+    return _resultado(x, max_iter, False, A, b)
+
+
+def gauss_seidel(A, b, x0=None, tolerancia=1e-8, max_iter=1000):
+    """
+    Método de Gauss-Seidel: como Jacobi, mas cada componente nova já é usada
+    no cálculo das seguintes (converge em geral com menos iterações).
+    """
+    return sor(A, b, x0, tolerancia, max_iter, omega=1.0)
+
+
+def gradiente_conjugado(A, b, x0=None, tolerancia=1e-8, max_iter=1000):
+    """
+    Gradiente Conjugado para A simétrica positiva definida.
+    Em aritmética exata converge em no máximo n iterações.
+    Para quando ||b - A·x|| < tolerancia.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    x = _chute_inicial(x0, len(b))
+    r = b - A @ x                                         # Resíduo inicial
+    d = r.copy()                                          # Primeira direção de busca
+    rr = r @ r
+
+    if np.sqrt(rr) < tolerancia:                          # x0 já é solução
+        return _resultado(x, 0, True, A, b)
+    for it in range(1, max_iter + 1):
+        Ad = A @ d
+        curvatura = d @ Ad
+        if curvatura <= 0:                                # A não é positiva definida nessa direção
+            resultado = _resultado(x, it - 1, False, A, b)
+            resultado["mensagem"] = "A matriz não é positiva definida"
+            return resultado
+        alfa = rr / curvatura                             # Passo ótimo na direção d
+        x += alfa * d
+        r -= alfa * Ad
+        rr_novo = r @ r
+        if not np.isfinite(rr_novo):
+            return _divergiu(it)
+        if np.sqrt(rr_novo) < tolerancia:
+            return _resultado(x, it, True, A, b)
+        d = r + (rr_novo / rr) * d                        # Nova direção, conjugada às anteriores
+        rr = rr_novo
+    return _resultado(x, max_iter, False, A, b)
+
+
+FUNCOES = {
+    "jacobi": jacobi,
+    "gauss_seidel": gauss_seidel,
+    "sor": sor,
+    "gradiente_conjugado": gradiente_conjugado,
+}
+
+
+def resolver_iterativo(A, b, metodo="auto", x0=None, tolerancia=1e-8, max_iter=1000, omega=1.5):
+    """
+    Resolve A·x = b com o método iterativo pedido.
+    Com metodo="auto", escolhe pela estrutura de A (ver escolher_metodo);
+    se nenhum se aplica, devolve None para o chamador usar a eliminação de Gauss.
+
+    Retorna:
+    (nome do método usado, dicionário com solucao, iteracoes, convergiu, residuo),
+    ou (None, None) no caso acima.
+    """
+    if metodo not in METODOS_ITERATIVOS:
+        raise ValueError(f"Método desconhecido: {metodo}. Use um de: {', '.join(METODOS_ITERATIVOS)}")
+    if metodo == "auto":
+        metodo = escolher_metodo(A)
+        if metodo is None:
+            return None, None
+    if metodo == "sor":
+        return metodo, sor(A, b, x0, tolerancia, max_iter, omega)
+    return metodo, FUNCOES[metodo](A, b, x0, tolerancia, max_iter)
@@ -0,0 +1,181 @@
+"""
+Métricas do servidor no formato texto do Prometheus (rota /metrics) e
+medição das etapas de cada requisição (leitura do JSON, compilação da
+função, cálculo, serialização...).
+
+As etapas são anotadas num coletor por thread: a requisição abre um coletor,
+e o código medido chama etapa()/anotar() sem saber de quem é. Nos processos
+de cálculo, medir() abre o coletor da tarefa e devolve as medidas junto com
+o resultado; o executor as incorpora ao coletor da requisição (incorporar()).
+
+As métricas são de cada processo do servidor: com vários workers do
+Gunicorn, cada coleta do Prometheus vê o worker que a atendeu.
+"""
+# Usado pelo backend (ganchos de requisição e rota /metrics), por executor.py e tarefas.py.
+
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+BALDES_SEGUNDOS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+BALDES_CONTAGEM = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 10_000, 100_000)
+
+_local = threading.local()                                # Coletor da requisição/tarefa em andamento nesta thread
+
+
+# =========================
+# COLETOR DE ETAPAS
+# =========================
+def _novo_coletor():
+    return {"etapas": defaultdict(float), "contadores": defaultdict(float)}
+
+
+def abrir_coletor():
+    """Novo coletor desta thread; retorna (coletor, anterior). Feche com fechar_coletor(anterior)."""
+    anterior = getattr(_local, "coletor", None)
+    _local.coletor = _novo_coletor()
+    return _local.coletor, anterior
+
+
+def fechar_coletor(anterior):
+    _local.coletor = anterior
+
+
+@contextmanager
+def coletar():
+    """Durante o bloco, etapa() e anotar() nesta thread acumulam no coletor devolvido."""
+    coletor, anterior = abrir_coletor()
+    try:
+        yield coletor
+    finally:
+        fechar_coletor(anterior)
+
+
+@contextmanager
+def etapa(nome):
+    """Soma a duração do bloco à etapa 'nome' do coletor atual (sem coletor, não mede)."""
+    coletor = getattr(_local, "coletor", None)
+    if coletor is None:
+        yield
+        return
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        coletor["etapas"][nome] += time.perf_counter() - inicio
+
+
+def anotar(nome, valor=1):
+    """Soma 'valor' ao contador 'nome' do coletor atual (ex: avaliações de f, iterações)."""
+    coletor = getattr(_local, "coletor", None)
+    if coletor is not None:
+        coletor["contadores"][nome] += valor
+
+
+def incorporar(medidas):
+    """Soma as medidas de uma tarefa (vindas de outro processo) ao coletor atual."""
+    coletor = getattr(_local, "coletor", None)
+    if coletor is None:
+        return
+    for grupo in ("etapas", "contadores"):
+        for nome, valor in medidas[grupo].items():
+            coletor[grupo][nome] += valor
+
+
+def medir(funcao, *args):
+    """Roda funcao(*args) no processo de cálculo; retorna (resultado, medidas da tarefa)."""
+    with coletar() as coletor:
+        resultado = funcao(*args)
+    return resultado, {grupo: dict(valores) for grupo, valores in coletor.items()}
+
+
+# =========================
+# REGISTRO (FORMATO PROMETHEUS)
+# =========================
+def _escapar(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _rotulos(rotulos):
+    if not rotulos:
+        return ""
+    return "{" + ",".join(f'{chave}="{_escapar(valor)}"' for chave, valor in rotulos) + "}"
+
+
+def _numero(valor):
+    return repr(float(valor)) if valor != int(valor) else str(int(valor))
+
+
+class Registro:
+    """
+    Contadores, medidores e histogramas com rótulos, exportados por texto().
+
+    Parâmetros:
+    descricoes: {nome: (tipo, ajuda, baldes)}; tipo é "counter", "gauge" ou
+                "histogram" (baldes só nos histogramas)
+    """
+
+    def __init__(self, descricoes):
+        self.descricoes = descricoes
+        self._valores = defaultdict(dict)                 # nome -> {rótulos: valor} (ou [contagens, soma, total])
+        self._trava = threading.Lock()
+
+    def contar(self, nome, valor=1, **rotulos):
+        chave = tuple(sorted(rotulos.items()))
+        with self._trava:
+            series = self._valores[nome]
+            series[chave] = series.get(chave, 0) + valor
+
+    def ajustar(self, nome, delta, **rotulos):
+        """Soma delta ao medidor (gauge); ex: requisições em andamento."""
+        self.contar(nome, delta, **rotulos)
+
+    def observar(self, nome, valor, **rotulos):
+        baldes = self.descricoes[nome][2]
+        chave = tuple(sorted(rotulos.items()))
+        with self._trava:
+            serie = self._valores[nome].get(chave)
+            if serie is None:
+                serie = self._valores[nome][chave] = [[0] * len(baldes), 0.0, 0]
+            for i, limite in enumerate(baldes):
+                if valor <= limite:
+                    serie[0][i] += 1
+                    break
+            serie[1] += valor
+            serie[2] += 1
+
+    def texto(self, extras=()):
+        """
+        Todas as séries no formato de exposição do Prometheus.
+        extras: (nome, tipo, ajuda, [(rótulos, valor), ...]) lidos na hora (ex: estatísticas dos caches).
+        """
+        linhas = []
+        with self._trava:
+            for nome, (tipo, ajuda, baldes) in self.descricoes.items():
+                linhas += [f"# HELP {nome} {ajuda}", f"# TYPE {nome} {tipo}"]
+                for chave, valor in sorted(self._valores[nome].items()):
+                    if tipo != "histogram":
+                        linhas.append(f"{nome}{_rotulos(chave)} {_numero(valor)}")
+                        continue
+                    contagens, soma, total = valor
+                    acumulado = 0
+                    for limite, contagem in zip(baldes, contagens):
+                        acumulado += contagem
+                        linhas.append(f"{nome}_bucket{_rotulos(chave + (('le', _numero(limite)),))} {acumulado}")
+                    linhas.append(f"{nome}_bucket{_rotulos(chave + (('le', '+Inf'),))} {total}")
+                    linhas.append(f"{nome}_sum{_rotulos(chave)} {_numero(soma)}")
+                    linhas.append(f"{nome}_count{_rotulos(chave)} {total}")
+        for nome, tipo, ajuda, series in extras:
+            linhas += [f"# HELP {nome} {ajuda}", f"# TYPE {nome} {tipo}"]
+            for rotulos, valor in series:
+                linhas.append(f"{nome}{_rotulos(tuple(sorted(rotulos.items())))} {_numero(valor)}")
+        return "\n".join(linhas) + "\n"
+
+
+def server_timing(coletor, total):
+    """Cabeçalho Server-Timing (milissegundos) com as etapas do coletor e o total."""
+    partes = [f"{nome};dur={segundos * 1000:.3f}" for nome, segundos in coletor["etapas"].items()]
+    partes += [f"{nome};desc={_numero(valor)}" for nome, valor in coletor["contadores"].items()]
+    partes.append(f"total;dur={total * 1000:.3f}")
+    return ", ".join(partes)
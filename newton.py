@@ -0,0 +1,150 @@
+"""
+Método de Newton-Raphson para encontrar raízes de f(x).
+"""
+# Usado pela rota /newton do backend (executado nos processos de cálculo, ver tarefas.py).
+
+from bissecao import mudanca_de_sinal      # mesma verificação de intervalo da bisseção (método híbrido).
+from derivada import derivada_numerica     # derivada numérica usada quando não há derivada automática.
+from historico import Historico            # histórico dos x em array, completo ou limitado (ver historico.py).
+from limites import LimiteExcedido         # f limitada por um Orcamento (avaliações/tempo) lança isto ao passar do limite.
+
+
+def newton_raphson(f, x_inicial, tolerancia=0.0001, max_iteracoes=10, f_e_derivada=None, progresso=None, historico=None):  # define a função do método de Newton-Raphson; recebe f(x), chute inicial, tolerância e número máximo de iterações. Se remover, a rota /newton não tem como calcular nada.
+    # f_e_derivada (opcional): função que devolve (f(x), f'(x)) numa só avaliação (derivada automática). Sem ela, usa a derivada numérica como antes.
+    # progresso (opcional): callback chamado a cada iteração com a iteração, o x atual e f(x) (acompanhamento dos trabalhos assíncronos).
+    # historico (opcional): Historico que guarda os x (nenhum, últimos n, um a cada n ou todos); sem ele, guarda todos, como antes.
+    x = x_inicial                        # inicializa x com o valor inicial dado pelo usuário. Se remover, x não teria valor definido.
+    iteracoes = 0                        # contador de iterações começa em 0. Se remover, o while não controla o número de passos corretamente.
+    if historico is None:
+        historico = Historico()          # modo "completo": todos os x.
+    historico.registrar(x)               # guarda o primeiro valor de x no histórico. Se remover, você perde o registro dos valores usados.
+
+    while iteracoes < max_iteracoes:     # laço que repete enquanto não atingir o máximo de iterações. Se remover, Newton não faria iterações.
+        try:
+            if f_e_derivada is not None: # derivada automática: f(x) e f'(x) exatos em uma única passada.
+                fx, dx = f_e_derivada(x)
+            else:
+                fx = f(x)                # calcula f(x) no ponto atual. Sem isso, não tem como aplicar a fórmula de Newton.
+                dx = derivada_numerica(f, x)  # calcula a derivada numérica em x. Se remover, não há dx pra dividir e a fórmula não funciona.
+        except LimiteExcedido as e:      # orçamento de avaliações ou de tempo esgotado: devolve o último x como resultado parcial.
+            return {
+                "raiz": x,
+                "iteracoes": iteracoes,
+                "convergiu": False,
+                **historico.resposta(),
+                "mensagem": str(e),
+                "limite": e.motivo
+            }
+
+        if progresso is not None:        # informa o andamento (x atual e f(x)) a quem acompanha o cálculo.
+            progresso(iteracao=iteracoes, x=float(x), fx=float(fx))
+
+        if abs(dx) < 1e-10:              # verifica se a derivada está muito próxima de zero (risco de divisão por zero). Se remover, pode dividir por um número quase zero e explodir numericamente.
+            return {
+                "raiz": x,
+                "iteracoes": iteracoes,
+                "convergiu": False,
+                **historico.resposta(),
+                "mensagem": "Derivada muito próxima de zero"
+            }                            # retorna um dicionário indicando que não convergiu por causa da derivada quase zero. Se remover esse return, o código continuaria e poderia dar erro.
+
+        x_novo = x - fx / dx             # fórmula de Newton-Raphson para calcular a próxima aproximação. Se remover, x nunca é atualizado.
+        historico.registrar(x_novo)      # adiciona o novo x no histórico. Se remover, você perde esse valor no registro.
+
+        if abs(x_novo - x) < tolerancia:  # critério de parada: se a diferença entre x_novo e x for menor que a tolerância. Se remover, o método só pararia quando estourar o número de iterações.
+            return {
+                "raiz": x_novo,
+                "iteracoes": iteracoes + 1,
+                "convergiu": True,
+                **historico.resposta()
+            }                            # retorna o resultado quando converge. Se remover, o laço continuaria mesmo já tendo solução boa.
+
+        x = x_novo                       # atualiza x para o novo valor e segue a próxima iteração. Se remover, x fica preso no mesmo valor e o método entra em loop ou não converge.
+        iteracoes += 1                   # incrementa o contador de iterações. Se remover, o while nunca atinge o limite e pode entrar em loop infinito.
+
+    return {
+        "raiz": x,
+        "iteracoes": iteracoes,
+        "convergiu": False,
+        **historico.resposta(),
+        "mensagem": "Não convergiu no número máximo de iterações"
+    }                                    # caso o laço termine por atingir o máximo de iterações, retorna o melhor x encontrado e indica que não convergiu totalmente. Se remover, a função pode acabar sem retorno.
+
+
+def newton_hibrido(f, a, b, tolerancia=0.0001, max_iteracoes=100, f_e_derivada=None, progresso=None, historico=None, x_inicial=None):
+    # Newton protegido por bisseção: mantém um intervalo [a, b] com mudança de sinal e dá passos de Newton dentro dele.
+    # Quando o passo de Newton sai do intervalo, a derivada é quase zero ou o passo não cai pelo menos à metade
+    # do penúltimo (Newton empacado ou oscilando), dá um passo de bisseção. Converge como o Newton perto da raiz,
+    # e nunca sai do intervalo como a bisseção.
+    # x_inicial (opcional): primeiro ponto, se estiver dentro de (a, b); senão começa no ponto médio.
+    # Retorna o mesmo dicionário de newton_raphson, com "passos_newton" e "passos_bissecao",
+    # ou {"raiz": None, ...} se f(a) e f(b) não tiverem sinais opostos (mesma convenção da bisseção).
+    if historico is None:
+        historico = Historico()
+    passos_newton = passos_bissecao = 0
+    iteracoes = 0
+    x = None                             # último ponto avaliado (resultado parcial se um limite for atingido).
+
+    def resultado(raiz, convergiu, **extras):
+        return {
+            "raiz": raiz,
+            "iteracoes": iteracoes,
+            "convergiu": convergiu,
+            **historico.resposta(),
+            "passos_newton": passos_newton,
+            "passos_bissecao": passos_bissecao,
+            **extras,
+        }
+
+    try:
+        fa = f(a)
+        fb = f(b)
+        if not mudanca_de_sinal(fa, fb):  # sem mudança de sinal: o backend responde como a rota /bissecao.
+            return resultado(None, False, mensagem="f(a) e f(b) precisam ter sinais opostos")
+        if fa > 0:                       # orienta o intervalo: f(baixo) < 0 < f(alto).
+            a, b = b, a
+        baixo, alto = a, b
+
+        x = x_inicial if x_inicial is not None and min(baixo, alto) < x_inicial < max(baixo, alto) else (baixo + alto) / 2
+        passo = passo_anterior = abs(alto - baixo)  # o primeiro passo de Newton só precisa ficar dentro do intervalo.
+
+        while iteracoes < max_iteracoes:
+            if f_e_derivada is not None:
+                fx, dx = f_e_derivada(x)
+            else:
+                fx = f(x)
+                dx = derivada_numerica(f, x)
+            historico.registrar(x)
+
+            if progresso is not None:
+                progresso(iteracao=iteracoes, x=float(x), fx=float(fx), a=float(baixo), b=float(alto))
+
+            if fx == 0:                  # raiz exata.
+                return resultado(x, True)
+            if fx < 0:                   # a raiz continua entre o ponto com f < 0 e o com f > 0.
+                baixo = x
+            else:
+                alto = x
+
+            x_newton = x - fx / dx if abs(dx) >= 1e-10 else None
+            passo_antes = passo_anterior
+            passo_anterior = passo
+            if (x_newton is not None and min(baixo, alto) <= x_newton <= max(baixo, alto)  # na borda: passo ~0, já convergiu.
+                    and abs(x_newton - x) <= passo_antes / 2):
+                x_novo = x_newton        # passo de Newton aceito.
+                passos_newton += 1
+            else:
+                x_novo = (baixo + alto) / 2  # passo de bisseção.
+                passos_bissecao += 1
+            passo = abs(x_novo - x)
+            iteracoes += 1
+
+            if passo < tolerancia or abs(alto - baixo) < tolerancia:
+                historico.registrar(x_novo)
+                return resultado(x_novo, True)
+            x = x_novo
+    except LimiteExcedido as e:          # orçamento esgotado: devolve o último ponto como resultado parcial.
+        return resultado(x, False, mensagem=str(e), limite=e.motivo)
+
+    historico.registrar(x)
+    return resultado(x, False, mensagem="Não convergiu no número máximo de iterações")
@@ -0,0 +1,115 @@
+"""
+Método de Newton para sistemas não lineares F(x) = 0 (várias variáveis).
+Cada passo resolve J(x)·dx = -F(x) com a eliminação de Gauss do projeto
+(eliminacao_gauss.py), no mesmo processo: o cliente faz uma requisição só,
+em vez de uma chamada a /gauss por iteração.
+
+A jacobiana vem das derivadas automáticas (números duais), de diferenças
+centrais (derivada.jacobiana_numerica) ou, com broyden=True, é
+calculada só no início e atualizada a cada passo pela fórmula de Broyden.
+"""
+# Usado pela rota /newton-sistema do backend (executado nos processos de cálculo, ver tarefas.py).
+
+import math
+
+import numpy as np
+
+from derivada import jacobiana_numerica
+from eliminacao_gauss import eliminacao_gauss
+from historico import Historico
+from limites import LimiteExcedido
+
+
+def _atualizar_broyden(J, dx, dF):
+    """Atualização de Broyden ("boa"): J + (dF - J·dx)·dxᵀ / (dx·dx)."""
+    J = np.asarray(J, dtype=float)
+    dx = np.asarray(dx, dtype=float)
+    return (J + np.outer(np.asarray(dF, dtype=float) - J @ dx, dx) / (dx @ dx)).tolist()
+
+
+def _norma(valores):
+    return max((abs(v) for v in valores), default=0.0)
+
+
+def newton_sistema(F, x0, tolerancia=0.0001, max_iteracoes=50, F_e_jacobiana=None, broyden=False,
+                   motor="python", progresso=None, historico=None):
+    """
+    Parâmetros:
+    F: função que recebe x (lista) e devolve a lista F(x)
+    x0: chute inicial (uma posição por variável)
+    tolerancia: critério de parada max|dx| < tolerancia
+    F_e_jacobiana: função que devolve (F(x), J(x)) (jacobiana automática);
+                   sem ela, usa jacobiana_numerica
+    broyden: se True, a jacobiana exata só é calculada no início (e de novo se
+             a aproximada ficar singular); nos outros passos, atualização de Broyden
+    motor: motor da eliminação de Gauss de cada passo ("python" ou "numpy")
+    progresso: callback opcional chamado a cada iteração (iteração, residuo)
+    historico: Historico opcional (campos = número de variáveis) com os x de cada iteração
+
+    Retorna um dicionário:
+      raiz (lista), iteracoes, convergiu, residuo (max|F(raiz)|),
+      jacobianas (quantas jacobianas exatas foram calculadas) e, se não
+      convergiu, mensagem (e "limite" se parou por um limite do Orcamento)
+    """
+    x = [float(v) for v in x0]
+    if historico is None:
+        historico = Historico("nenhum")
+    iteracoes = 0
+    jacobianas = 0
+    fx = None
+    J = None
+    exata = False                                         # J é a jacobiana exata de x (não uma atualização de Broyden)
+
+    def resultado(convergiu, **extras):
+        return {
+            "raiz": x,
+            "iteracoes": iteracoes,
+            "convergiu": convergiu,
+            "residuo": _norma(fx) if fx is not None else None,
+            "jacobianas": jacobianas,
+            **historico.resposta(),
+            **extras,
+        }
+
+    try:
+        fx = F(x)
+        historico.registrar(*x)
+        while iteracoes < max_iteracoes:
+            if not all(math.isfinite(v) for v in fx):
+                return resultado(False, mensagem="F(x) não é finita no ponto atual")
+            if J is None:
+                if F_e_jacobiana is not None:
+                    fx, J = F_e_jacobiana(x)
+                else:
+                    J = jacobiana_numerica(F, x)
+                jacobianas += 1
+                exata = True
+
+            if progresso is not None:
+                progresso(iteracao=iteracoes, residuo=_norma(fx))
+
+            aumentada = [list(linha) + [-v] for linha, v in zip(J, fx)]  # [J | -F(x)]
+            dx, _, _ = eliminacao_gauss(aumentada, True, motor, "nenhuma")
+            if dx is None:
+                if not exata:                             # Broyden degenerou: recalcula a jacobiana exata
+                    J = None
+                    continue
+                return resultado(False, mensagem="Jacobiana singular - sem passo de Newton")
+
+            x_novo = [v + d for v, d in zip(x, dx)]
+            fx_novo = F(x_novo)
+            if broyden:
+                J = _atualizar_broyden(J, dx, [b - a for a, b in zip(fx, fx_novo)])
+                exata = False
+            else:
+                J = None
+            x, fx = x_novo, fx_novo
+            iteracoes += 1
+            historico.registrar(*x)
+
+            if _norma(dx) < tolerancia:
+                return resultado(True)
+    except LimiteExcedido as e:                           # orçamento esgotado: devolve o último x como resultado parcial
+        return resultado(False, mensagem=str(e), limite=e.motivo)
+
+    return resultado(False, mensagem="Não convergiu no número máximo de iterações")
@@ -0,0 +1,242 @@
+"""
+Caminho rápido para funções polinomiais (ex: "x**3 - x - 2"): os
+coeficientes são extraídos da árvore da expressão, f e f' são avaliadas pelo
+esquema de Horner (compilado como uma expressão só, sem números duais) e todas
+as raízes saem de uma vez como autovalores da matriz companheira.
+"""
+# Usado por expressao.py (compilação de f e f') e por tarefas.py (rota /polinomio/raizes).
+
+import ast
+import math
+
+try:
+    import numpy as np                                    # Opcional: só é necessário para calcular as raízes
+except ImportError:
+    np = None
+
+MAX_GRAU = 100                                            # Acima disso a expressão segue pelo caminho genérico
+TOLERANCIA_IMAGINARIA = 1e-7                              # |parte imaginária| relativa abaixo disso: raiz real
+PASSOS_REFINAMENTO = 3                                    # Passos de Newton em cada raiz real (precisão da raiz)
+
+
+# =========================
+# COEFICIENTES A PARTIR DA ÁRVORE
+# =========================
+def _constante(valor):
+    try:
+        valor = float(valor)
+    except OverflowError:                                 # Inteiro grande demais para float
+        return None
+    return ([valor], True) if math.isfinite(valor) else None
+
+
+def _grau(coeficientes):
+    return len(coeficientes) - 1
+
+
+def _monomio(coeficientes):
+    return sum(1 for c in coeficientes if c != 0) <= 1
+
+
+def _aparar(coeficientes):
+    while len(coeficientes) > 1 and coeficientes[-1] == 0:
+        coeficientes.pop()
+    return coeficientes
+
+
+def _somar(p, q, sinal=1.0):
+    resultado = [0.0] * max(len(p), len(q))
+    for i, c in enumerate(p):
+        resultado[i] += c
+    for i, c in enumerate(q):
+        resultado[i] += sinal * c
+    return _aparar(resultado)
+
+
+def _multiplicar(p, q):
+    resultado = [0.0] * (len(p) + len(q) - 1)
+    for i, a in enumerate(p):
+        if a == 0:
+            continue
+        for j, b in enumerate(q):
+            resultado[i + j] += a * b
+    return _aparar(resultado)
+
+
+def _coeficientes(no, variavel):
+    """
+    (coeficientes do grau 0 para cima, expandido) do nó, ou None se não for
+    polinômio em 'variavel'. expandido é False quando foi preciso multiplicar
+    somas (ex: (x - 1)**3): os coeficientes são exatos na álgebra, mas avaliar
+    a forma expandida perde precisão perto de raízes múltiplas.
+    """
+    if isinstance(no, ast.Constant):
+        return _constante(no.value)
+    if isinstance(no, ast.Name):
+        if no.id == variavel:
+            return [0.0, 1.0], True
+        if no.id in ("pi", "e"):
+            return _constante(getattr(math, no.id))
+        return None
+    if isinstance(no, ast.Attribute):                     # math.pi, math.e, math.tau
+        valor = getattr(math, no.attr, None)
+        return _constante(valor) if isinstance(valor, float) else None
+    if isinstance(no, ast.UnaryOp):
+        operando = _coeficientes(no.operand, variavel)
+        if operando is None:
+            return None
+        p, expandido = operando
+        return ([-c for c in p] if isinstance(no.op, ast.USub) else p), expandido
+    if not isinstance(no, ast.BinOp):                     # Chamadas de função (sin, exp...): não é polinômio
+        return None
+
+    esquerda = _coeficientes(no.left, variavel)
+    direita = _coeficientes(no.right, variavel)
+    if esquerda is None or direita is None:
+        return None
+    (p, exp_p), (q, exp_q) = esquerda, direita
+    expandido = exp_p and exp_q
+
+    if isinstance(no.op, (ast.Add, ast.Sub)):
+        r = _somar(p, q, 1.0 if isinstance(no.op, ast.Add) else -1.0)
+    elif isinstance(no.op, ast.Mult):
+        expandido = expandido and (_grau(p) == 0 or _grau(q) == 0 or (_monomio(p) and _monomio(q)))
+        r = _multiplicar(p, q)
+    elif isinstance(no.op, ast.Div):
+        if _grau(q) != 0 or q[0] == 0:                    # Só divisão por constante não nula
+            return None
+        r = [c / q[0] for c in p]
+    elif isinstance(no.op, ast.Pow):
+        if _grau(q) != 0:
+            return None
+        expoente = q[0]
+        if _grau(p) == 0:                                 # Constante ** constante (ex: 2**0.5)
+            try:
+                valor = p[0] ** expoente
+            except (OverflowError, ZeroDivisionError):
+                return None
+            return _constante(valor) if isinstance(valor, (int, float)) else None
+        if expoente != int(expoente) or not 0 <= expoente <= MAX_GRAU or _grau(p) * expoente > MAX_GRAU:
+            return None
+        expandido = expandido and _monomio(p)
+        r = [1.0]
+        for _ in range(int(expoente)):
+            r = _multiplicar(r, p)
+    else:                                                 # %, //: não é polinômio
+        return None
+
+    if _grau(r) > MAX_GRAU or not all(math.isfinite(c) for c in r):
+        return None
+    return r, expandido
+
+
+def extrair_coeficientes(corpo, variavel="x"):
+    """
+    Coeficientes do polinômio (grau mais alto primeiro) representado pelo corpo
+    da expressão, ou None se ela não for um polinômio em 'variavel'.
+
+    Retorna:
+    (coeficientes, expandido): expandido é True se a expressão já estava na
+    forma de soma de termos c·x**k (ver avaliacao_rapida)
+    """
+    resultado = _coeficientes(corpo, variavel)
+    if resultado is None:
+        return None
+    coeficientes, expandido = resultado
+    return tuple(c + 0.0 for c in reversed(coeficientes)), expandido  # + 0.0: sem -0.0 na resposta
+
+
+def avaliacao_rapida(corpo, variavel="x"):
+    """
+    Coeficientes para avaliar f por Horner, ou None se a expressão não é um
+    polinômio já expandido. Formas fatoradas como (x - 1)**3 continuam pelo
+    caminho genérico: expandidas, perderiam precisão perto da raiz múltipla.
+    """
+    resultado = extrair_coeficientes(corpo, variavel)
+    if resultado is None or not resultado[1]:
+        return None
+    return resultado[0]
+
+
+def derivar(coeficientes):
+    """Coeficientes de p' (grau mais alto primeiro)."""
+    grau = len(coeficientes) - 1
+    return tuple(c * (grau - i) for i, c in enumerate(coeficientes[:-1])) or (0.0,)
+
+
+# =========================
+# HORNER
+# =========================
+def corpo_horner(coeficientes, variavel="x"):
+    """
+    Árvore de (((c_n·x + c_{n-1})·x + ...)·x + c_0), pronta para compilar com
+    as outras expressões (funciona igual com floats e arrays do NumPy).
+    """
+    x = ast.Name(id=variavel, ctx=ast.Load())
+    corpo = ast.Constant(coeficientes[0])
+    for c in coeficientes[1:]:
+        corpo = ast.BinOp(corpo, ast.Mult(), x)
+        if c != 0:
+            corpo = ast.BinOp(corpo, ast.Add(), ast.Constant(c))
+    return corpo
+
+
+def corpo_horner_com_derivada(coeficientes, variavel="x"):
+    """Árvore da tupla (p(x), p'(x)), as duas por Horner numa única chamada."""
+    return ast.Tuple(
+        elts=[corpo_horner(coeficientes, variavel), corpo_horner(derivar(coeficientes), variavel)],
+        ctx=ast.Load(),
+    )
+
+
+def horner(coeficientes, x):
+    """(p(x), p'(x)) pelo esquema de Horner."""
+    p, dp = 0.0, 0.0
+    for c in coeficientes:
+        dp = dp * x + p
+        p = p * x + c
+    return p, dp
+
+
+# =========================
+# TODAS AS RAÍZES
+# =========================
+def raizes(coeficientes):
+    """
+    Todas as raízes do polinômio: autovalores da matriz companheira (np.roots),
+    com as raízes reais refinadas por alguns passos de Newton.
+
+    Retorna:
+    reais: lista ordenada das raízes reais (múltiplas aparecem repetidas)
+    complexas: lista de [parte real, parte imaginária] das demais
+    """
+    if np is None:
+        raise RuntimeError("As raízes de polinômios precisam do NumPy instalado (pip install numpy)")
+    coeficientes = list(coeficientes)
+    while coeficientes and coeficientes[0] == 0:
+        coeficientes.pop(0)
+    if not coeficientes:
+        raise ValueError("O polinômio é identicamente zero (infinitas raízes)")
+
+    reais, complexas = [], []
+    for z in np.roots(coeficientes):
+        if abs(z.imag) <= TOLERANCIA_IMAGINARIA * max(1.0, abs(z)):
+            reais.append(_refinar(coeficientes, float(z.real)))
+        else:
+            complexas.append([float(z.real) + 0.0, float(z.imag) + 0.0])
+    complexas.sort()
+    return sorted(reais), complexas
+
+
+def _refinar(coeficientes, x):
+    """Alguns passos de Newton a partir do autovalor; só aceita passos que diminuem |p(x)|."""
+    p, dp = horner(coeficientes, x)
+    for _ in range(PASSOS_REFINAMENTO):
+        if dp == 0:
+            break
+        x_novo = x - p / dp
+        p_novo, dp_novo = horner(coeficientes, x_novo)
+        if abs(p_novo) >= abs(p):
+            break
+        x, p, dp = x_novo, p_novo, dp_novo
+    return x
@@ -0,0 +1,64 @@
+"""
+Progresso dos cálculos longos (x atual do Newton, largura do intervalo da
+bisseção, coluna da eliminação de Gauss...), usado pelos trabalhos assíncronos.
+
+Os métodos recebem um callback progresso(**dados); as tarefas passam emitir(),
+que entrega os dados a quem pediu o acompanhamento: pelo canal do processo de
+cálculo (ver executor.py) ou direto na mesma thread (executor sem processos).
+O mesmo canal leva os itens das tarefas em fluxo (transmitir).
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+INTERVALO_MINIMO = 0.05                                   # Segundos entre dois envios (limita o custo em laços rápidos)
+
+_canal = None                                             # Canal (Pipe) deste processo de cálculo para o servidor (definido por iniciar_processo)
+_local = threading.local()                                # Destino do progresso da tarefa em andamento nesta thread
+
+
+def iniciar_processo(canal):
+    """Inicialização de cada processo de cálculo: guarda o canal de envio da vaga."""
+    global _canal
+    _canal = canal
+
+
+@contextmanager
+def redirecionar(destino):
+    """Durante o bloco, emitir() nesta thread entrega os dados a destino(dados) (None = descarta)."""
+    anterior = getattr(_local, "destino", None)
+    _local.destino = destino
+    _local.ultimo = 0.0
+    try:
+        yield
+    finally:
+        _local.destino = anterior
+
+
+def executar_com_progresso(funcao, args):
+    """Roda funcao(*args) no processo de cálculo mandando o progresso pelo canal da vaga."""
+    with redirecionar(_canal.send):
+        return funcao(*args)
+
+
+def transmitir(funcao, args):
+    """
+    Roda o gerador funcao(*args) no processo de cálculo mandando cada item pelo
+    canal da vaga. O envio espera o servidor ler quando o buffer do canal
+    enche, então os itens não se acumulam na memória de nenhum dos processos.
+    """
+    for item in funcao(*args):
+        _canal.send(item)
+
+
+def emitir(**dados):
+    """Envia o progresso, no máximo uma vez a cada INTERVALO_MINIMO segundos."""
+    destino = getattr(_local, "destino", None)
+    if destino is None:                                   # Ninguém acompanhando: custo de uma consulta
+        return
+    agora = time.monotonic()
+    if agora - _local.ultimo < INTERVALO_MINIMO:
+        return
+    _local.ultimo = agora
+    destino(dados)
@@ -0,0 +1,131 @@
+"""
+Ponto de entrada do servidor para uso em produção (no lugar de app.run(debug=True)).
+
+Modos:
+  wsgi  Gunicorn com pré-fork: 'workers' processos, cada um com 'threads' threads
+  asgi  Uvicorn com o app Flask adaptado para ASGI (asgiref): muitas conexões
+        abertas ao mesmo tempo, como os fluxos /jobs/<id>/eventos
+  dev   servidor de desenvolvimento do Flask (recarrega sozinho, modo debug)
+
+Cada opção pode vir da linha de comando ou de uma variável de ambiente:
+  python servidor.py --modo wsgi --workers 2 --threads 16
+  SERVIDOR_MODO=asgi SERVIDOR_PORTA=8000 python servidor.py
+
+Os cálculos rodam nos processos de cálculo de cada worker (executor.py); por
+padrão os núcleos são divididos entre os workers (SOLVER_PROCESSOS).
+Os trabalhos assíncronos (/jobs) ficam na memória do worker que os recebeu:
+com mais de um worker, a consulta de um trabalho pode chegar a outro processo
+e responder 404. Para usar /jobs, mantenha 1 worker e aumente as threads.
+"""
+
+import argparse
+import os
+
+MODOS = ("wsgi", "asgi", "dev")
+
+
+def ler_argumentos(argv=None):
+    """Opções da linha de comando; os padrões vêm das variáveis de ambiente."""
+    env = os.environ.get
+    parser = argparse.ArgumentParser(description="Servidor da API de métodos numéricos")
+    parser.add_argument("--modo", choices=MODOS, default=env("SERVIDOR_MODO", "wsgi"))
+    parser.add_argument("--host", default=env("SERVIDOR_HOST", "0.0.0.0"))
+    parser.add_argument("--porta", type=int, default=int(env("SERVIDOR_PORTA", 5000)))
+    parser.add_argument("--workers", type=int, default=int(env("SERVIDOR_WORKERS", 1)),
+                        help="processos do servidor (pré-fork)")
+    parser.add_argument("--threads", type=int, default=int(env("SERVIDOR_THREADS", 16)),
+                        help="threads por worker (modo wsgi)")
+    parser.add_argument("--keep-alive", type=int, default=int(env("SERVIDOR_KEEPALIVE", 5)),
+                        help="segundos mantendo a conexão aberta entre requisições")
+    parser.add_argument("--max-requisicao", type=int,
+                        default=int(env("MAX_TAMANHO_REQUISICAO", 256 * 1024 * 1024)),
+                        help="tamanho máximo do corpo da requisição, em bytes")
+    parser.add_argument("--timeout", type=int, default=int(env("SERVIDOR_TIMEOUT", 120)),
+                        help="segundos sem resposta até o worker ser reiniciado (modo wsgi)")
+    opcoes = parser.parse_args(argv)
+    if opcoes.workers < 1 or opcoes.threads < 1:
+        parser.error("workers e threads precisam ser pelo menos 1")
+    return opcoes
+
+
+def preparar_ambiente(opcoes):
+    """
+    Configurações lidas pelo backend ao ser importado (herdadas pelos workers).
+    """
+    os.environ["MAX_TAMANHO_REQUISICAO"] = str(opcoes.max_requisicao)
+    # Divide os núcleos entre os workers, para não criar workers x núcleos processos de cálculo
+    os.environ.setdefault("SOLVER_PROCESSOS", str(max(1, (os.cpu_count() or 1) // opcoes.workers)))
+
+
+def encerrar_executor(servidor, worker):
+    """Gancho do Gunicorn: o worker sai sem rodar o atexit, então termina os processos de cálculo aqui."""
+    from backend import executor
+    executor.encerrar()
+
+
+def servir_wsgi(opcoes):
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        raise RuntimeError("O modo 'wsgi' precisa do Gunicorn instalado (pip install gunicorn)") from None
+
+    configuracao = {
+        "bind": f"{opcoes.host}:{opcoes.porta}",
+        "workers": opcoes.workers,
+        "worker_class": "gthread",                        # Threads: a requisição só espera o processo de cálculo
+        "threads": opcoes.threads,
+        "keepalive": opcoes.keep_alive,
+        "timeout": opcoes.timeout,
+        "accesslog": "-",
+        "worker_exit": encerrar_executor,
+    }
+
+    class Aplicacao(BaseApplication):
+        def load_config(self):
+            for chave, valor in configuracao.items():
+                self.cfg.set(chave, valor)
+
+        def load(self):
+            from backend import app                       # Importado em cada worker, depois do fork
+            return app
+
+    Aplicacao().run()
+
+
+def criar_app_asgi():
+    """Fábrica usada pelo Uvicorn: o app Flask (WSGI) adaptado para ASGI."""
+    from asgiref.wsgi import WsgiToAsgi
+    from backend import app
+    return WsgiToAsgi(app)
+
+
+def servir_asgi(opcoes):
+    try:
+        import asgiref.wsgi                               # Verifica a instalação antes de subir os workers
+        import uvicorn
+    except ImportError:
+        raise RuntimeError("O modo 'asgi' precisa do Uvicorn e do asgiref (pip install uvicorn asgiref)") from None
+
+    uvicorn.run(
+        "servidor:criar_app_asgi",
+        factory=True,
+        host=opcoes.host,
+        port=opcoes.porta,
+        workers=opcoes.workers,
+        timeout_keep_alive=opcoes.keep_alive,
+    )
+
+
+def servir_dev(opcoes):
+    from backend import app
+    app.run(host=opcoes.host, port=opcoes.porta, debug=True, threaded=True)
+
+
+def main(argv=None):
+    opcoes = ler_argumentos(argv)
+    preparar_ambiente(opcoes)
+    {"wsgi": servir_wsgi, "asgi": servir_asgi, "dev": servir_dev}[opcoes.modo](opcoes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+Sistemas lineares esparsos e em banda (a maior parte dos coeficientes é zero).
+A matriz nunca é montada de forma densa:
+  - tridiagonal  → algoritmo de Thomas, O(n)
+  - banda        → eliminação de Gauss restrita à banda, O(n·p·q)
+  - esparsa geral (COO/CSR) → eliminação esparsa do SciPy (opcional)
+"""
+# Usado pela rota /gauss quando "formato" não é "densa".
+
+import warnings                                           # Silencia o aviso do SciPy para matriz singular (tratada pelo resultado)
+
+import numpy as np
+
+try:
+    from scipy.sparse import csr_matrix                   # Opcional: só para matrizes esparsas sem estrutura de banda
+    from scipy.sparse.linalg import spsolve
+except ImportError:
+    csr_matrix = spsolve = None
+
+FORMATOS = ("densa", "coo", "csr", "tridiagonal", "banda")  # Formatos aceitos pela rota /gauss
+LARGURA_MAX_BANDA = 64                                    # Acima disso, a eliminação em banda perde para a esparsa geral
+MAX_ELEMENTOS_BANDA = 2_000_000                           # n·(p+q+1) da faixa (16 MB); acima disso, a eliminação em banda (laço Python n·p) não é usada
+MAX_INCOGNITAS_DENSA = 2000                               # Sem SciPy: até aqui um pivô nulo é resolvido montando a matriz densa
+CAMPOS_FORMATO = {                                        # Chaves da requisição usadas por cada formato (ver resolver_sistema_esparso)
+    "coo": ("n", "linhas", "colunas", "valores", "b"),
+    "csr": ("n", "indptr", "indices", "valores", "b"),
+    "tridiagonal": ("inferior", "diagonal", "superior", "b"),
+    "banda": ("diagonais", "deslocamentos", "b"),
+}
+
+
+def thomas(inferior, diagonal, superior, d):
+    """
+    Algoritmo de Thomas (eliminação de Gauss para matrizes tridiagonais).
+
+    Parâmetros:
+    inferior: n-1 elementos abaixo da diagonal (a_i,i-1)
+    diagonal: n elementos da diagonal (a_i,i)
+    superior: n-1 elementos acima da diagonal (a_i,i+1)
+    d: lado direito (n elementos)
+
+    Retorna:
+    solucao (array), ou None se algum pivô for quase zero
+    (sem pivoteamento: indicado para matrizes diagonalmente dominantes ou SPD)
+    """
+    n = len(diagonal)
+    c = np.zeros(n)                                       # Coeficientes superiores modificados
+    g = np.zeros(n)                                       # Lado direito modificado
+    pivo = diagonal[0]
+    if abs(pivo) < 1e-10:
+        return None
+    c[0] = superior[0] / pivo if n > 1 else 0.0
+    g[0] = d[0] / pivo
+    for i in range(1, n):                                 # Eliminação progressiva (um elemento por linha)
+        pivo = diagonal[i] - inferior[i - 1] * c[i - 1]
+        if abs(pivo) < 1e-10:
+            return None
+        c[i] = superior[i] / pivo if i < n - 1 else 0.0
+        g[i] = (d[i] - inferior[i - 1] * g[i - 1]) / pivo
+
+    x = g                                                 # Retrosubstituição no próprio vetor
+    for i in range(n - 2, -1, -1):
+        x[i] -= c[i] * x[i + 1]
+    return x
+
+
+def resolver_banda(faixa, p, q, d):
+    """
+    Eliminação de Gauss (sem pivoteamento) para matriz em banda.
+
+    Parâmetros:
+    faixa: array n x (p+q+1) com faixa[i, k] = a_i,(i-p+k)
+    p, q: número de diagonais abaixo e acima da principal
+    d: lado direito
+
+    Retorna:
+    solucao (array), ou None se algum pivô for quase zero
+    """
+    faixa = np.array(faixa, dtype=float)                  # Cópias: a eliminação é feita no lugar
+    d = np.array(d, dtype=float)
+    n = faixa.shape[0]
+
+    for i in range(n):
+        pivo = faixa[i, p]                                # Elemento da diagonal na linha i
+        if abs(pivo) < 1e-10:
+            return None
+        for r in range(1, min(p, n - 1 - i) + 1):         # Só as p linhas abaixo têm elementos na coluna i
+            fator = faixa[i + r, p - r] / pivo
+            if fator != 0.0:
+                faixa[i + r, p - r:p - r + q + 1] -= fator * faixa[i, p:p + q + 1]  # L_(i+r) = L_(i+r) - fator * L_i, só dentro da banda
+                d[i + r] -= fator * d[i]
+
+    x = np.zeros(n)
+    for i in range(n - 1, -1, -1):                        # Retrosubstituição com as q diagonais de cima
+        k = min(q, n - 1 - i)
+        x[i] = (d[i] - faixa[i, p + 1:p + 1 + k] @ x[i + 1:i + 1 + k]) / faixa[i, p]
+    return x
+
+
+def triplas_de_csr(n, indptr, indices, valores):
+    """
+    Converte o formato CSR (indptr, indices, valores) em triplas COO (linhas, colunas, valores).
+    """
+    indptr = np.asarray(indptr, dtype=np.int64)
+    linhas = np.repeat(np.arange(n), np.diff(indptr))     # Linha de cada valor armazenado
+    return linhas, np.asarray(indices, dtype=np.int64), np.asarray(valores, dtype=float)
+
+
+def triplas_de_diagonais(n, diagonais, deslocamentos):
+    """
+    Converte uma lista de diagonais em triplas COO.
+    deslocamentos[k] = 0 é a diagonal principal, -1 a de baixo, +1 a de cima etc.;
+    a diagonal com deslocamento s tem n - |s| elementos.
+    """
+    if len(deslocamentos) != len(diagonais):              # zip cortaria as sobras em silêncio (outra matriz)
+        raise ValueError(f"São {len(diagonais)} diagonais para {len(deslocamentos)} deslocamentos: "
+                         "informe um deslocamento por diagonal")
+    linhas, colunas, valores = [], [], []
+    for s, diagonal in zip(deslocamentos, diagonais):
+        s = int(s)
+        tamanho = n - abs(s)
+        if len(diagonal) != tamanho:
+            raise ValueError(f"A diagonal {s} precisa ter {tamanho} elementos")
+        i = np.arange(tamanho) + max(-s, 0)               # Linhas da diagonal s
+        linhas.append(i)
+        colunas.append(i + s)
+        valores.append(np.asarray(diagonal, dtype=float))
+    return np.concatenate(linhas), np.concatenate(colunas), np.concatenate(valores)
+
+
+def verificar_solucao_esparsa(n, linhas, colunas, valores, b, solucao):
+    """
+    Resíduos |A·x - b| de cada equação usando só os elementos não nulos
+    (produto matriz-vetor esparso, O(número de não nulos)).
+    """
+    x = np.asarray(solucao, dtype=float)
+    produto = np.bincount(linhas, weights=valores * x[colunas], minlength=n)  # Soma a_ij * x_j por linha
+    return np.abs(produto - np.asarray(b, dtype=float)).tolist()
+
+
+def resolver_triplas(n, linhas, colunas, valores, b):
+    """
+    Resolve A·x = b com A dada por triplas COO, escolhendo o método pela estrutura:
+    Thomas se for tridiagonal, eliminação em banda se a banda for estreita
+    (e a faixa n·(p+q+1) couber em MAX_ELEMENTOS_BANDA),
+    eliminação esparsa geral (SciPy) nos demais casos ou quando aparece um pivô
+    nulo. Sem SciPy, sistemas pequenos (até MAX_INCOGNITAS_DENSA) usam a
+    eliminação densa com pivoteamento; os maiores lançam RuntimeError.
+
+    Retorna:
+    solucao (array) ou None, e o nome do método usado
+    """
+    linhas = np.asarray(linhas, dtype=np.int64)
+    colunas = np.asarray(colunas, dtype=np.int64)
+    valores = np.asarray(valores, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if len(b) != n:
+        raise ValueError(f"O lado direito 'b' precisa ter {n} elementos")
+    if linhas.size and (min(linhas.min(), colunas.min()) < 0 or max(linhas.max(), colunas.max()) >= n):
+        raise ValueError(f"Índices fora da matriz {n} x {n}")
+
+    distancia = colunas - linhas
+    p = int(max(0, -distancia.min())) if distancia.size else 0  # Diagonais abaixo da principal
+    q = int(max(0, distancia.max())) if distancia.size else 0   # Diagonais acima da principal
+
+    solucao, metodo = None, None
+    if p <= 1 and q <= 1:
+        faixa = np.zeros((n, 3))                          # Colunas: inferior, diagonal, superior
+        np.add.at(faixa, (linhas, distancia + 1), valores)  # Soma valores repetidos, como no formato COO
+        solucao = thomas(faixa[1:, 0], faixa[:, 1], faixa[:-1, 2], b)
+        metodo = "thomas"
+    elif p + q + 1 <= LARGURA_MAX_BANDA and n * (p + q + 1) <= MAX_ELEMENTOS_BANDA:
+        faixa = np.zeros((n, p + q + 1))
+        np.add.at(faixa, (linhas, distancia + p), valores)
+        solucao = resolver_banda(faixa, p, q, b)
+        metodo = "banda"
+
+    if solucao is None and spsolve is not None:
+        # Estrutura geral, ou pivô nulo sem pivoteamento: eliminação esparsa com pivoteamento
+        A = csr_matrix((valores, (linhas, colunas)), shape=(n, n))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            solucao = spsolve(A.tocsc(), b)
+        metodo = "esparsa"
+        if not np.all(np.isfinite(solucao)):
+            solucao = None
+    elif solucao is None and n <= MAX_INCOGNITAS_DENSA:
+        # Sem SciPy: Thomas e banda não pivoteiam, então um pivô nulo não quer dizer matriz singular
+        A = np.zeros((n, n))
+        np.add.at(A, (linhas, colunas), valores)
+        try:
+            solucao = np.linalg.solve(A, b)                # LU com pivoteamento parcial (LAPACK)
+        except np.linalg.LinAlgError:
+            solucao = None                                # Singular de fato
+        metodo = "densa"
+    elif solucao is None:
+        raise RuntimeError("Matrizes esparsas sem banda estreita, com faixa grande demais ou com pivô nulo "
+                           "precisam do SciPy (pip install scipy)")
+
+    return solucao, metodo
+
+
+def ordem_sistema(formato, dados):
+    """
+    Número de incógnitas n do sistema no formato pedido, sem montar nada
+    (para o chamador limitar o tamanho antes de resolver).
+    ValueError se o formato for desconhecido ou se 'b' não tiver n elementos.
+    """
+    if formato in ("coo", "csr"):
+        n = int(dados["n"])
+    elif formato == "tridiagonal":
+        n = len(dados["diagonal"])
+    elif formato == "banda":
+        n = len(dados["b"])
+    else:
+        raise ValueError(f"Formato desconhecido: {formato}. Use um de: {', '.join(FORMATOS)}")
+    if len(dados["b"]) != n:
+        raise ValueError(f"O lado direito 'b' precisa ter {n} elementos")
+    return n
+
+
+def resolver_sistema_esparso(formato, dados):
+    """
+    Lê o sistema no formato pedido, resolve e calcula os resíduos.
+
+    Formatos (chaves de 'dados'):
+    "coo":         n, linhas, colunas, valores, b
+    "csr":         n, indptr, indices, valores, b
+    "tridiagonal": inferior, diagonal, superior, b
+    "banda":       diagonais, deslocamentos, b
+
+    Retorna:
+    solucao (lista ou None), mensagem, residuos (ou None) e o método usado
+    """
+    b = dados["b"]
+    n = ordem_sistema(formato, dados)
+    if formato == "coo":
+        linhas, colunas, valores = (np.asarray(dados["linhas"], dtype=np.int64),
+                                    np.asarray(dados["colunas"], dtype=np.int64),
+                                    np.asarray(dados["valores"], dtype=float))
+    elif formato == "csr":
+        linhas, colunas, valores = triplas_de_csr(n, dados["indptr"], dados["indices"], dados["valores"])
+    elif formato == "tridiagonal":
+        linhas, colunas, valores = triplas_de_diagonais(
+            n, [dados["inferior"], dados["diagonal"], dados["superior"]], [-1, 0, 1])
+    else:
+        linhas, colunas, valores = triplas_de_diagonais(n, dados["diagonais"], dados["deslocamentos"])
+
+    if not (len(linhas) == len(colunas) == len(valores)):
+        raise ValueError("linhas, colunas e valores precisam ter o mesmo tamanho")
+
+    solucao, metodo = resolver_triplas(n, linhas, colunas, valores, b)
+    if solucao is None:
+        return None, "Sistema singular - sem solução única", None, metodo
+    residuos = verificar_solucao_esparsa(n, linhas, colunas, valores, b, solucao)
+    return solucao.tolist(), "Sistema resolvido com sucesso", residuos, metodo
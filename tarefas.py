@@ -0,0 +1,396 @@
+"""
+Tarefas executadas nos processos de cálculo (ver executor.py).
+Recebem só dados simples (textos, números, listas, arrays), porque são
+enviadas a outro processo: a compilação da função digitada pelo usuário
+também acontece lá, já que avaliar uma expressão pode ser tão caro
+quanto o próprio método.
+"""
+# As rotas do backend só leem o JSON, chamam uma destas funções pelo executor e montam a resposta.
+
+import base64
+import json
+
+import numpy as np
+
+from bissecao import resolver_intervalo
+from eliminacao_gauss import eliminacao_gauss, eliminacao_gauss_em_etapas, verificar_solucao
+from expressao import (coeficientes_polinomio, compilar_derivada, compilar_funcao, compilar_jacobiana,
+                       compilar_sistema, normalizar_expressao)
+from fatoracao_lu import fatorar_lu, resolver_lu
+from historico import Historico
+from limites import Orcamento
+from metricas import anotar, etapa                        # Etapas e contagens da tarefa (ver metricas.medir)
+from lote import bissecao_lote, newton_lote, varrer_raizes
+from metodos_iterativos import resolver_iterativo
+from newton import newton_hibrido, newton_raphson
+from newton_sistema import newton_sistema
+from polinomio import raizes
+from progresso import emitir                              # Progresso para os trabalhos assíncronos (sem efeito nas rotas síncronas)
+
+
+class ErroFuncao(ValueError):
+    """A expressão digitada não compila ou não pode ser avaliada."""
+
+
+def preparar_funcao(funcao_str, vetorizada=False):
+    """
+    Compila a função e faz um teste rápido em x=1.
+    Erros de sintaxe/avaliação viram ErroFuncao (respondidos como "Erro ao interpretar a função").
+    """
+    try:
+        with etapa("compilar"):
+            f = compilar_funcao(funcao_str, vetorizada)
+        f(1.0)
+    except Exception as e:
+        raise ErroFuncao(str(e)) from None
+    return f
+
+
+METODOS_NEWTON = ("newton", "hibrido")
+
+
+def newton(funcao_str, x0, tolerancia, max_iter, derivada="automatica", max_avaliacoes=None, tempo_maximo=None,
+           historico="completo", historico_n=None, metodo="newton", a=None, b=None):
+    """
+    Newton-Raphson com derivada automática (números duais) ou numérica,
+    limitado a max_avaliacoes avaliações de f e tempo_maximo segundos.
+    historico, historico_n: modo e n do histórico dos x (ver historico.Historico).
+    metodo: "newton" ou "hibrido" (Newton protegido por bisseção no intervalo
+            [a, b], ver newton.newton_hibrido; x0 é opcional)
+
+    Retorna:
+    (resultado do método com o número de avaliações, derivada efetivamente usada)
+    """
+    if metodo not in METODOS_NEWTON:
+        raise ValueError(f"Método desconhecido: {metodo}. Use um de: {', '.join(METODOS_NEWTON)}")
+    registro = Historico(historico, historico_n)
+    f = preparar_funcao(funcao_str)
+    f_e_derivada = None                                   # Sem derivada automática, o Newton usa derivada_numerica
+    if derivada == "automatica":
+        try:
+            with etapa("compilar"):
+                f_e_derivada = compilar_derivada(funcao_str)
+            f_e_derivada(x0 if x0 is not None else (a + b) / 2)  # Funções de math sem versão dual lançam TypeError
+        except (TypeError, ValueError):                   # ValueError: regra dual fora do domínio (ex: ln da base negativa em (-2)**x)
+            f_e_derivada = None                           # Fallback: derivada numérica (diferença central)
+            derivada = "numerica"
+        except Exception:
+            pass                                          # Erros de domínio em x0 aparecem (como antes) dentro do Newton
+    orcamento = Orcamento(max_avaliacoes, tempo_maximo)   # Conta só as avaliações feitas pelo método
+    f = orcamento.limitar(f)
+    if f_e_derivada is not None:
+        f_e_derivada = orcamento.limitar(f_e_derivada)
+    with etapa("metodo"):
+        if metodo == "hibrido":
+            resultado = newton_hibrido(f, a, b, tolerancia, max_iter, f_e_derivada, emitir, registro, x0)
+        else:
+            resultado = newton_raphson(f, x0, tolerancia, max_iter, f_e_derivada, emitir, registro)
+    resultado["avaliacoes"] = orcamento.avaliacoes
+    anotar("avaliacoes", orcamento.avaliacoes)
+    anotar("iteracoes", resultado["iteracoes"])
+    return resultado, derivada
+
+
+def variaveis_sistema(n):
+    """Nomes das variáveis de um sistema com n equações: x1, x2, ..., xn."""
+    return tuple(f"x{i}" for i in range(1, n + 1))
+
+
+def sistema(funcoes, x0, tolerancia, max_iter, jacobiana="automatica", broyden=False, motor="python",
+            max_avaliacoes=None, tempo_maximo=None, historico="nenhum", historico_n=None):
+    """
+    Newton para o sistema F(x) = 0 (ver newton_sistema.newton_sistema), com as
+    expressões em x1..xn, jacobiana automática (com fallback para a numérica,
+    como em newton()) ou numérica, e os mesmos limites de avaliações e tempo
+    (cada avaliação de F conta uma vez).
+
+    Retorna:
+    (resultado de newton_sistema com o número de avaliações, jacobiana efetivamente usada)
+    """
+    variaveis = variaveis_sistema(len(funcoes))
+    registro = Historico(historico, historico_n, campos=len(variaveis))
+    try:
+        with etapa("compilar"):
+            F = compilar_sistema(funcoes, variaveis)
+        F(x0)
+    except Exception as e:
+        raise ErroFuncao(str(e)) from None
+    F_e_jacobiana = None
+    if jacobiana == "automatica":
+        try:
+            with etapa("compilar"):
+                F_e_jacobiana = compilar_jacobiana(funcoes, variaveis)
+            F_e_jacobiana(x0)
+        except (TypeError, ValueError):                   # Sem versão dual, ou regra dual fora do domínio (F(x0) já funcionou)
+            F_e_jacobiana = None                          # Fallback: diferenças centrais
+            jacobiana = "numerica"
+    orcamento = Orcamento(max_avaliacoes, tempo_maximo)
+    F = orcamento.limitar(F)
+    if F_e_jacobiana is not None:
+        F_e_jacobiana = orcamento.limitar(F_e_jacobiana)
+    with etapa("metodo"):
+        resultado = newton_sistema(F, x0, tolerancia, max_iter, F_e_jacobiana, broyden, motor, emitir, registro)
+    resultado["avaliacoes"] = orcamento.avaliacoes
+    anotar("avaliacoes", orcamento.avaliacoes)
+    anotar("iteracoes", resultado["iteracoes"])
+    return resultado, jacobiana
+
+
+def intervalo(funcao_str, a, b, tolerancia, max_iter, metodo="bissecao", max_avaliacoes=None, tempo_maximo=None,
+              historico="nenhum", historico_n=None):
+    """
+    Bisseção, Brent, Illinois ou ITP (ver bissecao.resolver_intervalo).
+    historico, historico_n: modo e n do histórico de intervalos [a, b] (só bisseção).
+    """
+    registro = Historico(historico, historico_n, campos=2)
+    preparar_funcao(funcao_str)                           # Fica no cache do processo para o método
+    with etapa("metodo"):
+        resultado = resolver_intervalo(funcao_str, a, b, tolerancia, max_iter, metodo, emitir,
+                                       max_avaliacoes, tempo_maximo, registro)
+    anotar("avaliacoes", resultado["avaliacoes"])
+    return resultado
+
+
+def agrupar_por_funcao(itens):
+    """
+    Agrupa os índices dos itens pela expressão normalizada; itens da mesma função rodam juntos.
+    """
+    grupos = {}
+    for indice, item in enumerate(itens):
+        try:
+            chave = normalizar_expressao(item["funcao"])
+        except ValueError:
+            chave = item["funcao"]                        # Função que nem é texto: o erro aparece na compilação do grupo
+        grupos.setdefault(chave, []).append(indice)
+    return grupos
+
+
+def bissecao_em_lote(itens, tolerancia, max_iter):
+    """
+    Bisseção de vários itens {"funcao", "a", "b"}; os da mesma função numa iteração vetorizada.
+    Retorna a lista de resultados na ordem dos itens, sem os campos do item
+    (a rota junta cada item ao seu resultado: o resultado pode vir do cache).
+    """
+    resultados = [None] * len(itens)
+    for funcao_str, indices in agrupar_por_funcao(itens).items():
+        try:
+            with etapa("metodo"):
+                raizes, valido, iteracoes = bissecao_lote(
+                    funcao_str,
+                    [itens[i]["a"] for i in indices],
+                    [itens[i]["b"] for i in indices],
+                    tolerancia, max_iter, emitir,
+                )
+        except Exception as e:
+            for i in indices:
+                resultados[i] = {"erro": f"Erro ao interpretar a função: {e}"}
+            continue
+        for k, i in enumerate(indices):
+            if valido[k]:
+                resultados[i] = {"raiz": float(raizes[k]), "iteracoes": int(iteracoes[k])}
+            else:
+                resultados[i] = {
+                    "erro": "Não foi possível encontrar raiz nesse intervalo. "
+                            "Verifique se f(a) e f(b) têm sinais opostos.",
+                }
+    return resultados
+
+
+def newton_em_lote(itens, tolerancia, max_iter):
+    """
+    Newton-Raphson de vários itens {"funcao", "x0"}; os da mesma função atualizados como arrays.
+    Retorna a lista de resultados na ordem dos itens, sem os campos do item (ver bissecao_em_lote).
+    """
+    resultados = [None] * len(itens)
+    for funcao_str, indices in agrupar_por_funcao(itens).items():
+        try:
+            with etapa("metodo"):
+                raizes, iteracoes, convergiu, derivada_nula, nao_finito = newton_lote(
+                    funcao_str, [itens[i]["x0"] for i in indices], tolerancia, max_iter, emitir
+                )
+        except Exception as e:
+            for i in indices:
+                resultados[i] = {"erro": f"Erro ao interpretar a função: {e}"}
+            continue
+        for k, i in enumerate(indices):
+            if nao_finito[k] or not np.isfinite(raizes[k]):  # nan/inf não é JSON válido: responde como erro, igual à rota /newton
+                resultados[i] = {
+                    "erro": "f(x) ou f'(x) não é finito: o método saiu do domínio da função.",
+                }
+                continue
+            resultado = {
+                "raiz": float(raizes[k]),
+                "iteracoes": int(iteracoes[k]),
+                "convergiu": bool(convergiu[k]),
+            }
+            if derivada_nula[k]:
+                resultado["mensagem"] = "Derivada muito próxima de zero"
+            elif not convergiu[k]:
+                resultado["mensagem"] = "Não convergiu no número máximo de iterações"
+            resultados[i] = resultado
+    return resultados
+
+
+def varredura(funcao_str, a, b, pontos, tolerancia, max_iter):
+    """Todas as raízes em [a, b] (ver lote.varrer_raizes)."""
+    try:
+        with etapa("compilar"):
+            compilar_funcao(funcao_str)                   # Valida a expressão antes de montar a grade
+    except Exception as e:
+        raise ErroFuncao(str(e)) from None
+    with etapa("metodo"):
+        return varrer_raizes(funcao_str, a, b, pontos, tolerancia, max_iter, emitir)
+
+
+def raizes_polinomio(funcao_str):
+    """
+    Todas as raízes de f(x) polinomial (ver polinomio.raizes).
+    Lança ErroFuncao se a expressão for inválida e ValueError se não for um polinômio em x.
+
+    Retorna:
+    {"coeficientes" (grau mais alto primeiro), "grau", "raizes" (reais), "raizes_complexas"}
+    """
+    try:
+        with etapa("compilar"):
+            coeficientes = coeficientes_polinomio(funcao_str)
+    except Exception as e:
+        raise ErroFuncao(str(e)) from None
+    if coeficientes is None:
+        raise ValueError("A função não é um polinômio em x (use só +, -, *, / por constante e potências inteiras de x)")
+    with etapa("metodo"):
+        reais, complexas = raizes(coeficientes)
+    return {
+        "coeficientes": list(coeficientes),
+        "grau": len(coeficientes) - 1,
+        "raizes": reais,
+        "raizes_complexas": complexas,
+    }
+
+
+def gauss(matriz, usar_pivoteamento, motor, registrar_etapas, tamanho_bloco=64, threads=None):
+    """
+    Eliminação de Gauss na matriz aumentada, com os resíduos da solução.
+
+    Retorna:
+    (solucao, etapas, mensagem, residuos)
+    """
+    with etapa("metodo"):
+        solucao, etapas, mensagem = eliminacao_gauss(matriz, usar_pivoteamento, motor, registrar_etapas,
+                                                     tamanho_bloco, threads, emitir)
+    with etapa("residuos"):
+        residuos = verificar_solucao(matriz, solucao, motor) if solucao is not None else None
+    return solucao, etapas, mensagem, residuos
+
+
+CODIFICACOES_FLUXO = ("json", "base64")
+
+
+def _array_compacto(valores):
+    """Vetor/matriz numérica como float64 little-endian em base64 (bem menor que o texto JSON)."""
+    dados = np.ascontiguousarray(valores, dtype="<f8")
+    return {"dtype": "float64", "forma": list(dados.shape), "base64": base64.b64encode(dados.tobytes()).decode("ascii")}
+
+
+def _codificar_etapa(etapa, codificacao):
+    if codificacao == "json":
+        return etapa
+    if isinstance(etapa, dict):                           # Delta: só os fatores da coluna são um vetor
+        return {**etapa, "fatores": _array_compacto(etapa["fatores"])} if "fatores" in etapa else etapa
+    return _array_compacto(etapa)
+
+
+def _numero_json(valor):
+    if isinstance(valor, np.generic):                     # Índices e valores vindos do motor numpy
+        return valor.item()
+    raise TypeError(f"Valor não serializável: {type(valor).__name__}")
+
+
+def linha_ndjson(dados):
+    """Uma linha NDJSON (bytes) do fluxo."""
+    return (json.dumps(dados, default=_numero_json) + "\n").encode()
+
+
+def gauss_em_fluxo(matriz, usar_pivoteamento, motor, registrar_etapas, tamanho_bloco=64, threads=None,
+                   codificacao="json"):
+    """
+    Versão em fluxo de gauss(): gerador de linhas NDJSON (bytes), uma etapa por
+    linha, entregues assim que calculadas. Nenhuma lista de etapas é montada:
+    a memória fica proporcional a uma matriz, e não ao histórico inteiro.
+
+    codificacao: "json" (números em texto) ou "base64" (matrizes, solução,
+                 resíduos e fatores como {"dtype", "forma", "base64"})
+
+    Linhas geradas, pelo campo "tipo":
+    "etapa"     {"indice", "etapa"}
+    "solucao"   {"solucao", "mensagem"}
+    "residuos"  {"residuos"} (None se não houve solução)
+    "fim"       {"etapas": total de etapas}
+    """
+    if codificacao not in CODIFICACOES_FLUXO:
+        raise ValueError(f"Codificação desconhecida: {codificacao}. Use uma de: {', '.join(CODIFICACOES_FLUXO)}")
+    compacto = codificacao == "base64"
+    indice = 0
+    for item in eliminacao_gauss_em_etapas(matriz, usar_pivoteamento, motor, registrar_etapas,
+                                           tamanho_bloco, threads, emitir):
+        if item[0] == "etapa":
+            yield linha_ndjson({"tipo": "etapa", "indice": indice, "etapa": _codificar_etapa(item[1], codificacao)})
+            indice += 1
+            continue
+        _, solucao, mensagem = item
+    yield linha_ndjson({
+        "tipo": "solucao",
+        "solucao": _array_compacto(solucao) if compacto and solucao is not None else solucao,
+        "mensagem": mensagem,
+    })
+    residuos = verificar_solucao(matriz, solucao, motor) if solucao is not None else None
+    yield linha_ndjson({
+        "tipo": "residuos",
+        "residuos": _array_compacto(residuos) if compacto and residuos is not None else residuos,
+    })
+    yield linha_ndjson({"tipo": "fim", "etapas": indice})
+
+
+def sistema_lu(A, fatoracao, B, usar_pivoteamento):
+    """
+    Resolve A·X = B (uma coluna por lado direito) com a fatoração LU de A;
+    se fatoracao for None (não estava no cache), fatora aqui.
+
+    Retorna:
+    (fatoração nova para o cache ou None, soluções, resíduos |A·x - b|), com uma
+    lista por lado direito (colunas de B), ou (None, None, None) se A for singular
+    """
+    nova = None
+    if fatoracao is None:
+        with etapa("metodo"):
+            fatoracao = nova = fatorar_lu(A, usar_pivoteamento)
+        if fatoracao is None:
+            return None, None, None
+    with etapa("metodo"):
+        X = resolver_lu(fatoracao, B)                     # Substituições O(n²) para todos os b de uma vez
+    residuos = np.abs(A @ X - B)
+    return nova, X.T.tolist(), residuos.T.tolist()
+
+
+def iterativo(A, b, metodo, x0, tolerancia, max_iter, omega):
+    """
+    Método iterativo pedido; com metodo="auto", se nenhum tem convergência
+    garantida ou o escolhido não converge, usa a eliminação de Gauss com pivoteamento.
+
+    Retorna:
+    (nome do método usado, dicionário do resultado)
+    """
+    with etapa("metodo"):
+        metodo_usado, resultado = resolver_iterativo(A, b, metodo, x0, tolerancia, max_iter, omega)
+    if resultado is not None:
+        anotar("iteracoes", resultado["iteracoes"])
+    if resultado is None or (metodo == "auto" and not resultado["convergiu"]):
+        aumentada = np.column_stack([A, b])
+        with etapa("metodo"):
+            solucao, _, mensagem = eliminacao_gauss(aumentada, True, "numpy", "nenhuma")
+        metodo_usado = "gauss"
+        resultado = {
+            "solucao": solucao,
+            "mensagem": mensagem,
+            "residuos": verificar_solucao(aumentada, solucao, "numpy") if solucao is not None else None,
+        }
+    return metodo_usado, resultado
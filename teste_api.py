@@ -1,5 +1,6 @@
 import requests
 import json
+import time
 
 BASE_URL = "http://127.0.0.1:5000"
 
@@ -30,6 +31,38 @@ def testar_bissecao():
     print("Status:", resp.status_code)
     print(json.dumps(resp.json(), indent=2, ensure_ascii=False))
 
+def testar_bissecao_lote():
+    url = f"{BASE_URL}/bissecao/batch"
+    dados = {
+        "itens": [
+            {"funcao": "x**3 - x - 2", "a": 1, "b": 2},
+            {"funcao": "x**3 - x - 2", "a": 1.5, "b": 3},
+            {"funcao": "cos(x) - x", "a": 0, "b": 1}
+        ],
+        "tolerancia": 0.0001,
+        "max_iter": 50
+    }
+    resp = requests.post(url, json=dados)
+    print("\n=== BISSEÇÃO EM LOTE ===")
+    print("Status:", resp.status_code)
+    print(json.dumps(resp.json(), indent=2, ensure_ascii=False))
+
+def testar_newton_lote():
+    url = f"{BASE_URL}/newton/batch"
+    dados = {
+        "itens": [
+            {"funcao": "x**3 - x - 2", "x0": 1.5},
+            {"funcao": "x**3 - x - 2", "x0": 3},
+            {"funcao": "exp(-x) - x", "x0": 0}
+        ],
+        "tolerancia": 0.0001,
+        "max_iter": 20
+    }
+    resp = requests.post(url, json=dados)
+    print("\n=== NEWTON EM LOTE ===")
+    print("Status:", resp.status_code)
+    print(json.dumps(resp.json(), indent=2, ensure_ascii=False))
+
 def testar_gauss():
     url = f"{BASE_URL}/gauss"
     dados = {
@@ -44,7 +77,35 @@ def testar_gauss():
     print("Status:", resp.status_code)
     print(json.dumps(resp.json(), indent=2, ensure_ascii=False))
 
+def testar_trabalho():
+    url = f"{BASE_URL}/jobs"
+    dados = {
+        "rota": "/gauss",
+        "dados": {
+            "matriz": [
+                [2, 3, 8],
+                [1, -1, 0]
+            ],
+            "usar_pivoteamento": True
+        }
+    }
+    resp = requests.post(url, json=dados)
+    print("\n=== TRABALHO ASSÍNCRONO ===")
+    print("Status:", resp.status_code)
+    trabalho = resp.json()
+    print(json.dumps(trabalho, indent=2, ensure_ascii=False))
+
+    while True:   # consulta até terminar (o front usa o fluxo /jobs/<id>/eventos)
+        estado = requests.get(f"{BASE_URL}/jobs/{trabalho['id']}").json()
+        if estado["estado"] in ("concluido", "falhou"):
+            break
+        time.sleep(0.2)
+    print(json.dumps(estado, indent=2, ensure_ascii=False))
+
 if __name__ == "__main__":
     testar_newton()
     testar_bissecao()
     testar_gauss()
+    testar_bissecao_lote()
+    testar_newton_lote()
+    testar_trabalho()
@@ -0,0 +1,167 @@
+"""
+Trabalhos assíncronos: o cliente envia o pedido de uma rota de cálculo,
+recebe um id na hora e acompanha o andamento (consultando o estado ou pelo
+fluxo de eventos de progresso) enquanto threads do servidor executam a fila.
+"""
+# Usado pelas rotas /jobs do backend.
+
+import json
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from executor import ServidorOcupado                      # Fila cheia: mesma resposta 503 do executor
+
+ESTADOS_FINAIS = ("concluido", "falhou")
+
+
+class Trabalho:
+    """
+    Um pedido na fila: rota e JSON da requisição, estado, eventos de progresso e resposta.
+    Estados: "na_fila" → "executando" → "concluido" (resposta da rota, qualquer status) ou
+    "falhou" (erro inesperado ao executar).
+    """
+
+    def __init__(self, rota, dados):
+        self.id = uuid.uuid4().hex
+        self.rota = rota
+        self.dados = dados                                # JSON do pedido; liberado ao terminar (pode ser grande)
+        self.estado = "na_fila"
+        self.criado_em = time.time()
+        self.iniciado_em = None
+        self.concluido_em = None
+        self.status = None                                # Status HTTP que a rota devolveu
+        self.resposta = None                              # JSON que a rota devolveu
+        self.tamanho = 0                                  # Bytes da resposta serializada (limite da fila)
+        self.eventos = []                                 # Progresso na ordem em que chegou
+        self._condicao = threading.Condition()            # Acorda quem espera novos eventos (fluxo SSE)
+
+    def registrar_progresso(self, dados):
+        with self._condicao:
+            self.eventos.append(dados)
+            self._condicao.notify_all()
+
+    def iniciar(self):
+        with self._condicao:
+            self.estado = "executando"
+            self.iniciado_em = time.time()
+
+    def finalizar(self, resposta, status, estado="concluido", tamanho=0):
+        with self._condicao:
+            self.resposta = resposta
+            self.tamanho = tamanho
+            self.dados = None                             # A rota já rodou: o pedido não fica guardado até o trabalho expirar
+            self.status = status
+            self.estado = estado
+            self.concluido_em = time.time()
+            self._condicao.notify_all()
+
+    @property
+    def terminado(self):
+        return self.estado in ESTADOS_FINAIS
+
+    def eventos_desde(self, indice, espera):
+        """
+        Espera até 'espera' segundos por eventos a partir de 'indice'.
+        Retorna (novos eventos, terminado); terminado só é True depois de entregues todos os eventos.
+        """
+        with self._condicao:
+            if len(self.eventos) <= indice and not self.terminado:
+                self._condicao.wait(espera)
+            return self.eventos[indice:], self.terminado
+
+    def resumo(self):
+        """Estado atual para a rota GET /jobs/<id>."""
+        with self._condicao:
+            resumo = {
+                "id": self.id,
+                "rota": self.rota,
+                "estado": self.estado,
+                "criado_em": self.criado_em,
+                "iniciado_em": self.iniciado_em,
+                "concluido_em": self.concluido_em,
+                "progresso": self.eventos[-1] if self.eventos else None,  # Último progresso recebido
+            }
+            if self.terminado:
+                resumo["status"] = self.status
+                resumo["resultado"] = self.resposta
+            return resumo
+
+
+class FilaTrabalhos:
+    """
+    Fila em memória com 'threads' executores.
+
+    Parâmetros:
+    executar: função executar(trabalho) → (resposta, status), chamada numa thread da fila
+    threads: quantos trabalhos rodam ao mesmo tempo
+    max_na_fila: limite de trabalhos esperando (acima disso, ServidorOcupado)
+    max_guardados: quantos trabalhos ficam guardados; os terminados mais antigos são descartados
+    validade: segundos que um trabalho terminado fica disponível (None = não expira)
+    limite_bytes: memória máxima das respostas guardadas; acima disso, os terminados
+                  mais antigos são descartados (uma resposta maior que o limite vira erro)
+    """
+
+    def __init__(self, executar, threads=2, max_na_fila=100, max_guardados=1000, validade=3600,
+                 limite_bytes=256 * 1024 * 1024):
+        self._executar = executar
+        self._fila = queue.Queue(max_na_fila)
+        self._trabalhos = OrderedDict()                   # id -> Trabalho, do mais antigo para o mais novo
+        self._trava = threading.Lock()
+        self.max_guardados = max_guardados
+        self.validade = validade
+        self.limite_bytes = limite_bytes
+        self.bytes_usados = 0                             # Soma dos tamanhos das respostas guardadas
+        for _ in range(threads):
+            threading.Thread(target=self._executor, daemon=True).start()
+
+    def submeter(self, rota, dados):
+        trabalho = Trabalho(rota, dados)
+        with self._trava:
+            try:
+                self._fila.put_nowait(trabalho)
+            except queue.Full:
+                raise ServidorOcupado("A fila de trabalhos está cheia. Tente novamente.") from None
+            self._trabalhos[trabalho.id] = trabalho       # Ainda sob a trava: visível antes de qualquer consulta
+            self._descartar_antigos()
+        return trabalho
+
+    def obter(self, id_trabalho):
+        with self._trava:
+            self._descartar_antigos()                     # Um trabalho vencido não é mais devolvido
+            return self._trabalhos.get(id_trabalho)
+
+    def _descartar_antigos(self):
+        excesso = len(self._trabalhos) - self.max_guardados
+        vencidos_ate = None if self.validade is None else time.time() - self.validade
+        for id_trabalho, trabalho in list(self._trabalhos.items()):
+            if not trabalho.terminado:                    # Nunca descarta um trabalho na fila ou em execução
+                continue
+            vencido = vencidos_ate is not None and trabalho.concluido_em < vencidos_ate
+            if not (vencido or excesso > 0 or self.bytes_usados > self.limite_bytes):
+                continue                                  # Segue procurando vencidos (concluídos fora da ordem de envio)
+            del self._trabalhos[id_trabalho]
+            self.bytes_usados -= trabalho.tamanho
+            excesso -= 1
+
+    def _executor(self):
+        while True:
+            trabalho = self._fila.get()
+            trabalho.iniciar()
+            try:
+                resposta, status = self._executar(trabalho)
+                estado = "concluido"
+            except Exception as e:
+                resposta, status, estado = {"erro": f"Erro ao executar o trabalho: {e}"}, 500, "falhou"
+            tamanho = len(json.dumps(resposta).encode())
+            if tamanho > self.limite_bytes:               # Maior que o orçamento inteiro: não guarda o resultado
+                resposta = {"erro": f"Resultado com {tamanho} bytes, acima do limite de "
+                                    f"{self.limite_bytes} bytes guardados para trabalhos."}
+                status, estado = 507, "falhou"
+                tamanho = len(json.dumps(resposta).encode())
+            with self._trava:
+                trabalho.finalizar(resposta, status, estado, tamanho)
+                self.bytes_usados += tamanho
+                self._descartar_antigos()